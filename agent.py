@@ -3,56 +3,53 @@
 Landing Redesign Assistant - AI-агент для анализа лендингов.
 
 Точка входа приложения (CLI).
-Запуск: py -3.12 agent.py [url] [--role ui|content|all] [--output file.txt]
+Запуск: py -3.12 agent.py [url] [--role ui|content|all|instant] [--output file.txt]
+        py -3.12 agent.py --batch urls.txt --format ndjson
+        py -3.12 agent.py --replay output/.archive --role all
 """
 
+from __future__ import annotations
+
 import argparse
 import logging
+import os
 import sys
 import io
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 # Исправление кодировки для Windows консоли
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-from core.config import settings
+# Модули парсинга, LLM и вывода импортируются в функциях, которые их
+# используют: --help, меню и ошибки аргументов не ждут загрузки pydantic,
+# bs4, httpx и SDK GigaChat (замер: benchmarks/startup.py)
 from core.exceptions import LandingAssistantError, ScraperError, LLMError
-from core.models import AnalysisResult
+from core.registry import get_analyzer, get_analyzers, needs_llm, role_choices, role_keys
 from core.utils import validate_url
+from outputs import FILE_FORMATS
 
-from scrapers.html_parser import HTMLParser
-from llm_providers.gigachat_provider import GigaChatProvider
-from analyzers.ui_designer import UIDesignerAnalyzer
-from analyzers.content_manager import ContentManagerAnalyzer
-from outputs.console_output import ConsoleOutput
-from outputs.txt_output import TxtOutput
+if TYPE_CHECKING:
+    from core.models import AnalysisResult, PageContent
+    from core.result_store import ResultStore
+    from core.timing import StageTimings
+    from core.interfaces import BaseLLMProvider
+    from outputs.console_output import ConsoleOutput
+    from outputs.file_output import ResultStream
 
 
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO if settings.debug else logging.WARNING,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
-# Доступные модули анализа
-ANALYZERS = {
-    "ui": {
-        "class": UIDesignerAnalyzer,
-        "name": "UI-дизайнер",
-        "description": "Анализ дизайна и структуры",
-        "premium": False
-    },
-    "content": {
-        "class": ContentManagerAnalyzer,
-        "name": "Контент-менеджер", 
-        "description": "Анализ текстов и копирайтинга",
-        "premium": False
-    }
-}
+def setup_logging() -> None:
+    """Настроить логирование по настройкам приложения."""
+    from core.config import settings
+    
+    logging.basicConfig(
+        level=logging.INFO if settings.debug else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
 
 
 def show_banner() -> None:
@@ -74,31 +71,33 @@ def show_menu() -> str:
     """
     Показать интерактивное меню выбора роли.
     
+    Пункты строятся по реестру модулей, включая подключённые извне.
+    
     Returns:
-        Выбранная роль: 'ui', 'content' или 'all'
+        Выбранная роль: ключ модуля или 'all'
     """
+    analyzers = get_analyzers()
+    roles = role_choices()
+    
     print("\n[i] Доступные модули анализа:\n")
-    print("   [1] UI-дизайнер        (бесплатно)")
-    print("       Анализ дизайна, структуры и UX")
-    print()
-    print("   [2] Контент-менеджер   (бесплатно)")
-    print("       Анализ текстов, заголовков и CTA")
-    print()
-    print("   [3] Оба модуля         (бесплатно)")
-    print("       Комплексный анализ")
-    print()
+    for number, role in enumerate(roles, start=1):
+        if role in analyzers:
+            info = analyzers[role]
+            title, description = info.name, info.description
+            price = "премиум" if info.premium else "бесплатно"
+        else:
+            title, description, price = "Все модули", "Комплексный анализ", "бесплатно"
+        print(f"   [{number}] {title:<18} ({price})")
+        print(f"       {description}")
+        print()
     
+    numbers = "/".join(str(number) for number in range(1, len(roles) + 1))
     while True:
-        choice = input("   Ваш выбор [1/2/3]: ").strip()
+        choice = input(f"   Ваш выбор [{numbers}]: ").strip()
         
-        if choice == "1":
-            return "ui"
-        elif choice == "2":
-            return "content"
-        elif choice == "3":
-            return "all"
-        else:
-            print("   [!] Неверный выбор. Введите 1, 2 или 3.")
+        if choice.isdigit() and 1 <= int(choice) <= len(roles):
+            return roles[int(choice) - 1]
+        print(f"   [!] Неверный выбор. Введите номер от 1 до {len(roles)}.")
 
 
 def get_url_input() -> str:
@@ -130,26 +129,22 @@ def get_url_input() -> str:
 def run_analysis(
     url: str,
     role: str,
-    llm_provider: GigaChatProvider
+    llm_provider: Optional[BaseLLMProvider],
+    store: Optional[ResultStore] = None
 ) -> List[AnalysisResult]:
     """
     Запустить анализ лендинга.
     
     Args:
         url: URL для анализа
-        role: Роль ('ui', 'content' или 'all')
-        llm_provider: LLM-провайдер
+        role: Роль ('ui', 'content', 'all' или 'instant')
+        llm_provider: LLM-провайдер (не нужен для 'instant')
+        store: Хранилище результатов для инкрементального анализа
         
     Returns:
         Список результатов анализа
     """
-    results = []
-    
-    # Определяем какие анализаторы использовать
-    if role == "all":
-        analyzer_keys = ["ui", "content"]
-    else:
-        analyzer_keys = [role]
+    from scrapers.html_parser import HTMLParser
     
     # Загружаем страницу
     print("\n[...] Загрузка страницы...")
@@ -157,20 +152,276 @@ def run_analysis(
     content = scraper.fetch_and_parse(url)
     print(f"   [OK] Загружено: {len(content.text)} символов")
     
-    # Анализируем каждым модулем
-    for key in analyzer_keys:
-        analyzer_info = ANALYZERS[key]
-        print(f"\n[...] Анализ: {analyzer_info['name']}...")
-        
-        analyzer = analyzer_info["class"](llm_provider)
-        result = analyzer.analyze(content)
-        results.append(result)
+    return analyze_page(content, role, llm_provider, store)
+
+
+def analyze_page(
+    content: PageContent,
+    role: str,
+    llm_provider: Optional[BaseLLMProvider],
+    store: Optional[ResultStore] = None,
+    timings: Optional[StageTimings] = None
+) -> List[AnalysisResult]:
+    """
+    Проанализировать загруженную страницу выбранными модулями.
+    
+    Args:
+        content: Контент страницы
+        role: Роль ('ui', 'content', 'all' или 'instant')
+        llm_provider: LLM-провайдер (не нужен для 'instant')
+        store: Хранилище результатов для инкрементального анализа
+        timings: Статистика для замера этапов (рекомендации тогда
+            не выводятся по мере получения, чтобы не искажать замер)
         
-        print(f"   [OK] Получено {len(result.recommendations)} рекомендаций")
+    Returns:
+        Список результатов анализа
+    """
+    from contextlib import nullcontext
+    
+    from core.archive import page_scope
+    from core.config import settings
+    
+    def measure(stage: str):
+        return timings.measure(stage) if timings is not None else nullcontext()
+    
+    results = []
+    analyzers = get_analyzers()
+    known_issues = []
+    
+    if content.is_empty_shell:
+        print("   [!] Страница не содержит текста (SPA-каркас): анализ LLM пропущен")
+    
+    # Набор модулей определяет реестр: сначала модули без LLM (мгновенно),
+    # находки префильтров передаются в промпт LLM-модулей.
+    # Диалоги с LLM архивируются с URL страницы
+    with page_scope(content.url):
+        for key in role_keys(role):
+            info = analyzers[key]
+            analyzer = get_analyzer(key, llm_provider)
+    
+            if not info.requires_llm:
+                with measure(info.name):
+                    result = analyzer.analyze(content)
+                results.append(result)
+                if info.prefilter and settings.rules_prefilter:
+                    known_issues.extend(result.recommendations)
+                print(f"   [OK] {info.name}: {len(result.recommendations)} замечаний")
+                continue
+    
+            print(f"\n[...] Анализ: {info.name}...")
+            with measure(f"Анализ: {analyzer.name}"):
+                if store is not None:
+                    result = analyzer.analyze_incremental(
+                        content,
+                        store.get(content.url, analyzer.name),
+                        known_issues=known_issues or None,
+                        max_change_ratio=settings.incremental_max_change_ratio
+                    )
+                    store.put(result)
+                else:
+                    result = analyzer.analyze(
+                        content,
+                        known_issues=known_issues or None,
+                        on_recommendation=None if timings is not None else (
+                            lambda rec: print(f"   -> {rec.number}. {rec.title}")
+                        )
+                    )
+            results.append(result)
+            print(f"   [OK] Получено {len(result.recommendations)} рекомендаций")
     
     return results
 
 
+def run_crawl(
+    url: str,
+    role: str,
+    llm_provider: Optional[BaseLLMProvider],
+    console: ConsoleOutput,
+    store: Optional[ResultStore] = None,
+    max_pages: Optional[int] = None,
+    max_depth: Optional[int] = None,
+    stream: Optional[ResultStream] = None
+) -> List[AnalysisResult]:
+    """
+    Обойти страницы сайта и проанализировать каждую по мере загрузки.
+    
+    Args:
+        url: URL стартовой страницы
+        role: Роль ('ui', 'content', 'all' или 'instant')
+        llm_provider: LLM-провайдер (не нужен для 'instant')
+        console: Вывод результатов по каждой странице
+        store: Хранилище результатов для инкрементального анализа
+        max_pages: Максимальное количество страниц
+        max_depth: Максимальная глубина переходов
+        stream: Отчёт, в который результаты дописываются по каждой странице
+        
+    Returns:
+        Результаты анализа всех страниц
+    """
+    from scrapers.crawler import SiteCrawler
+    
+    crawler = SiteCrawler(max_pages=max_pages, max_depth=max_depth)
+    all_results = []
+    
+    print("\n[...] Обход страниц сайта...")
+    for number, content in enumerate(crawler.crawl(url), start=1):
+        print(f"\n[PAGE {number}] {content.url} ({len(content.text)} символов)")
+        results = analyze_page(content, role, llm_provider, store)
+        console.output_full(results)
+        if stream is not None:
+            for result in results:
+                stream.write(result)
+        all_results.extend(results)
+        
+    return all_results
+
+
+def read_url_list(path: str) -> List[str]:
+    """
+    Прочитать список URL для пакетного анализа.
+    
+    Один URL в строке; пустые строки и строки с # пропускаются.
+    
+    Args:
+        path: Путь к файлу со списком
+        
+    Returns:
+        Список корректных URL
+    """
+    urls = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            url = line.strip()
+            if not url or url.startswith("#"):
+                continue
+            if not url.startswith(("http://", "https://")):
+                url = "https://" + url
+            if validate_url(url):
+                urls.append(url)
+            else:
+                print(f"   [!] Пропущен некорректный URL: {url}")
+    return urls
+
+
+def run_batch(
+    urls: List[str],
+    role: str,
+    llm_provider: Optional[BaseLLMProvider],
+    console: ConsoleOutput,
+    stream: ResultStream,
+    store: Optional[ResultStore] = None
+) -> int:
+    """
+    Проанализировать список URL, дописывая результаты в отчёт по мере готовности.
+    
+    Страницы загружаются через FetchScheduler: параллельно, с очередью
+    и паузами для каждого хоста и повторами после 429/503. Анализ идёт
+    в порядке завершения загрузок. Ошибка загрузки или анализа одной
+    страницы не прерывает прогон. Результаты перебираются до конца, поэтому
+    планировщик закрывается без очереди; при прерывании (Ctrl+C) ещё
+    не загруженные URL отбрасываются и в отчёт не попадают.
+    
+    Args:
+        urls: Список URL
+        role: Роль ('ui', 'content', 'all' или 'instant')
+        llm_provider: LLM-провайдер (не нужен для 'instant')
+        console: Вывод результатов по каждой странице
+        stream: Отчёт для записи результатов
+        store: Хранилище результатов для инкрементального анализа
+        
+    Returns:
+        Количество URL, которые не удалось проанализировать
+    """
+    from scrapers.html_parser import HTMLParser
+    from scrapers.scheduler import FetchScheduler
+    
+    failed = 0
+    with FetchScheduler(HTMLParser().fetch_and_parse) as scheduler:
+        for url in urls:
+            scheduler.submit(url)
+            
+        for number, fetched in enumerate(scheduler.as_completed(), start=1):
+            print(f"\n[URL {number}/{len(urls)}] {fetched.url}")
+            try:
+                if fetched.error is not None:
+                    raise fetched.error
+                print(f"   [OK] Загружено: {len(fetched.value.text)} символов")
+                results = analyze_page(fetched.value, role, llm_provider, store)
+            except (ScraperError, LLMError) as e:
+                print(f"   [ERROR] {e}")
+                failed += 1
+                continue
+            console.output_full(results)
+            for result in results:
+                stream.write(result)
+    return failed
+
+
+def run_replay(
+    archive_dir: str,
+    role: str,
+    console: ConsoleOutput,
+    stream: Optional[ResultStream] = None,
+    url: Optional[str] = None
+) -> int:
+    """
+    Прогнать страницы из архива через весь конвейер без сети и LLM.
+    
+    HTML берётся из архива и разбирается текущим парсером, ответы LLM -
+    записанные (см. ReplayLLMProvider). В конце выводится время этапов.
+    
+    Args:
+        archive_dir: Директория архива
+        role: Роль ('ui', 'content', 'all' или 'instant')
+        console: Вывод результатов (только при воспроизведении одного URL)
+        stream: Отчёт для записи результатов
+        url: Воспроизвести только эту страницу
+        
+    Returns:
+        Количество страниц, которые не удалось проанализировать
+    """
+    import time
+    
+    from core.archive import PageArchive
+    from core.timing import StageTimings
+    from llm_providers.replay import ReplayLLMProvider
+    from scrapers.replay import ReplayScraper
+    
+    archive = PageArchive(archive_dir)
+    timings = StageTimings()
+    scraper = ReplayScraper(archive, timings)
+    llm_provider = ReplayLLMProvider(archive, timings) if needs_llm(role) else None
+    urls = [url] if url else scraper.urls
+    
+    failed = 0
+    started = time.perf_counter()
+    for number, page_url in enumerate(urls, start=1):
+        print(f"\n[PAGE {number}/{len(urls)}] {page_url}")
+        try:
+            content = scraper.fetch_and_parse(page_url)
+            results = analyze_page(content, role, llm_provider, timings=timings)
+        except (ScraperError, LLMError) as e:
+            print(f"   [ERROR] {e}")
+            failed += 1
+            continue
+        if url:
+            console.output_full(results)
+        if stream is not None:
+            for result in results:
+                stream.write(result)
+    elapsed = time.perf_counter() - started
+    archive.close()
+    
+    print(f"\n[TIME] Воспроизведено страниц: {len(urls) - failed} из {len(urls)} "
+          f"за {elapsed:.2f} сек ({len(urls) / elapsed:.1f} стр/с)")
+    print(timings.format())
+    if llm_provider is not None:
+        stats = llm_provider.stats
+        print(f"   Ответы LLM: точное совпадение промпта - {stats['exact']}, "
+              f"по странице и модулю - {stats['fallback']}, нет в архиве - {stats['missing']}")
+    return failed
+
+
 def ask_save_to_file() -> Optional[str]:
     """
     Спросить о сохранении в файл.
@@ -204,7 +455,11 @@ def main() -> int:
   py -3.12 agent.py                              # Интерактивный режим
   py -3.12 agent.py https://example.com          # Анализ с меню выбора роли
   py -3.12 agent.py https://example.com --role ui  # Только UI-анализ
+  py -3.12 agent.py https://example.com --role instant  # Экспресс-проверка без LLM
   py -3.12 agent.py https://example.com --role all --output result.txt
+  py -3.12 agent.py https://example.com --role instant --crawl --max-pages 5
+  py -3.12 agent.py --batch urls.txt --role instant --format ndjson --output report.ndjson
+  py -3.12 agent.py --replay output/.archive --role all  # Офлайн по архиву страниц и ответов
         """
     )
     parser.add_argument(
@@ -214,13 +469,49 @@ def main() -> int:
     )
     parser.add_argument(
         "--role", "-r",
-        choices=["ui", "content", "all"],
-        help="Роль агента: ui (дизайн), content (тексты), all (оба)"
+        help="Роль агента: ui (дизайн), content (тексты), all (все модули), "
+             "instant (без LLM) или ключ подключённого модуля"
     )
     parser.add_argument(
         "--output", "-o",
         help="Сохранить результаты в файл"
     )
+    parser.add_argument(
+        "--format", "-f",
+        choices=list(FILE_FORMATS),
+        help="Формат файла результатов (по умолчанию - по расширению --output, иначе txt)"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Проанализировать URL из файла (по одному в строке), дописывая результаты в отчёт"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="ARCHIVE",
+        help="Прогнать страницы из архива (ARCHIVE_DIR) без сети и LLM и вывести время этапов; "
+             "url ограничивает прогон одной страницей"
+    )
+    parser.add_argument(
+        "--incremental", "-i",
+        action="store_true",
+        help="Повторный анализ только изменённых блоков страницы"
+    )
+    parser.add_argument(
+        "--crawl",
+        action="store_true",
+        help="Обойти страницы сайта (воронку) и проанализировать каждую"
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        help="Максимум страниц при обходе (по умолчанию: CRAWL_MAX_PAGES из настроек)"
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        help="Глубина обхода от стартовой страницы (по умолчанию: CRAWL_MAX_DEPTH из настроек)"
+    )
     parser.add_argument(
         "--no-color",
         action="store_true",
@@ -228,6 +519,17 @@ def main() -> int:
     )
     
     args = parser.parse_args()
+    # Роль проверяется после разбора: поиск подключённых модулей
+    # не должен замедлять --help
+    if args.role and args.role not in role_choices():
+        parser.error(
+            f"argument --role/-r: invalid choice: '{args.role}' "
+            f"(choose from {', '.join(role_choices())})"
+        )
+    if args.batch and (args.url or args.crawl):
+        parser.error("--batch нельзя сочетать с url и --crawl")
+    if args.replay and (args.batch or args.crawl or args.incremental):
+        parser.error("--replay нельзя сочетать с --batch, --crawl и --incremental")
     
     try:
         # Показываем баннер
@@ -235,7 +537,16 @@ def main() -> int:
         
         # Получаем URL
         url = args.url
-        if not url:
+        urls: List[str] = []
+        if args.batch:
+            urls = read_url_list(args.batch)
+            if not urls:
+                print(f"[ERROR] В файле {args.batch} нет корректных URL")
+                return 1
+        elif args.replay:
+            # URL сравнивается с записанным в архиве как есть
+            pass
+        elif not url:
             url = get_url_input()
         elif not validate_url(url):
             # Добавляем https:// если не указан
@@ -248,38 +559,109 @@ def main() -> int:
         # Получаем роль
         role = args.role
         if not role:
-            role = show_menu()
+            # Воспроизведение не интерактивно: по умолчанию все модули
+            role = "all" if args.replay else show_menu()
         
-        print(f"\n[>] Анализируем: {url}")
-        print(f"   Режим: {ANALYZERS.get(role, {}).get('name', 'Все модули')}")
+        # Настройки загружаются после меню, чтобы оно появлялось сразу
+        setup_logging()
         
-        # Инициализируем LLM-провайдер
-        try:
-            llm_provider = GigaChatProvider()
-        except LLMError as e:
-            print(f"\n[ERROR] Ошибка настройки GigaChat: {e}")
-            print("\n[TIP] Добавьте ваш API-ключ в файл .env:")
-            print("   GIGACHAT_CREDENTIALS=ваш_ключ_здесь")
-            return 1
+        if args.batch:
+            print(f"\n[>] Пакетный анализ: {len(urls)} URL из {args.batch}")
+        elif args.replay:
+            print(f"\n[>] Воспроизведение из архива: {args.replay}" + (f" ({url})" if url else ""))
+        else:
+            print(f"\n[>] Анализируем: {url}")
+        analyzers = get_analyzers()
+        print(f"   Режим: {analyzers[role].name if role in analyzers else 'Все модули'}")
+        
+        from core import metrics
+        from core.config import settings
+        from core.result_store import ResultStore
+        from outputs.console_output import ConsoleOutput
+        from outputs.file_output import format_from_filename, get_file_output
+        from scrapers.negative_cache import SUPPRESSED_METRIC
+        
+        if args.replay:
+            if not os.path.exists(os.path.join(args.replay, "index.sqlite3")):
+                print(f"[ERROR] Архив не найден: {args.replay}")
+                return 1
+            console = ConsoleOutput(use_colors=not args.no_color)
+            output_file = args.output
+            stream = None
+            if output_file is not None:
+                file_output = get_file_output(args.format or format_from_filename(output_file))
+                stream = file_output.open_stream(output_file or None, url=url or "", prefix="replay")
+            try:
+                failed = run_replay(args.replay, role, console, stream, url)
+            finally:
+                if stream is not None:
+                    stream.close()
+                    print(f"\n[SAVED] Результаты сохранены в: {stream.path}")
+            return 0 if not failed else 1
+        
+        # Инициализируем LLM-провайдер (экспресс-проверке он не нужен)
+        llm_provider = None
+        if needs_llm(role):
+            from llm_providers.factory import create_llm_provider
+            
+            try:
+                llm_provider = create_llm_provider()
+            except LLMError as e:
+                print(f"\n[ERROR] Ошибка настройки GigaChat: {e}")
+                print("\n[TIP] Добавьте ваш API-ключ в файл .env:")
+                print("   GIGACHAT_CREDENTIALS=ваш_ключ_здесь")
+                return 1
         
         # Запускаем анализ
-        results = run_analysis(url, role, llm_provider)
+        store = ResultStore() if args.incremental or settings.incremental_analysis else None
+        console = ConsoleOutput(use_colors=not args.no_color)
+        output_file = args.output
+        file_output = get_file_output(args.format or format_from_filename(output_file))
+        
+        if args.batch:
+            # Результаты дописываются в отчёт по мере готовности
+            with file_output.open_stream(output_file or None, prefix="batch") as stream:
+                failed = run_batch(urls, role, llm_provider, console, stream, store)
+            print(f"\n[SAVED] Результаты сохранены в: {stream.path}")
+            if failed:
+                print(f"[!] Не удалось проанализировать: {failed} из {len(urls)}")
+            suppressed = metrics.get(SUPPRESSED_METRIC)
+            if suppressed:
+                print(f"[i] Повторных загрузок подавлено кэшем ошибок: {suppressed}")
+            return 0 if failed < len(urls) else 1
+            
+        if args.crawl:
+            # Результаты выводятся по каждой странице по мере обхода
+            # и сразу дописываются в файл, если он указан
+            stream = file_output.open_stream(output_file, url=url) if output_file is not None else None
+            try:
+                run_crawl(
+                    url, role, llm_provider, console, store,
+                    max_pages=args.max_pages,
+                    max_depth=args.depth,
+                    stream=stream
+                )
+            finally:
+                if stream is not None:
+                    stream.close()
+                    print(f"\n[SAVED] Результаты сохранены в: {stream.path}")
+            return 0
+        
+        results = run_analysis(url, role, llm_provider, store)
         
         # Выводим результаты
-        console = ConsoleOutput(use_colors=not args.no_color)
         console.output_full(results)
         
         # Сохраняем в файл
-        output_file = args.output
         if output_file is None and not args.url:
             # Интерактивный режим - спрашиваем
             save_filename = ask_save_to_file()
             if save_filename is not None:
                 output_file = save_filename if save_filename else None
+                file_output = get_file_output(args.format or format_from_filename(output_file))
         
         if output_file is not None or (args.output == ""):
-            txt_output = TxtOutput()
-            filepath = txt_output.output_full(results, output_file if output_file else None)
+            filepath = file_output.output_full(results, output_file if output_file else None)
             print(f"\n[SAVED] Результаты сохранены в: {filepath}")
         
         return 0
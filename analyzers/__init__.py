@@ -1,9 +1,18 @@
 """
 Analyzers module - модули анализа контента.
+
+Классы импортируются лениво: загрузка одного анализатора
+не тянет за собой остальные.
 """
 
-from analyzers.ui_designer import UIDesignerAnalyzer
-from analyzers.content_manager import ContentManagerAnalyzer
+from core.lazy import lazy_exports
+
+_EXPORTS = {
+    "UIDesignerAnalyzer": "analyzers.ui_designer",
+    "ContentManagerAnalyzer": "analyzers.content_manager",
+    "RulesAnalyzer": "analyzers.rules",
+}
 
-__all__ = ["UIDesignerAnalyzer", "ContentManagerAnalyzer"]
+__all__ = list(_EXPORTS)
 
+__getattr__ = lazy_exports(__name__, _EXPORTS)
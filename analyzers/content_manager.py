@@ -2,12 +2,12 @@
 Content Manager Analyzer - анализ текстового контента лендинга.
 """
 
-import re
 import logging
 from typing import List
 
 from core.interfaces import BaseAnalyzer, BaseLLMProvider
 from core.models import PageContent, AnalysisResult, Recommendation
+from core.recommendation_parser import parse_recommendations
 
 
 logger = logging.getLogger(__name__)
@@ -61,35 +61,4 @@ class ContentManagerAnalyzer(BaseAnalyzer):
         Returns:
             Список рекомендаций
         """
-        recommendations = []
-        
-        # Ищем паттерн: "N. Заголовок\nОписание"
-        pattern = r'(\d+)\.\s*(.+?)(?:\n|$)([\s\S]*?)(?=\d+\.|$)'
-        matches = re.findall(pattern, response)
-        
-        if matches:
-            for match in matches[:5]:  # Максимум 5 рекомендаций
-                number = int(match[0])
-                title = match[1].strip()
-                description = match[2].strip()
-                
-                if title and description:
-                    recommendations.append(Recommendation(
-                        number=number,
-                        title=title,
-                        description=description,
-                        priority="medium"
-                    ))
-        
-        # Если не удалось распарсить, создаём одну общую рекомендацию
-        if not recommendations:
-            logger.warning("Не удалось распарсить ответ, сохраняем как есть")
-            recommendations.append(Recommendation(
-                number=1,
-                title="Рекомендации по контенту",
-                description=response.strip(),
-                priority="medium"
-            ))
-        
-        return recommendations
-
+        return parse_recommendations(response, fallback_title="Рекомендации по контенту")
@@ -0,0 +1,285 @@
+"""
+Rules Analyzer - мгновенные локальные проверки лендинга без LLM.
+
+Проверки работают по структурным признакам, которые HTMLParser извлекает
+при парсинге (PageStructure), поэтому не требуют повторного разбора HTML.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from core.interfaces import BaseAnalyzer, BaseLLMProvider
+from core.models import PageContent, PageStructure, AnalysisResult, Recommendation
+
+
+logger = logging.getLogger(__name__)
+
+# Пороговые значения проверок
+MAX_CTA_COUNT = 8
+MAX_BLOCK_LENGTH = 1200
+MIN_WORD_COUNT = 150
+META_DESCRIPTION_MIN = 50
+META_DESCRIPTION_MAX = 160
+TITLE_MAX_LENGTH = 60
+
+# Порядок сортировки по приоритету
+PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# Находка проверки: (заголовок, описание)
+Finding = Tuple[str, str]
+RuleCheck = Callable[[PageContent, PageStructure], Optional[Finding]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Зарегистрированная локальная проверка."""
+    
+    name: str
+    priority: str
+    check: RuleCheck
+    requires_markup: bool = False  # Проверяет признаки разметки (PageStructure.markup_known)
+
+
+# Реестр проверок (заполняется декоратором @rule)
+RULES: List[Rule] = []
+
+
+def rule(name: str, priority: str = "medium", requires_markup: bool = False) -> Callable[[RuleCheck], RuleCheck]:
+    """
+    Зарегистрировать функцию как локальную проверку.
+    
+    Args:
+        name: Уникальное имя проверки
+        priority: Приоритет находки: high, medium, low
+        requires_markup: Проверка пропускается, если разметка страницы неизвестна
+    
+    Returns:
+        Декоратор, добавляющий проверку в реестр RULES
+    """
+    def decorator(check: RuleCheck) -> RuleCheck:
+        RULES.append(Rule(name=name, priority=priority, check=check, requires_markup=requires_markup))
+        return check
+    return decorator
+
+
+@rule("empty_shell", priority="high")
+def check_empty_shell(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """Страница отдаёт пустой HTML-каркас без текста."""
+    if not content.is_empty_shell:
+        return None
+    return (
+        "Отдавать контент в HTML (SSR или пререндеринг)",
+        "Страница отдаёт пустой HTML-каркас, а весь текст рисует JavaScript. "
+        "Поисковики, превью в мессенджерах и медленные устройства видят пустую "
+        "страницу. Включите серверный рендеринг или пререндеринг ключевых страниц."
+    )
+
+
+@rule("missing_title", priority="high")
+def check_title(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """Отсутствует тег <title>."""
+    if content.title:
+        return None
+    return (
+        "Добавить заголовок страницы (title)",
+        "У страницы нет тега <title>. Он отображается во вкладке браузера и в "
+        f"поисковой выдаче. Сформулируйте его как выгоду для посетителя, до {TITLE_MAX_LENGTH} символов."
+    )
+
+
+@rule("long_title", priority="low")
+def check_long_title(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """Тег <title> длиннее видимой в выдаче части."""
+    if not content.title or len(content.title) <= TITLE_MAX_LENGTH:
+        return None
+    return (
+        "Сократить заголовок страницы (title)",
+        f"Title занимает {len(content.title)} символов, в выдаче видны около "
+        f"{TITLE_MAX_LENGTH}. Вынесите выгоду в начало и уберите лишние слова."
+    )
+
+
+@rule("missing_h1", priority="high", requires_markup=True)
+def check_missing_h1(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """На странице нет заголовка H1."""
+    if structure.h1_count > 0:
+        return None
+    return (
+        "Добавить главный заголовок H1",
+        "На странице нет заголовка H1. Посетитель и поисковики не видят главного "
+        "сообщения. Разместите в первом экране один H1 с основным предложением."
+    )
+
+
+@rule("multiple_h1", priority="medium", requires_markup=True)
+def check_multiple_h1(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """На странице несколько заголовков H1."""
+    if structure.h1_count <= 1:
+        return None
+    return (
+        "Оставить один заголовок H1",
+        f"На странице {structure.h1_count} заголовков H1 — главный посыл размывается. "
+        "Оставьте один H1 в первом экране, остальные переведите в H2."
+    )
+
+
+@rule("missing_meta_description", priority="medium")
+def check_meta_description(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """Meta description отсутствует или неподходящей длины."""
+    description = structure.meta_description
+    if not description:
+        return (
+            "Добавить meta description",
+            "У страницы нет meta description — поисковики подставят случайный фрагмент "
+            f"текста. Напишите описание на {META_DESCRIPTION_MIN}-{META_DESCRIPTION_MAX} "
+            "символов с УТП и призывом к действию."
+        )
+    if not META_DESCRIPTION_MIN <= len(description) <= META_DESCRIPTION_MAX:
+        return (
+            "Скорректировать длину meta description",
+            f"Meta description занимает {len(description)} символов. Оптимально "
+            f"{META_DESCRIPTION_MIN}-{META_DESCRIPTION_MAX}: короче — мало информации, "
+            "длиннее — обрежется в выдаче."
+        )
+    return None
+
+
+@rule("no_cta", priority="high", requires_markup=True)
+def check_no_cta(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """На странице нет кнопок и призывов к действию."""
+    if structure.cta_count > 0:
+        return None
+    return (
+        "Добавить призыв к действию",
+        "На странице не найдено ни одной кнопки или CTA-ссылки. Добавьте заметную "
+        "кнопку с конкретным действием в первый экран и после ключевых блоков."
+    )
+
+
+@rule("too_many_cta", priority="medium", requires_markup=True)
+def check_too_many_cta(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """Слишком много конкурирующих призывов к действию."""
+    if structure.cta_count <= MAX_CTA_COUNT:
+        return None
+    return (
+        "Сократить количество призывов к действию",
+        f"На странице {structure.cta_count} кнопок и CTA-ссылок — они конкурируют "
+        "между собой. Выделите одно целевое действие, остальные оформите второстепенно."
+    )
+
+
+@rule("wall_of_text", priority="medium", requires_markup=True)
+def check_wall_of_text(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """На странице есть слишком длинный текстовый блок."""
+    if structure.longest_block_length <= MAX_BLOCK_LENGTH:
+        return None
+    return (
+        "Разбить длинные текстовые блоки",
+        f"Самый длинный абзац занимает {structure.longest_block_length} символов. "
+        "Такой текст не читают на лендинге: разбейте его на короткие абзацы, "
+        "списки и подзаголовки."
+    )
+
+
+@rule("images_without_alt", priority="medium", requires_markup=True)
+def check_images_alt(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """У изображений отсутствует атрибут alt."""
+    if structure.images_without_alt == 0:
+        return None
+    return (
+        "Заполнить alt у изображений",
+        f"У {structure.images_without_alt} из {structure.images_total} изображений нет "
+        "атрибута alt. Это ухудшает доступность и SEO: опишите в alt, что изображено."
+    )
+
+
+@rule("thin_content", priority="low")
+def check_thin_content(content: PageContent, structure: PageStructure) -> Optional[Finding]:
+    """На странице слишком мало текста."""
+    if structure.word_count >= MIN_WORD_COUNT:
+        return None
+    return (
+        "Расширить текстовое содержание",
+        f"На странице всего {structure.word_count} слов. Добавьте блоки с выгодами, "
+        "ответами на возражения и социальными доказательствами."
+    )
+
+
+class RulesAnalyzer(BaseAnalyzer):
+    """
+    Анализатор на основе локальных правил.
+    
+    Роль: автоматическая экспресс-проверка без обращения к LLM.
+    Анализирует: заголовки, meta description, CTA, объём текста, alt изображений.
+    """
+    
+    name = "Экспресс-проверка"
+    description = "Мгновенные локальные проверки без LLM"
+    is_premium = False  # Бесплатный модуль
+    requires_llm = False
+    
+    def __init__(self, llm_provider: Optional[BaseLLMProvider] = None):
+        """
+        Инициализация анализатора.
+        
+        Args:
+            llm_provider: Не используется, оставлен для единого интерфейса
+        """
+        super().__init__(llm_provider)
+    
+    def get_system_prompt(self) -> str:
+        """Системный промпт не используется."""
+        return ""
+    
+    def parse_response(self, response: str) -> List[Recommendation]:
+        """Ответ LLM не используется."""
+        return []
+    
+    def analyze(
+        self,
+        content: PageContent,
+        known_issues: Optional[List[Recommendation]] = None
+    ) -> AnalysisResult:
+        """
+        Выполнить все зарегистрированные проверки.
+        
+        Args:
+            content: Контент страницы для анализа
+            known_issues: Не используется
+        
+        Returns:
+            Результат анализа с найденными проблемами
+        """
+        structure = content.structure or PageStructure()
+        
+        findings = []
+        for registered in RULES:
+            if registered.requires_markup and not structure.markup_known:
+                continue
+            try:
+                finding = registered.check(content, structure)
+            except Exception as e:
+                logger.warning(f"Ошибка проверки {registered.name}: {e}")
+                continue
+            if finding:
+                findings.append((registered.priority, finding))
+        
+        findings.sort(key=lambda item: PRIORITY_ORDER.get(item[0], len(PRIORITY_ORDER)))
+        
+        recommendations = [
+            Recommendation(
+                number=number,
+                title=title,
+                description=description,
+                priority=priority
+            )
+            for number, (priority, (title, description)) in enumerate(findings[:10], start=1)
+        ]
+        
+        return AnalysisResult(
+            module_name=self.name,
+            module_description=self.description,
+            url=content.url,
+            recommendations=recommendations
+        )
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Офлайн-замер разбора страниц и ответов LLM по архиву.
+
+Страницы из архива (ARCHIVE_ENABLED=true) разбираются текущим
+HTMLParser, а записанные ответы LLM - методом parse_response
+анализатора, которому принадлежит системный промпт диалога.
+Сеть и LLM не используются, поэтому результаты сравнимы между
+версиями кода на одном и том же наборе данных.
+
+Запуск: py -3.12 benchmarks/archive_replay.py [--archive output/.archive] [--runs 3]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.archive import TRANSCRIPT, PageArchive  # noqa: E402
+from core.registry import get_analyzer, get_analyzers  # noqa: E402
+from scrapers.html_parser import HTMLParser  # noqa: E402
+
+
+def measure(action, items: list, runs: int) -> float:
+    """
+    Медианное время обработки всех элементов в секундах.
+    
+    Args:
+        action: Функция обработки одного элемента
+        items: Элементы набора данных
+        runs: Количество прогонов
+        
+    Returns:
+        Медиана времени прогона
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for item in items:
+            action(*item)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def load_transcripts(archive: PageArchive) -> List[Tuple[object, str]]:
+    """
+    Ответы LLM из архива вместе с анализаторами, которые их разбирают.
+    
+    Args:
+        archive: Архив
+        
+    Returns:
+        Список пар (анализатор, сырой ответ)
+    """
+    analyzers = [
+        get_analyzer(key) for key, info in get_analyzers().items() if info.requires_llm
+    ]
+    transcripts = []
+    for record in archive.find(TRANSCRIPT):
+        transcript = archive.read(record)
+        for analyzer in analyzers:
+            if transcript["system_prompt"].startswith(analyzer.get_system_prompt()):
+                transcripts.append((analyzer, transcript["response"]))
+                break
+    return transcripts
+
+
+def main() -> int:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description="Разбор страниц и ответов LLM из архива")
+    parser.add_argument("--archive", help="Директория архива (по умолчанию ARCHIVE_DIR)")
+    parser.add_argument("--runs", type=int, default=3, help="Количество прогонов")
+    args = parser.parse_args()
+    
+    archive = PageArchive(args.archive)
+    pages = [(html, record.url) for record, html in archive.iter_pages()]
+    transcripts = load_transcripts(archive)
+    if not pages and not transcripts:
+        print(f"Архив {archive.directory} пуст")
+        return 1
+        
+    html_parser = HTMLParser(keep_html=False)
+    megabytes = sum(len(html.encode("utf-8")) for html, _ in pages) / 1024 / 1024
+    
+    print(f"Архив: {archive.directory}")
+    if pages:
+        elapsed = measure(lambda html, url: html_parser.parse(html, url=url), pages, args.runs)
+        print(
+            f"  HTMLParser.parse:     {len(pages)} стр., {megabytes:.1f} МБ - "
+            f"{elapsed * 1000:8.1f} мс ({len(pages) / elapsed:.1f} стр/с, {megabytes / elapsed:.1f} МБ/с)"
+        )
+    if transcripts:
+        elapsed = measure(lambda analyzer, response: analyzer.parse_response(response), transcripts, args.runs)
+        print(
+            f"  parse_response:       {len(transcripts)} отв. - "
+            f"{elapsed * 1000:8.1f} мс ({len(transcripts) / elapsed:.1f} отв/с)"
+        )
+    archive.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Замер нормализации текста страниц (core.utils.clean_text).
+
+Текст извлекается из HTML так же, как в HTMLParser (get_text с
+переносом строки между блоками), после чего сравниваются прежняя
+очистка двумя регулярными выражениями и текущая clean_text: время
+и объём текста, который уходит в промпт (в символах и оценочных токенах).
+
+Корпус - HTML-файлы и директории с ними, а также страницы архива
+(ARCHIVE_ENABLED=true).
+
+Запуск: py -3.12 benchmarks/clean_text.py [--archive output/.archive] [--corpus pages/] [--runs 5]
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from core.tokens import estimate_tokens  # noqa: E402
+from core.utils import clean_text  # noqa: E402
+
+
+def legacy_clean_text(text: str) -> str:
+    """Прежняя очистка: все пробельные символы, включая переносы, в один пробел."""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def extract_text(html: str) -> str:
+    """Текст страницы до очистки, как его получает HTMLParser."""
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup(["script", "style", "meta", "link", "noscript", "header", "footer", "nav"]):
+        tag.decompose()
+    return soup.get_text(separator="\n", strip=True)
+
+
+def load_corpus(paths: List[str], archive_dir: str) -> List[str]:
+    """
+    Загрузить HTML корпуса.
+    
+    Args:
+        paths: HTML-файлы и директории
+        archive_dir: Директория архива страниц (может отсутствовать)
+        
+    Returns:
+        Список HTML-документов
+    """
+    documents = []
+    for path in map(Path, paths):
+        files = sorted(path.rglob("*.htm*")) if path.is_dir() else [path]
+        documents.extend(file.read_text(encoding="utf-8", errors="replace") for file in files)
+        
+    if (Path(archive_dir) / "index.sqlite3").exists():
+        from core.archive import PageArchive
+        
+        archive = PageArchive(archive_dir)
+        documents.extend(html for _, html in archive.iter_pages())
+        archive.close()
+    return documents
+
+
+def measure(function: Callable[[str], str], texts: List[str], runs: int) -> float:
+    """Медианное время обработки корпуса в миллисекундах."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for text in texts:
+            function(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    """Точка входа бенчмарка."""
+    from core.config import settings
+    
+    parser = argparse.ArgumentParser(description="Замер нормализации текста страниц")
+    parser.add_argument("--corpus", nargs="*", default=[], help="HTML-файлы и директории")
+    parser.add_argument("--archive", default=settings.archive_dir, help="Директория архива страниц")
+    parser.add_argument("--runs", type=int, default=5, help="Количество прогонов")
+    args = parser.parse_args()
+    
+    texts = [extract_text(html) for html in load_corpus(args.corpus, args.archive)]
+    if not texts:
+        print("Корпус пуст: укажите --corpus или включите архив (ARCHIVE_ENABLED=true)")
+        return 1
+        
+    print(f"Корпус: {len(texts)} стр., {sum(map(len, texts)) / 1024:.0f} КБ текста до очистки")
+    print(f"  {'':22} {'время, мс':>10} {'символов':>10} {'токенов':>10} {'строк':>8}")
+    for name, function in (("две регулярки", legacy_clean_text), ("clean_text", clean_text)):
+        elapsed = measure(function, texts, args.runs)
+        cleaned = [function(text) for text in texts]
+        chars = sum(map(len, cleaned))
+        tokens = sum(map(estimate_tokens, cleaned))
+        lines = sum(text.count("\n") + 1 for text in cleaned)
+        print(f"  {name:22} {elapsed:10.1f} {chars:10} {tokens:10} {lines:8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
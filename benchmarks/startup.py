@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Замер времени запуска CLI.
+
+Запускает agent.py в отдельных процессах с `python -X importtime`,
+выводит медианное время до выхода и самые дорогие импорты.
+Время «голого» интерпретатора замеряется отдельно, чтобы было видно,
+сколько добавляет сам проект.
+
+Запуск: py -3.12 benchmarks/startup.py [--runs 10] [--top 15] [-- аргументы agent.py]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Строка вывода -X importtime: "import time: self | cumulative | name"
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure(command: List[str], runs: int) -> float:
+    """
+    Медианное время выполнения команды в миллисекундах.
+    
+    Args:
+        command: Команда для запуска
+        runs: Количество запусков
+        
+    Returns:
+        Медиана времени выполнения (мс)
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, capture_output=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def top_imports(agent_args: List[str], top: int) -> Tuple[List[Tuple[str, float, float]], float]:
+    """
+    Самые дорогие импорты верхнего уровня при запуске agent.py.
+    
+    Args:
+        agent_args: Аргументы agent.py
+        top: Количество позиций в отчёте
+        
+    Returns:
+        Кортеж (список (модуль, собственное мс, суммарное мс), сумма по проекту мс)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "agent.py", *agent_args],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    project_packages = {path.name for path in ROOT.iterdir() if (path / "__init__.py").exists()}
+    
+    roots: Dict[str, Tuple[float, float]] = {}
+    project_total = 0.0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        if name.split(".")[0] in project_packages:
+            project_total += int(self_us) / 1000
+        # Модули без отступа импортированы напрямую, их время включает вложенные
+        if len(indent) == 1:
+            roots[name] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+            
+    ranked = sorted(roots.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    return [(name, own, cumulative) for name, (own, cumulative) in ranked], project_total
+
+
+def main() -> int:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description="Замер времени запуска agent.py")
+    parser.add_argument("--runs", type=int, default=10, help="Количество запусков")
+    parser.add_argument("--top", type=int, default=15, help="Количество импортов в отчёте")
+    parser.add_argument("agent_args", nargs="*", default=["--help"], help="Аргументы agent.py")
+    args = parser.parse_args()
+    
+    baseline = measure([sys.executable, "-c", "pass"], args.runs)
+    startup = measure([sys.executable, "agent.py", *args.agent_args], args.runs)
+    imports, project_total = top_imports(args.agent_args, args.top)
+    
+    print(f"agent.py {' '.join(args.agent_args)}")
+    print(f"  Интерпретатор:       {baseline:8.1f} мс")
+    print(f"  Запуск (медиана):    {startup:8.1f} мс")
+    print(f"  Добавляет проект:    {startup - baseline:8.1f} мс")
+    print(f"  Модули проекта:      {project_total:8.1f} мс (собственное время импорта)")
+    print()
+    print(f"  {'Импорт':40} {'своё, мс':>10} {'всего, мс':>10}")
+    for name, own, cumulative in imports:
+        print(f"  {name:40} {own:10.1f} {cumulative:10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,20 +2,25 @@
 Core module - ядро системы Landing Redesign Assistant.
 
 Содержит базовые классы, интерфейсы, модели данных и конфигурацию.
+Имена импортируются лениво: `import core.registry` или `core.utils`
+не загружает pydantic и настройки.
 """
 
-from core.config import settings
-from core.models import PageContent, AnalysisResult, Recommendation
-from core.interfaces import BaseAnalyzer, BaseScraper, BaseLLMProvider, BaseOutput
+from core.lazy import lazy_exports
 
-__all__ = [
-    "settings",
-    "PageContent",
-    "AnalysisResult", 
-    "Recommendation",
-    "BaseAnalyzer",
-    "BaseScraper",
-    "BaseLLMProvider",
-    "BaseOutput",
-]
+# Имя -> модуль, из которого оно экспортируется
+_EXPORTS = {
+    "settings": "core.config",
+    "PageContent": "core.models",
+    "AnalysisResult": "core.models",
+    "Recommendation": "core.models",
+    "BaseAnalyzer": "core.interfaces",
+    "BaseScraper": "core.interfaces",
+    "AsyncBaseScraper": "core.interfaces",
+    "BaseLLMProvider": "core.interfaces",
+    "BaseOutput": "core.interfaces",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
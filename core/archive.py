@@ -0,0 +1,381 @@
+"""
+Сжатый архив загруженных страниц и ответов LLM.
+
+Для аудита и повторного анализа хранится исходный HTML страниц и
+полные диалоги с LLM (промпты и сырой ответ). Записи не лежат
+отдельными файлами: каждая сжимается отдельным кадром gzip (или zstd,
+если установлен пакет zstandard) и дописывается в конец сегмента
+segment_NNNNNN.arc. Сегмент - просто последовательность кадров, его
+можно распаковать целиком (zcat) без кода проекта.
+
+Индекс (вид записи, URL, ключ, время) -> (сегмент, смещение, длина)
+хранится в SQLite рядом с сегментами. Запись выполняется внутри
+транзакции индекса, поэтому несколько процессов дописывают архив
+без перемешивания кадров. Чтение по смещению идёт через mmap
+без копирования сегмента в память.
+
+Архив - готовый офлайн-набор данных: записанные страницы можно
+заново разобрать текущим HTMLParser, а ответы - текущими анализаторами
+без сети (см. benchmarks/archive_replay.py).
+"""
+
+import contextvars
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from core.config import settings
+
+try:
+    import zstandard
+except ImportError:  # zstandard не обязателен, используется gzip
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+PAGE = "page"
+TRANSCRIPT = "llm"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    url TEXT NOT NULL,
+    key TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    codec TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_url ON records (kind, url, created_at);
+CREATE INDEX IF NOT EXISTS records_key ON records (kind, key);
+"""
+
+# URL страницы, для которой сейчас выполняется анализ (для записи диалогов с LLM)
+_page_url: contextvars.ContextVar[str] = contextvars.ContextVar("archive_page_url", default="")
+
+_archive: Optional["PageArchive"] = None
+_archive_lock = threading.Lock()
+
+
+class ArchiveRecord(NamedTuple):
+    """Запись индекса архива."""
+    
+    id: int
+    kind: str
+    url: str
+    key: str
+    created_at: float
+    segment: int
+    offset: int
+    length: int
+    codec: str
+
+
+def prompt_key(system_prompt: str, user_prompt: str) -> str:
+    """
+    Ключ диалога с LLM по промптам.
+    
+    Args:
+        system_prompt: Системный промпт
+        user_prompt: Пользовательский промпт
+        
+    Returns:
+        Хэш пары промптов
+    """
+    digest = hashlib.sha256()
+    digest.update(system_prompt.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(user_prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@contextmanager
+def page_scope(url: str) -> Iterator[None]:
+    """
+    Отметить, к какой странице относятся вызовы LLM внутри блока.
+    
+    Args:
+        url: URL анализируемой страницы
+    """
+    token = _page_url.set(url)
+    try:
+        yield
+    finally:
+        _page_url.reset(token)
+
+
+def current_page_url() -> str:
+    """URL анализируемой страницы или пустая строка."""
+    return _page_url.get()
+
+
+class PageArchive:
+    """
+    Архив сжатых записей в сегментах фиксированного размера.
+    
+    Как и SharedResultStore, открывает соединение с индексом
+    отдельно в каждом потоке.
+    """
+    
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        codec: Optional[str] = None,
+        segment_mb: Optional[float] = None
+    ):
+        """
+        Инициализация архива.
+        
+        Args:
+            directory: Директория сегментов и индекса
+            codec: Сжатие новых записей: gzip или zstd
+            segment_mb: Размер сегмента в МБ, после которого начинается новый
+        """
+        self.directory = Path(directory or settings.archive_dir)
+        self.codec = codec or settings.archive_compression
+        if self.codec == "zstd" and zstandard is None:
+            logger.warning("Пакет zstandard не установлен, архив сжимается gzip")
+            self.codec = "gzip"
+        self.segment_size = int((segment_mb or settings.archive_segment_mb) * 1024 * 1024)
+        self._local = threading.local()
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._maps_lock = threading.Lock()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Соединение с индексом текущего потока."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.directory / "index.sqlite3", timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+        return connection
+    
+    def _segment_path(self, segment: int) -> Path:
+        """Путь к файлу сегмента."""
+        return self.directory / f"segment_{segment:06d}.arc"
+    
+    def _compress(self, data: bytes) -> bytes:
+        """Сжать запись отдельным кадром."""
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(data)
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        """Распаковать кадр записи."""
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Для чтения записи нужен пакет zstandard")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+    
+    def put(self, kind: str, url: str, key: str, payload: dict) -> int:
+        """
+        Добавить запись в архив.
+        
+        Args:
+            kind: Вид записи (PAGE, TRANSCRIPT)
+            url: URL страницы
+            key: Ключ поиска записи
+            payload: Содержимое записи
+            
+        Returns:
+            Идентификатор записи
+        """
+        frame = self._compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        connection = self._connection()
+        # Транзакция индекса - блокировка записи между процессами:
+        # кадр дописывается и регистрируется под одной блокировкой
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute("SELECT MAX(segment) FROM records").fetchone()
+            segment = row[0] or 1
+            path = self._segment_path(segment)
+            if path.exists() and path.stat().st_size >= self.segment_size:
+                segment += 1
+                path = self._segment_path(segment)
+                
+            with open(path, "ab") as file:
+                offset = file.tell()
+                file.write(frame)
+                
+            cursor = connection.execute(
+                "INSERT INTO records (kind, url, key, created_at, segment, offset, length, codec) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, url, key, time.time(), segment, offset, len(frame), self.codec)
+            )
+            record_id = cursor.lastrowid
+            if record_id is None:
+                raise RuntimeError("Индекс архива не вернул идентификатор записи")
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return record_id
+    
+    def put_page(self, url: str, html: str) -> int:
+        """
+        Сохранить исходный HTML страницы.
+        
+        Args:
+            url: URL страницы
+            html: HTML-код
+            
+        Returns:
+            Идентификатор записи
+        """
+        return self.put(PAGE, url, url, {"url": url, "html": html})
+    
+    def put_transcript(self, system_prompt: str, user_prompt: str, response: str, url: str = "") -> int:
+        """
+        Сохранить диалог с LLM.
+        
+        Args:
+            system_prompt: Системный промпт
+            user_prompt: Пользовательский промпт
+            response: Сырой ответ LLM
+            url: URL анализируемой страницы
+            
+        Returns:
+            Идентификатор записи
+        """
+        return self.put(TRANSCRIPT, url, prompt_key(system_prompt, user_prompt), {
+            "url": url,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "response": response,
+        })
+    
+    def find(
+        self,
+        kind: str,
+        url: Optional[str] = None,
+        key: Optional[str] = None,
+        since: Optional[float] = None
+    ) -> List[ArchiveRecord]:
+        """
+        Найти записи по индексу (от старых к новым).
+        
+        Args:
+            kind: Вид записи
+            url: Только записи страницы
+            key: Только записи с ключом
+            since: Только записи не старше метки времени
+            
+        Returns:
+            Список записей индекса
+        """
+        query = "SELECT * FROM records WHERE kind = ?"
+        params: list = [kind]
+        if url is not None:
+            query += " AND url = ?"
+            params.append(url)
+        if key is not None:
+            query += " AND key = ?"
+            params.append(key)
+        if since is not None:
+            query += " AND created_at >= ?"
+            params.append(since)
+        rows = self._connection().execute(query + " ORDER BY id", params).fetchall()
+        return [ArchiveRecord(*row) for row in rows]
+    
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """Отображение сегмента в память, покрывающее смещение end."""
+        with self._maps_lock:
+            mapped = self._maps.get(segment)
+            if mapped is None or len(mapped) < end:
+                # Сегмент дописан после отображения - отображаем заново
+                if mapped is not None:
+                    mapped.close()
+                with open(self._segment_path(segment), "rb") as file:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[segment] = mapped
+            return mapped
+    
+    def read(self, record: ArchiveRecord) -> dict:
+        """
+        Прочитать содержимое записи.
+        
+        Args:
+            record: Запись индекса
+            
+        Returns:
+            Содержимое, переданное в put()
+        """
+        end = record.offset + record.length
+        frame = self._map(record.segment, end)[record.offset:end]
+        return json.loads(self._decompress(frame, record.codec))
+    
+    def iter_pages(self, url: Optional[str] = None) -> Iterator[tuple]:
+        """
+        Перебрать сохранённые страницы.
+        
+        Args:
+            url: Только снимки указанной страницы
+            
+        Yields:
+            Кортежи (запись индекса, HTML)
+        """
+        for record in self.find(PAGE, url=url):
+            yield record, self.read(record)["html"]
+    
+    def close(self) -> None:
+        """Закрыть отображения сегментов и соединение текущего потока."""
+        with self._maps_lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def get_archive() -> Optional[PageArchive]:
+    """
+    Получить общий архив процесса.
+    
+    Returns:
+        PageArchive или None, если архивирование отключено (ARCHIVE_ENABLED=false)
+    """
+    global _archive
+    if not settings.archive_enabled:
+        return None
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = PageArchive()
+    return _archive
+
+
+def archive_page(url: str, html: str) -> None:
+    """
+    Сохранить загруженную страницу, если архивирование включено.
+    
+    Ошибка записи архива не прерывает анализ.
+    
+    Args:
+        url: URL страницы
+        html: HTML-код
+    """
+    archive = get_archive()
+    if archive is None:
+        return
+    try:
+        archive.put_page(url, html)
+    except Exception as e:
+        logger.warning(f"Не удалось сохранить страницу {url} в архив: {e}")
@@ -34,6 +34,44 @@ class Settings(BaseSettings):
         default="GIGACHAT_API_PERS",
         description="Scope для GigaChat API"
     )
+    gigachat_base_url: str = Field(
+        default="",
+        description="Адрес GigaChat API (пусто - адрес по умолчанию SDK)"
+    )
+    gigachat_auth_url: str = Field(
+        default="",
+        description="Адрес получения токена OAuth GigaChat (пусто - адрес по умолчанию SDK)"
+    )
+    gigachat_pro_model: str = Field(
+        default="",
+        description="Вторая модель GigaChat для маршрутизации (например, GigaChat-Pro)"
+    )
+    gigachat_cost_per_1k: float = Field(
+        default=0.2,
+        description="Стоимость 1000 токенов основной модели GigaChat"
+    )
+    gigachat_pro_cost_per_1k: float = Field(
+        default=1.5,
+        description="Стоимость 1000 токенов второй модели GigaChat"
+    )
+    
+    # OpenAI-совместимый API (например, локальный llama.cpp server)
+    openai_base_url: str = Field(
+        default="",
+        description="Базовый URL OpenAI-совместимого API, например http://localhost:8080/v1"
+    )
+    openai_model: str = Field(
+        default="local-model",
+        description="Имя модели OpenAI-совместимого API"
+    )
+    openai_api_key: str = Field(
+        default="",
+        description="API-ключ OpenAI-совместимого API (локальным серверам не нужен)"
+    )
+    openai_cost_per_1k: float = Field(
+        default=0.0,
+        description="Стоимость 1000 токенов OpenAI-совместимого API"
+    )
     
     # Настройки парсера
     scraper_timeout: int = Field(
@@ -44,6 +82,133 @@ class Settings(BaseSettings):
         default="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         description="User-Agent для HTTP-запросов"
     )
+    scraper_pool_hosts: int = Field(
+        default=20,
+        description="Количество хостов, для которых хранятся пулы соединений"
+    )
+    scraper_pool_maxsize: int = Field(
+        default=10,
+        description="Максимум соединений к одному хосту в синхронном пуле"
+    )
+    scraper_tcp_keepalive_idle: int = Field(
+        default=60,
+        description="Простой соединения до первой TCP keep-alive проверки (сек)"
+    )
+    scraper_http2: bool = Field(
+        default=True,
+        description="Использовать HTTP/2 в асинхронном парсере"
+    )
+    scraper_max_connections: int = Field(
+        default=100,
+        description="Максимум одновременных соединений асинхронного парсера"
+    )
+    scraper_max_connections_per_host: int = Field(
+        default=6,
+        description="Максимум одновременных запросов к одному хосту"
+    )
+    scraper_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Время жизни простаивающего keep-alive соединения в секундах"
+    )
+    scraper_dns_cache_ttl: float = Field(
+        default=300.0,
+        description="Время кэширования DNS-ответов в секундах (0 - без кэша)"
+    )
+    scraper_concurrency: int = Field(
+        default=8,
+        description="Одновременных загрузок в пакетном режиме (все хосты)"
+    )
+    scraper_host_concurrency: int = Field(
+        default=2,
+        description="Одновременных загрузок с одного хоста в пакетном режиме"
+    )
+    scraper_host_delay: float = Field(
+        default=1.0,
+        description="Пауза между запросами к одному хосту в пакетном режиме (сек)"
+    )
+    scraper_max_retries: int = Field(
+        default=3,
+        description="Повторов загрузки после ответов 429/503"
+    )
+    scraper_retry_backoff: float = Field(
+        default=2.0,
+        description="Начальная пауза перед повтором без Retry-After (сек, удваивается)"
+    )
+    scraper_retry_max_delay: float = Field(
+        default=60.0,
+        description="Наибольшая пауза перед повтором, в том числе из Retry-After (сек)"
+    )
+    negative_cache_enabled: bool = Field(
+        default=True,
+        description="Запоминать ошибки загрузки и сразу отклонять повторные загрузки"
+    )
+    negative_cache_ttl_not_found: float = Field(
+        default=300.0,
+        description="Время хранения ошибок 404/410 и прочих 4xx для URL (сек)"
+    )
+    negative_cache_ttl_forbidden: float = Field(
+        default=600.0,
+        description="Время хранения ошибок 401/403 для URL (сек)"
+    )
+    negative_cache_ttl_server_error: float = Field(
+        default=30.0,
+        description="Время хранения ошибок 5xx (кроме 502/503/504) для URL (сек)"
+    )
+    negative_cache_ttl_dns: float = Field(
+        default=300.0,
+        description="Время хранения ошибки разрешения имени для хоста (сек)"
+    )
+    negative_cache_ttl_unreachable: float = Field(
+        default=60.0,
+        description="Время хранения ошибок подключения (хост) и таймаута ответа (URL) в секундах"
+    )
+    negative_cache_max_entries: int = Field(
+        default=10000,
+        description="Наибольшее число записей в кэше ошибок загрузки"
+    )
+    
+    keep_raw_html: bool = Field(
+        default=False,
+        description="Сохранять исходный HTML в PageContent (анализаторам не нужен)"
+    )
+    min_text_length: int = Field(
+        default=200,
+        description="Минимальная длина текста, при которой страница пригодна для анализа"
+    )
+    prerender_snapshot_dir: str = Field(
+        default="",
+        description="Директория с заранее отрендеренными снимками SPA-страниц"
+    )
+    parse_pool_size: int = Field(
+        default=0,
+        description="Процессы для разбора HTML в веб-сервере (0 - разбор в процессе воркера)"
+    )
+    parse_timeout: float = Field(
+        default=15.0,
+        description="Предельное время разбора одной страницы в пуле процессов (сек)"
+    )
+    parse_shm_threshold: int = Field(
+        default=65536,
+        description="Размер страницы в байтах, начиная с которого она передаётся через общую память"
+    )
+    
+    # Настройки обхода сайта
+    crawl_max_depth: int = Field(
+        default=1,
+        description="Глубина обхода от стартовой страницы"
+    )
+    crawl_max_pages: int = Field(
+        default=10,
+        description="Максимальное количество страниц при обходе"
+    )
+    crawl_concurrency: int = Field(
+        default=4,
+        description="Количество одновременных загрузок при обходе"
+    )
+    crawl_delay: float = Field(
+        default=0.5,
+        description="Пауза между запросами к сайту при обходе (сек)"
+    )
     
     # Настройки LLM
     llm_timeout: int = Field(
@@ -54,11 +219,127 @@ class Settings(BaseSettings):
         default=3,
         description="Максимальное количество повторных попыток"
     )
+    llm_max_cost_per_1k: float = Field(
+        default=0.0,
+        description="Потолок стоимости 1000 токенов при выборе провайдера (0 - без ограничения)"
+    )
+    llm_route_cooldown: float = Field(
+        default=30.0,
+        description="Пауза провайдера после ошибки в секундах (удваивается при повторах)"
+    )
+    health_probe_interval: float = Field(
+        default=60.0,
+        description="Интервал фоновой проверки доступности LLM в секундах"
+    )
+    llm_output_format: str = Field(
+        default="text",
+        description="Формат ответа LLM: text (нумерованный список) или json"
+    )
+    llm_json_max_reasks: int = Field(
+        default=1,
+        description="Повторные запросы, если JSON-ответ не удалось исправить локально"
+    )
+    
+    # Настройки анализа
+    rules_prefilter: bool = Field(
+        default=True,
+        description="Передавать находки локальных проверок в промпт LLM"
+    )
+    incremental_analysis: bool = Field(
+        default=False,
+        description="Инкрементальный повторный анализ по изменённым секциям"
+    )
+    incremental_max_change_ratio: float = Field(
+        default=0.5,
+        description="Доля изменённых секций, при превышении которой анализ выполняется полностью"
+    )
+    result_store_dir: str = Field(
+        default="output/.results",
+        description="Директория хранилища результатов анализа"
+    )
+    archive_enabled: bool = Field(
+        default=False,
+        description="Сохранять исходный HTML страниц и диалоги с LLM в сжатый архив"
+    )
+    archive_dir: str = Field(
+        default="output/.archive",
+        description="Директория архива страниц и ответов LLM"
+    )
+    archive_compression: str = Field(
+        default="gzip",
+        description="Сжатие записей архива: gzip или zstd (нужен пакет zstandard)"
+    )
+    archive_segment_mb: float = Field(
+        default=64.0,
+        description="Размер сегмента архива в МБ, после которого начинается новый"
+    )
+    
+    # Настройки веб-сервера
+    web_workers: int = Field(
+        default=1,
+        description="Число процессов-воркеров веб-сервера"
+    )
+    shared_store_path: str = Field(
+        default="output/.shared.sqlite3",
+        description="База SQLite с результатами, общая для воркеров веб-сервера"
+    )
+    shared_store_max_age: float = Field(
+        default=86400.0,
+        description="Срок хранения результатов веб-анализа в секундах (скачивание доступно это время)"
+    )
+    web_result_ttl: float = Field(
+        default=300.0,
+        description="Сколько секунд повторный запрос того же URL и роли получает готовый результат (0 - всегда заново)"
+    )
+    warmup_enabled: bool = Field(
+        default=True,
+        description="Прогрев веб-приложения при запуске (импорты, шаблоны, токен LLM, пулы соединений)"
+    )
+    warmup_urls: str = Field(
+        default="",
+        description="Адреса через запятую, соединения с которыми открываются при прогреве"
+    )
     
     # Настройки вывода
     max_text_length: int = Field(
         default=10000,
-        description="Максимальная длина текста для анализа"
+        description="Максимальная длина текста для анализа в символах"
+    )
+    max_text_tokens: int = Field(
+        default=3000,
+        description="Максимальный объём текста страницы в промпте, в оценочных токенах"
+    )
+    output_dir: str = Field(
+        default="output",
+        description="Директория файловых отчётов веб-сервера"
+    )
+    output_max_age_days: float = Field(
+        default=30.0,
+        description="Срок хранения отчётов в днях (0 - без ограничения)"
+    )
+    output_max_total_mb: float = Field(
+        default=500.0,
+        description="Наибольший общий размер отчётов в МБ (0 - без ограничения)"
+    )
+    output_max_files: int = Field(
+        default=1000,
+        description="Наибольшее число файлов отчётов (0 - без ограничения)"
+    )
+    output_sweep_interval: float = Field(
+        default=3600.0,
+        description="Интервал фоновой очистки отчётов и хранилища результатов (сек)"
+    )
+    output_content_addressed: bool = Field(
+        default=False,
+        description="Именовать отчёты по хэшу содержимого: одинаковые отчёты хранятся одним файлом"
+    )
+    output_fsync_every: int = Field(
+        default=50,
+        description="Записей отчёта между синхронизациями файла с диском (0 - без fsync)"
+    )
+    output_fsync_interval: float = Field(
+        default=5.0,
+        description="Наибольший интервал между синхронизациями файла отчёта с диском (сек)"
     )
     
     # Общие настройки
@@ -2,6 +2,8 @@
 Кастомные исключения приложения.
 """
 
+from typing import Optional
+
 
 class LandingAssistantError(Exception):
     """Базовое исключение приложения."""
@@ -9,10 +11,26 @@ class LandingAssistantError(Exception):
 
 
 class ScraperError(LandingAssistantError):
-    """Ошибка при парсинге страницы."""
+    """
+    Ошибка при парсинге страницы.
+    
+    status_code - код HTTP-ответа, kind - вид ошибки без ответа
+    ("dns", "connect", "timeout"), retry_after - пауза из Retry-After.
+    """
     
-    def __init__(self, message: str, url: str = ""):
+    def __init__(
+        self,
+        message: str,
+        url: str = "",
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        kind: str = ""
+    ):
+        self.reason = message
         self.url = url
+        self.kind = kind
+        self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(f"Ошибка парсинга{f' ({url})' if url else ''}: {message}")
 
 
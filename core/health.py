@@ -0,0 +1,148 @@
+"""
+Проверка доступности LLM-провайдера для liveness/readiness.
+
+Проверки идут по возрастанию стоимости:
+1. действующий токен доступа в кэше клиента (без сети);
+2. лёгкий запрос провайдера (список моделей), без генерации;
+3. фоновый поток повторяет запрос 2 с интервалом, а эндпоинты
+   отдают последний результат мгновенно.
+
+Запрос к модели ради проверки не выполняется никогда.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from core.config import settings
+from core.interfaces import BaseLLMProvider
+
+
+logger = logging.getLogger(__name__)
+
+# Сколько интервалов проверки результат считается свежим
+STALE_AFTER_INTERVALS = 2
+
+
+@dataclass(frozen=True)
+class HealthStatus:
+    """Результат проверки доступности провайдера."""
+    
+    ok: Optional[bool]  # None - проверка ещё не выполнялась
+    source: str  # "probe", "token" или "none"
+    checked_at: Optional[float] = None  # time.monotonic() момента проверки
+    latency: Optional[float] = None  # Длительность проверки в секундах
+    
+    @property
+    def age(self) -> Optional[float]:
+        """Возраст результата в секундах."""
+        return None if self.checked_at is None else time.monotonic() - self.checked_at
+    
+    def to_dict(self) -> dict:
+        """Представление для JSON-ответа."""
+        age = self.age
+        return {
+            "ok": self.ok,
+            "source": self.source,
+            "age": None if age is None else round(age, 1),
+            "latency": None if self.latency is None else round(self.latency, 3),
+        }
+
+
+UNKNOWN = HealthStatus(ok=None, source="none")
+
+
+class HealthMonitor:
+    """
+    Фоновая проверка доступности LLM-провайдера.
+    
+    status() не обращается к сети и не блокируется: возвращает
+    кэшированный результат фоновой проверки, а если он устарел -
+    результат проверки токена или будит фоновый поток.
+    """
+    
+    def __init__(self, provider: BaseLLMProvider, interval: Optional[float] = None):
+        """
+        Инициализация монитора.
+        
+        Args:
+            provider: Проверяемый LLM-провайдер
+            interval: Интервал фоновой проверки в секундах
+        """
+        self.provider = provider
+        self.interval = interval or settings.health_probe_interval
+        self._last = UNKNOWN
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Запустить фоновую проверку (первая выполняется сразу)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="llm-health", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Остановить фоновую проверку."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+    
+    def probe(self) -> HealthStatus:
+        """
+        Выполнить лёгкую проверку провайдера и запомнить результат.
+        
+        Returns:
+            Результат проверки
+        """
+        started = time.monotonic()
+        try:
+            ok = self.provider.is_available()
+        except Exception as e:
+            logger.warning(f"Проверка LLM завершилась ошибкой: {e}")
+            ok = False
+        finished = time.monotonic()
+        
+        # В лог попадает только смена состояния, а не каждая проверка
+        if ok != self._last.ok:
+            if ok:
+                logger.info("LLM-провайдер доступен")
+            else:
+                logger.warning("LLM-провайдер недоступен")
+        self._last = HealthStatus(ok=ok, source="probe", checked_at=finished, latency=finished - started)
+        return self._last
+    
+    def status(self) -> HealthStatus:
+        """
+        Текущее состояние провайдера без ожидания сети.
+        
+        Returns:
+            Свежий результат фоновой проверки; при устаревшем -
+            успешный результат по действующему токену, иначе
+            последний известный результат
+        """
+        last = self._last
+        age = last.age
+        if age is not None and age <= self.interval * STALE_AFTER_INTERVALS:
+            return last
+            
+        if self.provider.has_valid_token():
+            return HealthStatus(ok=True, source="token", checked_at=time.monotonic())
+            
+        # Результат устарел (например, поток завис на сетевом таймауте):
+        # просим внеочередную проверку и отдаём то, что есть
+        self._wake.set()
+        return last
+    
+    def _run(self) -> None:
+        """Цикл фоновой проверки."""
+        while not self._stop.is_set():
+            self.probe()
+            self._wake.wait(self.interval)
+            self._wake.clear()
@@ -5,10 +5,20 @@
 Это обеспечивает единый интерфейс и возможность замены модулей.
 """
 
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
 
-from core.models import PageContent, AnalysisResult, Recommendation
+from core.config import settings
+from core.json_output import build_json_instruction, parse_json_recommendations
+from core.models import PageContent, PageSection, AnalysisResult, Recommendation
+from core.recommendation_parser import RecommendationParser
+from core.sections import diff_sections, link_recommendations
+from core.tokens import truncate_to_tokens
+
+
+logger = logging.getLogger(__name__)
 
 
 class BaseScraper(ABC):
@@ -66,6 +76,61 @@ class BaseScraper(ABC):
         return content
 
 
+class AsyncBaseScraper(ABC):
+    """
+    Базовый класс для асинхронных парсеров веб-страниц.
+    
+    Асинхронный вариант BaseScraper: загрузка выполняется на event loop,
+    что позволяет загружать много страниц параллельно без потоков.
+    """
+    
+    name: str = "Base Async Scraper"
+    description: str = "Базовый асинхронный парсер"
+    
+    @abstractmethod
+    async def fetch(self, url: str) -> str:
+        """
+        Загрузить HTML-код страницы.
+        
+        Args:
+            url: URL страницы для загрузки
+            
+        Returns:
+            HTML-код страницы
+            
+        Raises:
+            ScraperError: При ошибке загрузки
+        """
+        pass
+    
+    @abstractmethod
+    def parse(self, html: str, url: str = "") -> PageContent:
+        """
+        Извлечь контент из HTML.
+        
+        Args:
+            html: HTML-код страницы
+            url: URL страницы (опционально)
+            
+        Returns:
+            PageContent с извлечённым контентом
+        """
+        pass
+    
+    async def fetch_and_parse(self, url: str) -> PageContent:
+        """
+        Загрузить и распарсить страницу.
+        
+        Args:
+            url: URL страницы
+            
+        Returns:
+            PageContent с контентом страницы
+        """
+        html = await self.fetch(url)
+        return self.parse(html, url=url)
+
+
 class BaseLLMProvider(ABC):
     """
     Базовый класс для LLM-провайдеров.
@@ -101,15 +166,62 @@ class BaseLLMProvider(ABC):
         """
         pass
     
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> Iterator[str]:
+        """
+        Отправить запрос к LLM и получать ответ по частям.
+        
+        По умолчанию ответ отдаётся целиком одним фрагментом;
+        провайдеры с потоковым API переопределяют метод.
+        
+        Args:
+            system_prompt: Системный промпт (роль)
+            user_prompt: Пользовательский промпт (контент)
+            temperature: Температура генерации (0.0-1.0)
+            max_tokens: Максимальное количество токенов в ответе
+            
+        Yields:
+            Фрагменты ответа в порядке генерации
+            
+        Raises:
+            LLMError: При ошибке вызова API
+        """
+        yield self.call(system_prompt, user_prompt, temperature, max_tokens)
+    
     @abstractmethod
     def is_available(self) -> bool:
         """
         Проверить доступность провайдера.
         
+        Проверка должна быть лёгкой (список моделей, авторизация),
+        без генерации ответа: она вызывается фоновым мониторингом.
+        
         Returns:
             True если провайдер доступен
         """
         pass
+    
+    def has_valid_token(self) -> Optional[bool]:
+        """
+        Проверить кэшированный токен доступа без сетевых запросов.
+        
+        Returns:
+            True если токен получен и не истёк, False если нет,
+            None если провайдер не использует токены
+        """
+        return None
+    
+    def warm_up(self) -> None:
+        """
+        Подготовить провайдер к первому запросу (клиент, токен, соединения).
+        
+        По умолчанию ничего не делает. Генерацию не запускает.
+        """
 
 
 class BaseAnalyzer(ABC):
@@ -122,6 +234,7 @@ class BaseAnalyzer(ABC):
     name: str = "Base Analyzer"
     description: str = "Базовый анализатор"
     is_premium: bool = False  # Платный ли модуль
+    requires_llm: bool = True  # Нужен ли LLM-провайдер
     
     def __init__(self, llm_provider: BaseLLMProvider):
         """
@@ -155,48 +268,291 @@ class BaseAnalyzer(ABC):
         """
         pass
     
-    def analyze(self, content: PageContent) -> AnalysisResult:
+    def analyze(
+        self,
+        content: PageContent,
+        known_issues: Optional[List[Recommendation]] = None,
+        on_recommendation: Optional[Callable[[Recommendation], None]] = None
+    ) -> AnalysisResult:
         """
         Провести анализ контента.
         
         Args:
             content: Контент страницы для анализа
+            known_issues: Проблемы, уже найденные локальными проверками
+            on_recommendation: Вызывается для каждой рекомендации, как только
+                она полностью получена из потока ответа LLM
             
         Returns:
             Результат анализа с рекомендациями
         """
+        if content.is_empty_shell:
+            # Текста нет - запрос к LLM потратил бы токены впустую
+            logger.warning(f"{self.name}: пропуск LLM, страница без текста ({content.url})")
+            return AnalysisResult(
+                module_name=self.name,
+                module_description=self.description,
+                url=content.url
+            )
+            
         system_prompt = self.get_system_prompt()
-        user_prompt = self._build_user_prompt(content)
+        user_prompt = self._build_user_prompt(content, known_issues)
+        
+        response, recommendations = self._request_recommendations(
+            system_prompt, user_prompt, on_recommendation
+        )
+        link_recommendations(recommendations, content.sections)
         
+        return AnalysisResult(
+            module_name=self.name,
+            module_description=self.description,
+            url=content.url,
+            recommendations=recommendations,
+            raw_response=response,
+            section_fingerprints={s.key: s.fingerprint for s in content.sections}
+        )
+    
+    def _request_recommendations(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_recommendation: Optional[Callable[[Recommendation], None]] = None
+    ) -> Tuple[str, List[Recommendation]]:
+        """
+        Запросить у LLM рекомендации в формате settings.llm_output_format.
+        
+        Args:
+            system_prompt: Системный промпт
+            user_prompt: Пользовательский промпт
+            on_recommendation: Обработчик готовой рекомендации
+            
+        Returns:
+            Кортеж (сырой ответ, рекомендации)
+        """
+        if settings.llm_output_format == "json":
+            return self._request_json(system_prompt, user_prompt, on_recommendation)
+            
+        if on_recommendation is None:
+            response = self.llm_provider.call(system_prompt, user_prompt)
+        else:
+            response = self._stream_response(system_prompt, user_prompt, on_recommendation)
+        return response, self.parse_response(response)
+    
+    def _request_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_recommendation: Optional[Callable[[Recommendation], None]] = None
+    ) -> Tuple[str, List[Recommendation]]:
+        """
+        Запросить рекомендации в формате JSON.
+        
+        Некорректный JSON сначала исправляется локально; повторный запрос
+        выполняется только если это не помогло. Если JSON так и не получен,
+        ответ разбирается как текст.
+        
+        Args:
+            system_prompt: Системный промпт
+            user_prompt: Пользовательский промпт
+            on_recommendation: Обработчик готовой рекомендации
+            
+        Returns:
+            Кортеж (сырой ответ, рекомендации)
+        """
+        system_prompt += build_json_instruction()
         response = self.llm_provider.call(system_prompt, user_prompt)
-        recommendations = self.parse_response(response)
+        recommendations = parse_json_recommendations(response)
+        
+        for _ in range(settings.llm_json_max_reasks):
+            if recommendations is not None:
+                break
+            logger.warning(f"{self.name}: ответ не является корректным JSON, повторный запрос")
+            response = self.llm_provider.call(
+                system_prompt,
+                user_prompt + "\n\nПредыдущий ответ не удалось разобрать. "
+                "Верни только JSON-массив рекомендаций, без другого текста."
+            )
+            recommendations = parse_json_recommendations(response)
+            
+        if recommendations is None:
+            recommendations = self.parse_response(response)
+        if on_recommendation is not None:
+            for recommendation in recommendations:
+                on_recommendation(recommendation)
+        return response, recommendations
+    
+    def _stream_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_recommendation: Callable[[Recommendation], None]
+    ) -> str:
+        """
+        Получить ответ LLM потоком, сообщая о готовых рекомендациях.
+        
+        Args:
+            system_prompt: Системный промпт
+            user_prompt: Пользовательский промпт
+            on_recommendation: Обработчик готовой рекомендации
+            
+        Returns:
+            Полный текст ответа
+        """
+        parser = RecommendationParser()
+        chunks: List[str] = []
+        
+        for chunk in self.llm_provider.stream(system_prompt, user_prompt):
+            chunks.append(chunk)
+            for recommendation in parser.feed(chunk):
+                on_recommendation(recommendation)
+        for recommendation in parser.close():
+            on_recommendation(recommendation)
+            
+        return "".join(chunks)
+    
+    def analyze_incremental(
+        self,
+        content: PageContent,
+        previous: Optional[AnalysisResult],
+        known_issues: Optional[List[Recommendation]] = None,
+        max_change_ratio: float = 0.5
+    ) -> AnalysisResult:
+        """
+        Повторно проанализировать страницу с учётом предыдущего результата.
+        
+        Рекомендации, привязанные к неизменённым секциям, переиспользуются,
+        а LLM получает только изменённые секции. Если страница не изменилась,
+        LLM не вызывается вовсе.
+        
+        Args:
+            content: Контент страницы для анализа
+            previous: Предыдущий результат этого модуля для того же URL
+            known_issues: Проблемы, уже найденные локальными проверками
+            max_change_ratio: Доля изменённых секций, при превышении
+                которой выполняется полный анализ
+                
+        Returns:
+            Результат анализа с рекомендациями
+        """
+        if (previous is None or not previous.section_fingerprints
+                or not content.sections or content.is_empty_shell):
+            return self.analyze(content, known_issues)
+            
+        diff = diff_sections(previous.section_fingerprints, content.sections)
+        fingerprints = {s.key: s.fingerprint for s in content.sections}
+        
+        if not diff.has_changes:
+            return previous.model_copy(update={
+                "analyzed_at": datetime.now(),
+                "section_fingerprints": fingerprints
+            })
+            
+        if diff.change_ratio > max_change_ratio:
+            return self.analyze(content, known_issues)
+            
+        kept = [
+            rec for rec in previous.recommendations
+            if rec.sections and all(key in diff.unchanged for key in rec.sections)
+        ]
+        changed_sections = [s for s in content.sections if s.key in diff.affected]
+        
+        response = ""
+        new_recommendations: List[Recommendation] = []
+        if changed_sections:
+            user_prompt = self._build_delta_prompt(content, changed_sections, kept, known_issues)
+            response, new_recommendations = self._request_recommendations(
+                self.get_system_prompt(), user_prompt
+            )
+            link_recommendations(new_recommendations, content.sections)
+            
+        recommendations = [
+            rec.model_copy(update={"number": number})
+            for number, rec in enumerate((kept + new_recommendations)[:10], start=1)
+        ]
         
         return AnalysisResult(
             module_name=self.name,
             module_description=self.description,
             url=content.url,
             recommendations=recommendations,
-            raw_response=response
+            raw_response=response or previous.raw_response,
+            section_fingerprints=fingerprints
         )
     
-    def _build_user_prompt(self, content: PageContent) -> str:
+    def _build_user_prompt(
+        self,
+        content: PageContent,
+        known_issues: Optional[List[Recommendation]] = None
+    ) -> str:
         """
         Построить пользовательский промпт.
         
         Args:
             content: Контент страницы
+            known_issues: Проблемы, уже найденные локальными проверками
             
         Returns:
             Промпт для анализа
         """
-        return f"""Проанализируй следующий лендинг:
+        prompt = f"""Проанализируй следующий лендинг:
 
 URL: {content.url}
 Заголовок: {content.title or 'Не определён'}
 
 Содержимое страницы:
-{content.text[:10000]}  # Ограничиваем длину
+{truncate_to_tokens(content.text, settings.max_text_tokens)}
 """
+        if known_issues:
+            issues = "\n".join(f"- {issue.title}" for issue in known_issues)
+            prompt += f"""
+Автоматическая проверка уже выявила следующие проблемы (не повторяй их, сосредоточься на остальном):
+{issues}
+"""
+        return prompt
+    
+    def _build_delta_prompt(
+        self,
+        content: PageContent,
+        changed_sections: List[PageSection],
+        kept: List[Recommendation],
+        known_issues: Optional[List[Recommendation]] = None
+    ) -> str:
+        """
+        Построить промпт только по изменённым секциям страницы.
+        
+        Args:
+            content: Контент страницы
+            changed_sections: Изменённые и новые секции
+            kept: Рекомендации, которые остаются в силе
+            known_issues: Проблемы, уже найденные локальными проверками
+            
+        Returns:
+            Промпт для анализа изменений
+        """
+        blocks = "\n\n".join(
+            f"### {section.heading or 'Вводный блок'}\n{section.text}"
+            for section in changed_sections
+        )
+        prompt = f"""Лендинг был проанализирован ранее, после чего клиент изменил часть блоков.
+Проанализируй только изменённые блоки.
+
+URL: {content.url}
+Заголовок: {content.title or 'Не определён'}
+
+Изменённые блоки:
+{truncate_to_tokens(blocks, settings.max_text_tokens)}
+"""
+        excluded = list(kept) + list(known_issues or [])
+        if excluded:
+            titles = "\n".join(f"- {rec.title}" for rec in excluded)
+            prompt += f"""
+Эти рекомендации уже даны и остаются в силе (не повторяй их):
+{titles}
+"""
+        prompt += f"""
+Дай не более {max(1, 5 - len(kept))} рекомендаций в прежнем формате.
+"""
+        return prompt
 
 
 class BaseOutput(ABC):
@@ -210,22 +566,28 @@ class BaseOutput(ABC):
     description: str = "Базовый вывод"
     
     @abstractmethod
-    def output(self, result: AnalysisResult) -> None:
+    def output(self, result: AnalysisResult) -> Optional[str]:
         """
         Вывести результат анализа.
         
         Args:
             result: Результат анализа для вывода
+            
+        Returns:
+            Путь к сохранённому файлу или None, если вывод не пишет в файл
         """
         pass
     
     @abstractmethod
-    def output_full(self, results: List[AnalysisResult]) -> None:
+    def output_full(self, results: List[AnalysisResult]) -> Optional[str]:
         """
         Вывести результаты от нескольких модулей.
         
         Args:
             results: Список результатов анализа
+            
+        Returns:
+            Путь к сохранённому файлу или None, если вывод не пишет в файл
         """
         pass
 
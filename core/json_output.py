@@ -0,0 +1,179 @@
+"""
+Структурированный ответ LLM в формате JSON.
+
+Анализатор просит LLM вернуть массив рекомендаций по схеме Recommendation.
+Ответ разбирается быстрым декодером (orjson, если установлен), а типичные
+дефекты - Markdown-обёртка, пояснения вокруг JSON, висячие запятые,
+обрезанный по лимиту токенов хвост - исправляются локально, без повторного
+запроса к LLM.
+"""
+
+import json
+import logging
+from typing import Any, List, Optional
+
+from core.models import Recommendation
+from core.recommendation_parser import DEFAULT_PRIORITY, PRIORITY_VALUES
+
+try:
+    import orjson
+except ImportError:  # orjson не обязателен, используется стандартный json
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# Текстовые поля схемы Recommendation, которые заполняет LLM
+JSON_TEXT_FIELDS = ("title", "description")
+
+# Парные скобки JSON
+OPENING = {"[": "]", "{": "}"}
+CLOSING = set(OPENING.values())
+
+
+def build_json_instruction() -> str:
+    """
+    Построить инструкцию о формате ответа по схеме Recommendation.
+    
+    Returns:
+        Текст, добавляемый в конец системного промпта
+    """
+    fields = Recommendation.model_fields
+    example = ", ".join(f'"{name}": "{fields[name].description}"' for name in JSON_TEXT_FIELDS)
+    return f"""
+
+ВАЖНО: вместо текстового формата, описанного выше, верни ответ строго в формате JSON - массив объектов без пояснений и Markdown-разметки:
+[{{{example}, "priority": "high | medium | low"}}]"""
+
+
+def _decode(text: str) -> Any:
+    """Декодировать JSON (None, если текст не является корректным JSON)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            pass
+    try:
+        # strict=False допускает переводы строк внутри строковых значений
+        return json.loads(text, strict=False)
+    except ValueError:
+        return None
+
+
+def repair_json(text: str) -> str:
+    """
+    Исправить типичные дефекты JSON в ответе LLM.
+    
+    Текст просматривается один раз со стеком скобок с учётом строк и
+    экранирования, поэтому скобки и запятые внутри значений не мешают
+    разбору.
+    
+    Args:
+        text: Сырой ответ LLM
+        
+    Returns:
+        Первое JSON-значение ответа без обёртки, пояснений и висячих
+        запятых; обрезанный ответ укорачивается до последнего целого
+        элемента, а незакрытые скобки закрываются
+    """
+    starts = [index for index in (text.find("["), text.find("{")) if index >= 0]
+    if not starts:
+        return text
+    
+    out: List[str] = []
+    stack: List[str] = []  # Ожидаемые закрывающие скобки
+    checkpoint: Optional[tuple] = None  # (длина out, стек) после целого элемента
+    comma: Optional[int] = None  # Позиция запятой, после которой только пробелы
+    in_string = escaped = False
+        
+    for char in text[min(starts):]:
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+            
+        if char in CLOSING:
+            if not stack or char != stack[-1]:
+                break
+            if comma is not None:
+                # Висячая запятая перед закрывающей скобкой
+                del out[comma]
+            comma = None
+            stack.pop()
+            out.append(char)
+            if not stack:
+                return "".join(out)
+            checkpoint = (len(out), list(stack))
+            continue
+            
+        if char == '"':
+            in_string = True
+        elif char in OPENING:
+            stack.append(OPENING[char])
+        if char == ",":
+            comma = len(out)
+        elif not char.isspace():
+            comma = None
+        out.append(char)
+        
+    # Ответ обрезан лимитом токенов: оставляем целые элементы
+    if checkpoint is None:
+        return "".join(out)
+    length, open_brackets = checkpoint
+    return "".join(out[:length]) + "".join(reversed(open_brackets))
+
+
+def _to_recommendations(data: Any, limit: int) -> List[Recommendation]:
+    """Преобразовать декодированный JSON в рекомендации."""
+    if isinstance(data, dict):
+        data = data.get("recommendations", [data])
+    if not isinstance(data, list):
+        return []
+        
+    recommendations: List[Recommendation] = []
+    for item in data:
+        if len(recommendations) >= limit:
+            break
+        if not isinstance(item, dict):
+            continue
+        title = str(item.get("title") or "").strip()
+        description = str(item.get("description") or "").strip()
+        if not title or not description:
+            continue
+        priority = PRIORITY_VALUES.get(str(item.get("priority") or "").strip().lower())
+        recommendations.append(Recommendation(
+            number=len(recommendations) + 1,
+            title=title,
+            description=description,
+            priority=priority or DEFAULT_PRIORITY
+        ))
+    return recommendations
+
+
+def parse_json_recommendations(response: str, limit: int = 5) -> Optional[List[Recommendation]]:
+    """
+    Распарсить JSON-ответ LLM в список рекомендаций.
+    
+    Сначала ответ декодируется как есть, при ошибке - после локального
+    исправления.
+    
+    Args:
+        response: Сырой ответ LLM
+        limit: Максимальное количество рекомендаций
+        
+    Returns:
+        Список рекомендаций или None, если ответ не удалось разобрать
+    """
+    data = _decode(response)
+    if data is None:
+        data = _decode(repair_json(response))
+        if data is not None:
+            logger.info("JSON-ответ LLM исправлен локально")
+            
+    recommendations = _to_recommendations(data, limit) if data is not None else []
+    return recommendations or None
@@ -0,0 +1,33 @@
+"""
+Ленивый экспорт имён из пакетов.
+
+Пакеты объявляют, из какого модуля берётся каждое имя, а импорт модуля
+выполняется при первом обращении (PEP 562). Это сокращает время запуска
+CLI: `--help` и меню не загружают pydantic, bs4, httpx и SDK GigaChat.
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Построить функцию __getattr__ для пакета.
+    
+    Args:
+        package: Имя пакета (__name__)
+        exports: Экспортируемое имя -> модуль, в котором оно определено
+        
+    Returns:
+        Функция __getattr__ модуля пакета
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name]), name)
+        # Следующие обращения идут напрямую, минуя __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+        
+    return __getattr__
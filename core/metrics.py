@@ -0,0 +1,50 @@
+"""
+Счётчики событий процесса.
+
+Простые потокобезопасные счётчики (например, подавленные загрузки
+кэша ошибок). Значения живут в памяти процесса: в веб-сервере с
+несколькими воркерами у каждого воркера свои счётчики.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict
+
+
+_counters: Counter = Counter()
+_lock = threading.Lock()
+
+
+def increment(name: str, value: int = 1) -> None:
+    """
+    Увеличить счётчик.
+    
+    Args:
+        name: Имя счётчика (через точку, например scraper.negative_cache.suppressed)
+        value: Приращение
+    """
+    with _lock:
+        _counters[name] += value
+
+
+def get(name: str) -> int:
+    """Текущее значение счётчика (0, если событий не было)."""
+    with _lock:
+        return _counters[name]
+
+
+def snapshot() -> Dict[str, int]:
+    """
+    Получить значения всех счётчиков.
+    
+    Returns:
+        Словарь имя -> значение, отсортированный по имени
+    """
+    with _lock:
+        return dict(sorted(_counters.items()))
+
+
+def reset() -> None:
+    """Обнулить все счётчики."""
+    with _lock:
+        _counters.clear()
@@ -5,18 +5,75 @@ Pydantic-модели для типизации и валидации данны
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 
 
+class PageStructure(BaseModel):
+    """Структурные признаки страницы для локальных проверок."""
+    
+    meta_description: Optional[str] = Field(None, description="Meta description")
+    h1_count: int = Field(default=0, description="Количество заголовков H1")
+    headings: List[str] = Field(
+        default_factory=list,
+        description="Заголовки H1-H3 в порядке следования"
+    )
+    cta_count: int = Field(default=0, description="Количество кнопок и CTA-ссылок")
+    images_total: int = Field(default=0, description="Количество изображений")
+    images_without_alt: int = Field(
+        default=0,
+        description="Количество изображений без атрибута alt"
+    )
+    longest_block_length: int = Field(
+        default=0,
+        description="Длина самого длинного текстового блока (символов)"
+    )
+    word_count: int = Field(default=0, description="Количество слов на странице")
+    markup_known: bool = Field(
+        default=True,
+        description="Признаки разметки (заголовки, CTA, изображения, блоки) известны; "
+                    "False, если текст восстановлен из встроенных данных без разметки"
+    )
+
+
+class PageSection(BaseModel):
+    """Смысловая секция страницы (блок под заголовком)."""
+    
+    key: str = Field(..., description="Стабильный ключ секции")
+    heading: Optional[str] = Field(None, description="Заголовок секции")
+    text: str = Field(default="", description="Текст секции")
+    fingerprint: str = Field(..., description="Хэш содержимого секции")
+
+
 class PageContent(BaseModel):
     """Содержимое веб-страницы."""
     
     url: str = Field(..., description="URL страницы")
     title: Optional[str] = Field(None, description="Заголовок страницы")
     text: str = Field(..., description="Текстовое содержимое")
-    html: Optional[str] = Field(None, description="HTML-код (опционально)")
+    html: Optional[str] = Field(
+        None,
+        exclude=True,
+        repr=False,
+        description="Исходный HTML-код (только при KEEP_RAW_HTML, не сериализуется)"
+    )
+    structure: Optional[PageStructure] = Field(
+        None,
+        description="Структурные признаки страницы"
+    )
+    sections: List[PageSection] = Field(
+        default_factory=list,
+        description="Секции страницы с отпечатками содержимого"
+    )
+    text_source: str = Field(
+        default="html",
+        description="Источник текста: html, snapshot, next_data, nuxt, noscript"
+    )
+    is_empty_shell: bool = Field(
+        default=False,
+        description="Страница - пустой SPA-каркас без текста для анализа"
+    )
     fetched_at: datetime = Field(
         default_factory=datetime.now,
         description="Время загрузки"
@@ -43,6 +100,10 @@ class Recommendation(BaseModel):
         None, 
         description="Приоритет: high, medium, low"
     )
+    sections: List[str] = Field(
+        default_factory=list,
+        description="Ключи секций страницы, к которым относится рекомендация"
+    )
     
     class Config:
         json_schema_extra = {
@@ -77,6 +138,10 @@ class AnalysisResult(BaseModel):
         None,
         description="Использовано токенов"
     )
+    section_fingerprints: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Отпечатки секций страницы на момент анализа"
+    )
     
     @property
     def recommendations_count(self) -> int:
@@ -0,0 +1,203 @@
+"""
+Разбор ответа LLM в список рекомендаций.
+
+Ответ читается построчно за один линейный проход, поэтому парсер
+работает и на потоке токенов: рекомендация отдаётся, как только
+начинается следующая или поток заканчивается.
+"""
+
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from core.models import Recommendation
+
+
+logger = logging.getLogger(__name__)
+
+# Начало рекомендации: номер в начале строки, допускаются Markdown-заголовок
+# и жирный шрифт ("1. Заголовок", "## 2) Заголовок", "**3. Заголовок**").
+# Строки с отступом - вложенные списки внутри описания
+ITEM_PATTERN = re.compile(r"^(?:#{1,6}\s*)?(\*\*|__)?(\d{1,2})[.)](?!\d)\s*(.*)$")
+
+# Маркер приоритета: "[высокий]", "(приоритет: низкий)", "Priority: high"
+PRIORITY_PATTERN = re.compile(
+    r"[\[(]\s*(?:(?:приоритет|priority)\s*[:\-—]\s*)?"
+    r"(высокий|средний|низкий|high|medium|low)\s*[\])]|"
+    r"(?:приоритет|priority)\s*[:\-—]\s*(высокий|средний|низкий|high|medium|low)\b",
+    re.IGNORECASE
+)
+
+PRIORITY_VALUES = {
+    "высокий": "high",
+    "средний": "medium",
+    "низкий": "low",
+    "high": "high",
+    "medium": "medium",
+    "low": "low",
+}
+
+# Разделитель заголовка и описания в одной строке: "**Заголовок**: описание"
+INLINE_TITLE_PATTERN = re.compile(r"^(?:\*\*|__)(.+?)(?:\*\*|__)\s*[:.\-—]?\s*(.*)$")
+
+DEFAULT_PRIORITY = "medium"
+
+
+def _extract_priority(text: str) -> Tuple[str, Optional[str]]:
+    """Убрать маркер приоритета из текста и вернуть его значение."""
+    match = PRIORITY_PATTERN.search(text)
+    if not match:
+        return text, None
+    value = (match.group(1) or match.group(2)).lower()
+    text = (text[:match.start()] + text[match.end():]).strip(" \t:-—")
+    return text, PRIORITY_VALUES[value]
+
+
+def _strip_markup(text: str) -> str:
+    """Убрать Markdown-выделение по краям строки."""
+    return text.strip().strip("*_#").strip()
+
+
+class RecommendationParser:
+    """
+    Потоковый парсер рекомендаций.
+    
+    Текст подаётся частями через feed(), завершённые рекомендации
+    возвращаются сразу. Нумерация в результате сквозная, независимо
+    от номеров в ответе LLM.
+    """
+    
+    def __init__(self, limit: int = 5):
+        """
+        Инициализация парсера.
+        
+        Args:
+            limit: Максимальное количество рекомендаций
+        """
+        self.limit = limit
+        self.recommendations: List[Recommendation] = []
+        
+        self._buffer = ""
+        self._title: Optional[str] = None
+        self._lines: List[str] = []
+        self._priority: Optional[str] = None
+        self._expected: Optional[int] = None
+    
+    def feed(self, chunk: str) -> List[Recommendation]:
+        """
+        Передать очередную часть ответа.
+        
+        Args:
+            chunk: Фрагмент текста (токен, строка или весь ответ)
+            
+        Returns:
+            Рекомендации, завершённые этим фрагментом
+        """
+        self._buffer += chunk
+        if "\n" not in chunk:
+            return []
+            
+        *lines, self._buffer = self._buffer.split("\n")
+        completed: List[Recommendation] = []
+        for line in lines:
+            self._feed_line(line, completed)
+        return completed
+    
+    def close(self) -> List[Recommendation]:
+        """
+        Завершить разбор после окончания ответа.
+        
+        Returns:
+            Рекомендации, завершённые концом ответа
+        """
+        completed: List[Recommendation] = []
+        if self._buffer:
+            self._feed_line(self._buffer, completed)
+            self._buffer = ""
+        self._finish_item(completed)
+        return completed
+    
+    def _feed_line(self, line: str, completed: List[Recommendation]) -> None:
+        """Обработать одну строку ответа."""
+        match = ITEM_PATTERN.match(line)
+        if match:
+            bold, number, header = match.group(1) or "", int(match.group(2)), match.group(3)
+            # Номер, не продолжающий список, - часть описания ("1." внутри пункта 3)
+            if self._expected is None or number == self._expected:
+                self._finish_item(completed)
+                # Выделение, открытое до номера, возвращается заголовку:
+                # "**3. Заголовок**: описание" разбирается как "**Заголовок**: описание"
+                self._start_item(bold + header)
+                self._expected = number + 1
+                return
+                
+        if self._title is not None:
+            text, priority = _extract_priority(line)
+            if priority:
+                self._priority = self._priority or priority
+                if not text:
+                    return
+                line = text
+            self._lines.append(line.rstrip())
+    
+    def _start_item(self, header: str) -> None:
+        """Начать новую рекомендацию по строке с номером."""
+        header, self._priority = _extract_priority(header.strip())
+        description = ""
+        inline = INLINE_TITLE_PATTERN.match(header)
+        if inline:
+            header, description = inline.group(1), inline.group(2)
+            
+        self._title = _strip_markup(header)
+        self._lines = [description] if description else []
+    
+    def _finish_item(self, completed: List[Recommendation]) -> None:
+        """Завершить текущую рекомендацию."""
+        if self._title is None:
+            return
+        title, description = self._title, "\n".join(self._lines).strip()
+        self._title, self._lines = None, []
+        
+        if not title or not description or len(self.recommendations) >= self.limit:
+            return
+        recommendation = Recommendation(
+            number=len(self.recommendations) + 1,
+            title=title,
+            description=description,
+            priority=self._priority or DEFAULT_PRIORITY
+        )
+        self.recommendations.append(recommendation)
+        completed.append(recommendation)
+
+
+def parse_recommendations(
+    response: str,
+    fallback_title: str = "Рекомендации",
+    limit: int = 5
+) -> List[Recommendation]:
+    """
+    Распарсить полный ответ LLM в список рекомендаций.
+    
+    Args:
+        response: Сырой ответ от LLM
+        fallback_title: Заголовок единственной рекомендации,
+            если в ответе не найден нумерованный список
+        limit: Максимальное количество рекомендаций
+        
+    Returns:
+        Список рекомендаций (хотя бы одна, если ответ не пустой)
+    """
+    parser = RecommendationParser(limit=limit)
+    parser.feed(response)
+    parser.close()
+    
+    if not parser.recommendations and response.strip():
+        logger.warning("Не удалось распарсить ответ, сохраняем как есть")
+        return [Recommendation(
+            number=1,
+            title=fallback_title,
+            description=response.strip(),
+            priority=DEFAULT_PRIORITY
+        )]
+    return parser.recommendations
+
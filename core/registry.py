@@ -0,0 +1,264 @@
+"""
+Реестр модулей анализа.
+
+Названия и описания модулей доступны без импорта их реализаций:
+меню CLI, справка и веб-форма не загружают LLM-провайдер и парсеры.
+Класс анализатора импортируется только при запуске анализа.
+
+Кроме встроенных модулей реестр подключает внешние:
+- пакеты, объявившие entry point в группе "landing_assistant.analyzers"
+  (значение - объект AnalyzerInfo в лёгком модуле метаданных либо сам
+  класс анализатора);
+- JSON-файл из переменной окружения ANALYZERS_CONFIG
+  (по умолчанию analyzers.json в текущей директории).
+
+Файл читается без core.config: реестр нужен ещё до загрузки настроек.
+Формат файла - список описаний модулей:
+[{"key": "seo", "name": "SEO-аудитор", "description": "...",
+  "target": "my_package.seo:SEOAnalyzer", "requires_llm": false},
+ {"key": "content", "enabled": false}]
+
+Какие модули запускаются, решает реестр (role_keys): модули-префильтры
+(встроенная экспресс-проверка) - для любой роли, остальные - по ключу
+роли или для 'all'. Отключённый в конфигурации модуль не запускается.
+"""
+
+import json
+import logging
+import os
+import threading
+from importlib import import_module
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "landing_assistant.analyzers"
+CONFIG_ENV = "ANALYZERS_CONFIG"
+DEFAULT_CONFIG_PATH = "analyzers.json"
+
+# Роль "all" запускает все модули
+ALL_ROLE = "all"
+
+
+class AnalyzerInfo(NamedTuple):
+    """
+    Описание модуля анализа.
+    
+    NamedTuple вместо dataclass: модуль импортируется при каждом
+    запуске CLI, а dataclasses тянет за собой inspect.
+    """
+    
+    key: str
+    name: str
+    description: str
+    target: str  # "модуль:Класс" реализации
+    premium: bool = False
+    requires_llm: bool = True
+    icon: str = ""
+    prefilter: bool = False  # Запускается для любой роли, находки передаются в промпт LLM
+    
+    def load(self) -> Type:
+        """
+        Импортировать класс анализатора.
+        
+        Returns:
+            Класс, унаследованный от BaseAnalyzer
+        """
+        module_name, class_name = self.target.split(":")
+        return getattr(import_module(module_name), class_name)
+
+
+BUILTIN_ANALYZERS = (
+    AnalyzerInfo(
+        key="ui",
+        name="UI-дизайнер",
+        description="Анализ дизайна и структуры",
+        target="analyzers.ui_designer:UIDesignerAnalyzer",
+        icon="🎨"
+    ),
+    AnalyzerInfo(
+        key="content",
+        name="Контент-менеджер",
+        description="Анализ текстов и копирайтинга",
+        target="analyzers.content_manager:ContentManagerAnalyzer",
+        icon="📝"
+    ),
+    AnalyzerInfo(
+        key="instant",
+        name="Экспресс-проверка",
+        description="Мгновенные локальные проверки без LLM",
+        target="analyzers.rules:RulesAnalyzer",
+        requires_llm=False,
+        icon="⚡",
+        prefilter=True
+    ),
+)
+
+_analyzers: Optional[Dict[str, AnalyzerInfo]] = None
+_instances: Dict[Tuple[str, int], Any] = {}
+_lock = threading.Lock()
+
+
+def _info_from_class(key: str, cls: type, target: str) -> AnalyzerInfo:
+    """Описание модуля по атрибутам класса анализатора."""
+    return AnalyzerInfo(
+        key=key,
+        name=getattr(cls, "name", key),
+        description=getattr(cls, "description", ""),
+        target=target,
+        premium=getattr(cls, "is_premium", False),
+        requires_llm=getattr(cls, "requires_llm", True),
+        prefilter=getattr(cls, "prefilter", False)
+    )
+
+
+def _from_entry_points() -> List[AnalyzerInfo]:
+    """Модули, объявленные установленными пакетами через entry points."""
+    from importlib.metadata import entry_points
+    
+    found = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            value = entry_point.load()
+        except Exception as e:
+            logger.warning(f"Модуль анализа {entry_point.name} не загружен: {e}")
+            continue
+        if isinstance(value, AnalyzerInfo):
+            found.append(value._replace(key=entry_point.name))
+        elif isinstance(value, type):
+            found.append(_info_from_class(entry_point.name, value, entry_point.value))
+        else:
+            logger.warning(f"Entry point {entry_point.name}: ожидается AnalyzerInfo или класс")
+    return found
+
+
+def _from_config_file(analyzers: Dict[str, AnalyzerInfo]) -> None:
+    """Применить описания модулей из JSON-файла конфигурации."""
+    path = os.environ.get(CONFIG_ENV, DEFAULT_CONFIG_PATH)
+    if not os.path.isfile(path):
+        if CONFIG_ENV in os.environ:
+            logger.warning(f"Файл модулей анализа не найден: {path}")
+        return
+        
+    try:
+        with open(path, encoding="utf-8") as file:
+            entries = json.load(file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Файл модулей анализа не прочитан ({path}): {e}")
+        return
+        
+    for entry in entries:
+        key = entry.get("key")
+        if not key:
+            continue
+        if not entry.get("enabled", True):
+            analyzers.pop(key, None)
+            continue
+        base = analyzers.get(key)
+        fields = {name: entry[name] for name in AnalyzerInfo._fields if name in entry}
+        if base is not None:
+            analyzers[key] = base._replace(**fields)
+        elif "target" in fields:
+            fields.setdefault("name", key)
+            fields.setdefault("description", "")
+            analyzers[key] = AnalyzerInfo(**fields)
+        else:
+            logger.warning(f"Модуль анализа {key}: не указан target")
+
+
+def _discover() -> Dict[str, AnalyzerInfo]:
+    """Собрать встроенные и внешние модули анализа."""
+    analyzers = {info.key: info for info in BUILTIN_ANALYZERS}
+    for info in _from_entry_points():
+        analyzers[info.key] = info
+    _from_config_file(analyzers)
+    
+    if ALL_ROLE in analyzers:
+        logger.warning(f"Ключ модуля '{ALL_ROLE}' зарезервирован и пропущен")
+        del analyzers[ALL_ROLE]
+    return analyzers
+
+
+def get_analyzers() -> Dict[str, AnalyzerInfo]:
+    """
+    Получить описания всех доступных модулей анализа.
+    
+    Поиск внешних модулей выполняется один раз за процесс.
+    
+    Returns:
+        Словарь ключ -> AnalyzerInfo в порядке отображения
+    """
+    global _analyzers
+    if _analyzers is None:
+        with _lock:
+            if _analyzers is None:
+                _analyzers = _discover()
+    return _analyzers
+
+
+def role_keys(role: str) -> List[str]:
+    """
+    Ключи модулей, которые запускаются для роли.
+    
+    Модули-префильтры запускаются для любой роли; 'all' запускает все
+    модули. Модули без LLM идут первыми: их находки передаются в промпт
+    LLM-модулей.
+    
+    Args:
+        role: Ключ модуля или 'all'
+        
+    Returns:
+        Список ключей модулей (пустой для неизвестной роли)
+    """
+    analyzers = get_analyzers()
+    if role != ALL_ROLE and role not in analyzers:
+        return []
+    keys = [
+        key for key, info in analyzers.items()
+        if role == ALL_ROLE or key == role or info.prefilter
+    ]
+    return sorted(keys, key=lambda key: analyzers[key].requires_llm)
+
+
+def needs_llm(role: str) -> bool:
+    """Нужен ли LLM-провайдер хотя бы одному модулю роли."""
+    analyzers = get_analyzers()
+    return any(analyzers[key].requires_llm for key in role_keys(role))
+
+
+def role_choices() -> List[str]:
+    """Допустимые значения роли для CLI и веб-формы."""
+    analyzers = get_analyzers()
+    llm_keys = [key for key, info in analyzers.items() if info.requires_llm]
+    local_keys = [key for key, info in analyzers.items() if not info.requires_llm]
+    return llm_keys + [ALL_ROLE] + local_keys
+
+
+def get_analyzer(key: str, llm_provider: Any = None) -> Any:
+    """
+    Получить экземпляр анализатора.
+    
+    Класс импортируется при первом обращении, экземпляры кэшируются
+    для каждой пары (модуль, провайдер). Анализаторы не хранят состояния
+    между вызовами, поэтому один экземпляр разделяется запросами.
+    
+    Args:
+        key: Ключ модуля
+        llm_provider: LLM-провайдер (None для модулей без LLM)
+        
+    Returns:
+        Экземпляр BaseAnalyzer
+        
+    Raises:
+        KeyError: Если модуль с таким ключом не зарегистрирован
+    """
+    # Экземпляр держит ссылку на провайдера, поэтому его id в ключе
+    # не может быть переиспользован, пока запись в кэше
+    cache_key = (key, id(llm_provider))
+    analyzer = _instances.get(cache_key)
+    if analyzer is None:
+        info = get_analyzers()[key]
+        analyzer = info.load()(llm_provider)
+        _instances[cache_key] = analyzer
+    return analyzer
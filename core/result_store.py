@@ -0,0 +1,82 @@
+"""
+Хранилище результатов анализа.
+
+Сохраняет последний результат каждого модуля для каждого URL,
+чтобы повторный анализ мог переиспользовать рекомендации
+по неизменённым секциям страницы.
+"""
+
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from core.config import settings
+from core.models import AnalysisResult
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultStore:
+    """
+    Файловое хранилище результатов анализа.
+    
+    Каждый результат хранится в отдельном JSON-файле,
+    имя которого вычисляется по URL и названию модуля.
+    """
+    
+    def __init__(self, store_dir: Optional[str] = None):
+        """
+        Инициализация хранилища.
+        
+        Args:
+            store_dir: Директория для хранения результатов
+        """
+        self.store_dir = Path(store_dir or settings.result_store_dir)
+    
+    def _path(self, url: str, module_name: str) -> Path:
+        """Путь к файлу результата."""
+        key = hashlib.sha1(f"{url}|{module_name}".encode("utf-8")).hexdigest()
+        return self.store_dir / f"{key}.json"
+    
+    def get(self, url: str, module_name: str) -> Optional[AnalysisResult]:
+        """
+        Получить последний результат модуля для URL.
+        
+        Args:
+            url: Анализируемый URL
+            module_name: Название модуля анализа
+            
+        Returns:
+            AnalysisResult или None, если результата нет
+        """
+        path = self._path(url, module_name)
+        if not path.exists():
+            return None
+            
+        try:
+            return AnalysisResult.model_validate_json(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Не удалось прочитать результат {path}: {e}")
+            return None
+    
+    def put(self, result: AnalysisResult) -> None:
+        """
+        Сохранить результат анализа.
+        
+        Args:
+            result: Результат анализа
+        """
+        path = self._path(result.url, result.module_name)
+        try:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            # Запись через временный файл: параллельный читатель
+            # не увидит недописанный JSON
+            temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+            temp_path.write_text(result.model_dump_json(), encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить результат {path}: {e}")
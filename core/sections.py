@@ -0,0 +1,149 @@
+"""
+Секции страницы: отпечатки содержимого и сравнение версий.
+
+Используется для инкрементального повторного анализа: если клиент изменил
+один блок лендинга, рекомендации по неизменённым блокам берутся из
+предыдущего результата, а LLM анализирует только изменения.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set
+
+from core.models import PageSection, Recommendation
+
+
+# Цитаты в рекомендациях: «...» или "..."
+QUOTE_PATTERN = re.compile(r"[«\"]([^«»\"]{4,})[»\"]")
+
+# Минимальная длина заголовка для поиска упоминаний в рекомендациях
+MIN_HEADING_LENGTH = 4
+
+# Версия отпечатков: повышается при изменении очистки текста секций
+# (core.utils.clean_text), чтобы сохранённые отпечатки не совпадали с
+# новыми частично и повторный анализ шёл по всей странице, а не по
+# секциям, текст которых изменился только из-за новой очистки
+FINGERPRINT_VERSION = 2
+
+
+@dataclass
+class SectionDiff:
+    """Результат сравнения секций двух версий страницы."""
+    
+    unchanged: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    
+    @property
+    def has_changes(self) -> bool:
+        """Есть ли изменения между версиями."""
+        return bool(self.changed or self.added or self.removed)
+    
+    @property
+    def affected(self) -> Set[str]:
+        """Секции новой версии, которые нужно проанализировать заново."""
+        return self.changed | self.added
+    
+    @property
+    def change_ratio(self) -> float:
+        """Доля изменённых секций от общего числа."""
+        total = len(self.unchanged | self.changed | self.added | self.removed)
+        if total == 0:
+            return 0.0
+        return (len(self.changed) + len(self.added) + len(self.removed)) / total
+
+
+def fingerprint_text(text: str) -> str:
+    """
+    Вычислить отпечаток текста секции.
+    
+    Пробелы нормализуются, чтобы переформатирование вёрстки
+    не считалось изменением содержимого.
+    
+    Args:
+        text: Текст секции
+        
+    Returns:
+        Шестнадцатеричный хэш (16 символов)
+    """
+    normalized = f"{FINGERPRINT_VERSION}\0" + " ".join(text.split()).lower()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def make_section_key(heading: str, seen: Dict[str, int]) -> str:
+    """
+    Построить стабильный ключ секции по заголовку.
+    
+    Args:
+        heading: Заголовок секции (пустой для вступления)
+        seen: Счётчик уже выданных ключей (для повторяющихся заголовков)
+        
+    Returns:
+        Ключ секции
+    """
+    base = re.sub(r"\W+", "-", heading.lower()).strip("-")[:60] or "intro"
+    count = seen.get(base, 0)
+    seen[base] = count + 1
+    return base if count == 0 else f"{base}-{count + 1}"
+
+
+def diff_sections(previous: Dict[str, str], sections: Iterable[PageSection]) -> SectionDiff:
+    """
+    Сравнить отпечатки секций предыдущей и текущей версии.
+    
+    Args:
+        previous: Отпечатки предыдущей версии (ключ -> хэш)
+        sections: Секции текущей версии
+        
+    Returns:
+        SectionDiff с разбивкой секций по типу изменения
+    """
+    diff = SectionDiff()
+    current_keys = set()
+    
+    for section in sections:
+        current_keys.add(section.key)
+        old = previous.get(section.key)
+        if old is None:
+            diff.added.add(section.key)
+        elif old == section.fingerprint:
+            diff.unchanged.add(section.key)
+        else:
+            diff.changed.add(section.key)
+            
+    diff.removed = set(previous) - current_keys
+    return diff
+
+
+def link_recommendations(
+    recommendations: List[Recommendation],
+    sections: List[PageSection]
+) -> None:
+    """
+    Привязать рекомендации к секциям страницы.
+    
+    Рекомендация относится к секции, если упоминает её заголовок
+    или цитирует её текст. Рекомендации без привязки считаются
+    общими для всей страницы.
+    
+    Args:
+        recommendations: Рекомендации (поле sections заполняется на месте)
+        sections: Секции страницы
+    """
+    for rec in recommendations:
+        text = f"{rec.title}\n{rec.description}"
+        lowered = text.lower()
+        quotes = [quote.lower() for quote in QUOTE_PATTERN.findall(text)]
+        
+        linked = []
+        for section in sections:
+            heading = (section.heading or "").lower()
+            section_text = section.text.lower()
+            if len(heading) >= MIN_HEADING_LENGTH and heading in lowered:
+                linked.append(section.key)
+            elif any(quote in section_text for quote in quotes):
+                linked.append(section.key)
+                
+        rec.sections = linked
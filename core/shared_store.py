@@ -0,0 +1,169 @@
+"""
+Общее для процессов хранилище результатов веб-анализа.
+
+При запуске веб-сервера с несколькими воркерами запросы одного
+пользователя попадают в разные процессы, поэтому результаты хранятся
+не в памяти, а в локальной базе SQLite (режим WAL: чтения не блокируют
+запись). По идентификатору результата любой воркер отдаёт файл
+/download без повторного анализа, а одинаковый запрос в течение
+settings.web_result_ttl секунд переиспользует готовый результат
+вместо нового обращения к LLM.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from core.config import settings
+from core.models import AnalysisResult
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    role TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_lookup ON results (url, role, created_at);
+"""
+
+
+class StoredResults(NamedTuple):
+    """Сохранённые результаты одного запроса на анализ."""
+    
+    id: str
+    url: str
+    role: str
+    results: List[AnalysisResult]
+    created_at: float
+
+
+class SharedResultStore:
+    """
+    SQLite-хранилище результатов, общее для всех воркеров.
+    
+    Соединение открывается отдельно в каждом потоке: sqlite3
+    не разрешает использовать одно соединение из разных потоков.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Инициализация хранилища.
+        
+        Args:
+            path: Путь к файлу базы данных
+        """
+        self.path = Path(path or settings.shared_store_path)
+        self._local = threading.local()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Соединение текущего потока (создаётся при первом обращении)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+        return connection
+    
+    def put(self, url: str, role: str, results: List[AnalysisResult]) -> str:
+        """
+        Сохранить результаты анализа.
+        
+        Args:
+            url: Анализируемый URL
+            role: Роль анализа
+            results: Результаты модулей
+            
+        Returns:
+            Идентификатор сохранённых результатов
+        """
+        result_id = uuid.uuid4().hex
+        payload = "[" + ",".join(result.model_dump_json() for result in results) + "]"
+        self._connection().execute(
+            "INSERT INTO results (id, url, role, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+            (result_id, url, role, payload, time.time())
+        )
+        return result_id
+    
+    def get(self, result_id: str) -> Optional[StoredResults]:
+        """
+        Получить результаты по идентификатору.
+        
+        Args:
+            result_id: Идентификатор из put()
+            
+        Returns:
+            StoredResults или None, если результата нет
+        """
+        row = self._connection().execute(
+            "SELECT id, url, role, payload, created_at FROM results WHERE id = ?",
+            (result_id,)
+        ).fetchone()
+        return self._load(row)
+    
+    def find_recent(self, url: str, role: str, max_age: Optional[float] = None) -> Optional[StoredResults]:
+        """
+        Найти свежий результат такого же запроса.
+        
+        Args:
+            url: Анализируемый URL
+            role: Роль анализа
+            max_age: Допустимый возраст в секундах (по умолчанию web_result_ttl)
+            
+        Returns:
+            Последний результат моложе max_age или None
+        """
+        max_age = settings.web_result_ttl if max_age is None else max_age
+        if max_age <= 0:
+            return None
+            
+        row = self._connection().execute(
+            "SELECT id, url, role, payload, created_at FROM results "
+            "WHERE url = ? AND role = ? AND created_at >= ? "
+            "ORDER BY created_at DESC LIMIT 1",
+            (url, role, time.time() - max_age)
+        ).fetchone()
+        return self._load(row)
+    
+    def delete_older_than(self, max_age: Optional[float] = None) -> int:
+        """
+        Удалить устаревшие результаты.
+        
+        Args:
+            max_age: Возраст в секундах (по умолчанию shared_store_max_age, 0 - не удалять)
+            
+        Returns:
+            Количество удалённых результатов
+        """
+        max_age = settings.shared_store_max_age if max_age is None else max_age
+        if max_age <= 0:
+            return 0
+        cursor = self._connection().execute(
+            "DELETE FROM results WHERE created_at < ?",
+            (time.time() - max_age,)
+        )
+        return cursor.rowcount
+    
+    def _load(self, row: Optional[tuple]) -> Optional[StoredResults]:
+        """Восстановить результаты из строки таблицы."""
+        if row is None:
+            return None
+        result_id, url, role, payload, created_at = row
+        try:
+            results = [AnalysisResult.model_validate(item) for item in json.loads(payload)]
+        except Exception as e:
+            logger.warning(f"Не удалось прочитать результат {result_id}: {e}")
+            return None
+        return StoredResults(result_id, url, role, results, created_at)
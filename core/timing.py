@@ -0,0 +1,80 @@
+"""
+Замер времени этапов конвейера анализа.
+
+Используется режимом воспроизведения (agent.py --replay): сеть и LLM
+заменены записями архива, поэтому время этапов определяется только
+кодом проекта и сравнимо между версиями.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+
+@dataclass
+class StageStats:
+    """Накопленное время одного этапа."""
+    
+    name: str
+    calls: int = 0
+    total: float = 0.0
+    
+    @property
+    def mean(self) -> float:
+        """Среднее время вызова в секундах."""
+        return self.total / self.calls if self.calls else 0.0
+
+
+class StageTimings:
+    """Время этапов в порядке их первого появления."""
+    
+    def __init__(self):
+        """Инициализация пустой статистики."""
+        self._stages: Dict[str, StageStats] = {}
+    
+    def add(self, stage: str, seconds: float) -> None:
+        """
+        Учесть один вызов этапа.
+        
+        Args:
+            stage: Название этапа
+            seconds: Длительность в секундах
+        """
+        stats = self._stages.get(stage)
+        if stats is None:
+            stats = self._stages[stage] = StageStats(stage)
+        stats.calls += 1
+        stats.total += seconds
+    
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Замерить время блока как вызов этапа.
+        
+        Args:
+            stage: Название этапа
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+    
+    def stages(self) -> List[StageStats]:
+        """Статистика всех этапов."""
+        return list(self._stages.values())
+    
+    def format(self) -> str:
+        """
+        Таблица этапов для вывода в консоль.
+        
+        Returns:
+            Текст таблицы
+        """
+        lines = [f"   {'Этап':32} {'вызовов':>8} {'всего, мс':>11} {'среднее, мс':>12}"]
+        for stats in self._stages.values():
+            lines.append(
+                f"   {stats.name:32} {stats.calls:8} {stats.total * 1000:11.1f} {stats.mean * 1000:12.3f}"
+            )
+        return "\n".join(lines)
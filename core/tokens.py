@@ -0,0 +1,145 @@
+"""
+Оценка числа токенов и обрезка текста по границам предложений.
+
+Точный токенизатор GigaChat доступен только через API, поэтому
+число токенов оценивается локально по составу текста: кириллица,
+латиница и цифры токенизируются с разной плотностью, знаки
+препинания и прочие символы обычно становятся отдельными токенами.
+Коэффициенты взяты с запасом (по документации GigaChat токен - в
+среднем 3-4 символа русского текста), чтобы оценка не занижала
+расход и текст не выходил за лимит контекста.
+
+Обрезка выполняется по границам блоков (строк), а если блок не
+помещается целиком - по границам предложений внутри него: в промпт
+не попадают оборванные слова и призывы к действию.
+"""
+
+import math
+import re
+import string
+from typing import Callable, List, Tuple
+
+
+# Символов на токен для разных видов текста
+CYRILLIC_CHARS_PER_TOKEN = 3.2
+LATIN_CHARS_PER_TOKEN = 4.0
+DIGITS_PER_TOKEN = 2.0
+
+# Добавляется к обрезанному тексту
+TRUNCATION_MARK = "\n..."
+
+# Подсчёт видов символов выполняется над UTF-8 байтами встроенными
+# методами bytes, без цикла по символам на Python
+LATIN_BYTES = string.ascii_letters.encode()
+DIGIT_BYTES = string.digits.encode()
+SPACE_BYTES = string.whitespace.encode()
+
+# Конец предложения: знак препинания и пробел после него
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?…])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Оценить число токенов текста.
+    
+    Args:
+        text: Текст
+        
+    Returns:
+        Оценка сверху числа токенов
+    """
+    if not text:
+        return 0
+    data = text.encode("utf-8")
+    # Основная кириллица (U+0400-U+047F) кодируется двумя байтами
+    # с ведущим байтом 0xD0 или 0xD1; в других позициях они не встречаются
+    cyrillic = data.count(b"\xd0") + data.count(b"\xd1")
+    latin = len(data) - len(data.translate(None, LATIN_BYTES))
+    digits = len(data) - len(data.translate(None, DIGIT_BYTES))
+    # Пробельные символы сливаются с соседними словами и токенов не добавляют
+    spaces = len(data) - len(data.translate(None, SPACE_BYTES))
+    other = len(text) - spaces - cyrillic - latin - digits
+    return math.ceil(
+        cyrillic / CYRILLIC_CHARS_PER_TOKEN
+        + latin / LATIN_CHARS_PER_TOKEN
+        + digits / DIGITS_PER_TOKEN
+        + other
+    )
+
+
+def _fit(
+    pieces: List[str],
+    separator: str,
+    budget: float,
+    measure: Callable[[str], int]
+) -> Tuple[List[str], float, int]:
+    """
+    Взять с начала части, которые помещаются в бюджет.
+    
+    Returns:
+        Кортеж (взятые части, остаток бюджета, индекс первой не поместившейся части)
+    """
+    taken: List[str] = []
+    separator_cost = measure(separator)
+    for index, piece in enumerate(pieces):
+        cost = measure(piece) + (separator_cost if taken else 0)
+        if cost > budget:
+            return taken, budget, index
+        taken.append(piece)
+        budget -= cost
+    return taken, budget, len(pieces)
+
+
+def truncate(text: str, limit: int, measure: Callable[[str], int] = estimate_tokens) -> str:
+    """
+    Обрезать текст до лимита по границам блоков и предложений.
+    
+    Блоки (строки) берутся целиком, пока помещаются; из первого
+    не поместившегося блока берутся целые предложения. Слово
+    разрезается только если не помещается даже первое предложение.
+    
+    Args:
+        text: Исходный текст
+        limit: Лимит в единицах measure
+        measure: Мера длины текста (по умолчанию - оценка токенов)
+        
+    Returns:
+        Текст в пределах лимита (с отметкой об обрезке, если текст обрезан;
+        пустая строка, если лимит меньше самой отметки)
+    """
+    if measure(text) <= limit:
+        return text
+        
+    budget: float = limit - measure(TRUNCATION_MARK)
+    if budget < 0:
+        return ""
+    blocks = text.split("\n")
+    taken, budget, index = _fit(blocks, "\n", budget, measure)
+    
+    if index < len(blocks):
+        # Из первого не поместившегося блока - целые предложения
+        block = blocks[index]
+        budget -= measure("\n") if taken else 0
+        sentences, budget, _ = _fit(SENTENCE_END_PATTERN.split(block), " ", budget, measure)
+        if sentences:
+            taken.append(" ".join(sentences))
+        elif not taken:
+            # Даже первое предложение не помещается: режем по словам
+            words, _, _ = _fit(block.split(" "), " ", budget, measure)
+            taken.append(" ".join(words))
+            
+    return "\n".join(taken).rstrip() + TRUNCATION_MARK
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Обрезать текст до оценочного числа токенов.
+    
+    Args:
+        text: Исходный текст
+        max_tokens: Наибольшее число токенов
+        
+    Returns:
+        Текст в пределах max_tokens
+    """
+    return truncate(text, max_tokens, estimate_tokens)
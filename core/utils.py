@@ -4,9 +4,17 @@
 
 import re
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from urllib.parse import urlparse
 
+from core.tokens import truncate
+
+
+# Символы нулевой ширины, BOM и мягкий перенос
+INVISIBLE_CHARS = re.compile("[\u200b\u200c\u200d\u2060\ufeff\u00ad]")
+
+DIGIT_PATTERN = re.compile(r"\d")
+
 
 def validate_url(url: str) -> bool:
     """
@@ -25,28 +33,50 @@ def validate_url(url: str) -> bool:
         return False
 
 
-def clean_text(text: str) -> str:
+def clean_text(text: str, dedupe: bool = True) -> str:
     """
-    Очистить текст от лишних пробелов и символов.
+    Нормализовать текст страницы за один проход по строкам.
+    
+    Переносы строк (границы блоков после get_text) сохраняются, пустые
+    строки подряд сводятся к одной. Внутри строки пробельные символы,
+    включая неразрывные, схлопываются в один пробел; символы нулевой
+    ширины и мягкие переносы удаляются. Строка, повторяющая предыдущую
+    (склеенный дубль баннера или меню), отбрасывается, если в ней нет
+    цифр. Повторы через другие строки сохраняются: одинаковые пункты
+    списков и кнопки CTA в разных блоках нужны анализу.
     
     Args:
         text: Исходный текст
+        dedupe: Удалять строки, повторяющие предыдущую
         
     Returns:
         Очищенный текст
     """
-    # Удаляем множественные пробелы
-    text = re.sub(r'\s+', ' ', text)
-    # Удаляем множественные переносы строк
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    # Убираем пробелы в начале и конце
-    text = text.strip()
-    return text
+    text = INVISIBLE_CHARS.sub("", text)
+    lines: List[str] = []
+    previous = None
+    blank = False
+    for line in text.splitlines():
+        # str.split() без аргументов делит и по неразрывным пробелам
+        line = " ".join(line.split())
+        if not line:
+            blank = bool(lines)
+            continue
+        if dedupe and line == previous and not DIGIT_PATTERN.search(line):
+            continue
+        previous = line
+        if blank:
+            lines.append("")
+            blank = False
+        lines.append(line)
+    return "\n".join(lines)
 
 
 def truncate_text(text: str, max_length: int = 10000) -> str:
     """
-    Обрезать текст до максимальной длины.
+    Обрезать текст до максимальной длины в символах по границам предложений.
+    
+    Для лимитов в токенах - core.tokens.truncate_to_tokens.
     
     Args:
         text: Исходный текст
@@ -55,9 +85,7 @@ def truncate_text(text: str, max_length: int = 10000) -> str:
     Returns:
         Обрезанный текст
     """
-    if len(text) <= max_length:
-        return text
-    return text[:max_length] + "..."
+    return truncate(text, max_length, len)
 
 
 def get_timestamp() -> str:
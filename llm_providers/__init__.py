@@ -1,8 +1,21 @@
 """
 LLM Providers module - провайдеры языковых моделей.
+
+Провайдеры импортируются лениво: SDK провайдера загружается
+только при первом обращении к его классу.
 """
 
-from llm_providers.gigachat_provider import GigaChatProvider
+from core.lazy import lazy_exports
+
+_EXPORTS = {
+    "GigaChatProvider": "llm_providers.gigachat_provider",
+    "OpenAICompatibleProvider": "llm_providers.openai_compatible",
+    "LLMRouter": "llm_providers.router",
+    "ArchivingLLMProvider": "llm_providers.archiving",
+    "ReplayLLMProvider": "llm_providers.replay",
+    "create_llm_provider": "llm_providers.factory",
+}
 
-__all__ = ["GigaChatProvider"]
+__all__ = list(_EXPORTS)
 
+__getattr__ = lazy_exports(__name__, _EXPORTS)
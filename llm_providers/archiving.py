@@ -0,0 +1,79 @@
+"""
+Запись диалогов с LLM в архив.
+
+Обёртка над любым провайдером: запрос выполняется как обычно,
+а промпты и полный ответ сохраняются в PageArchive вместе с URL
+анализируемой страницы (см. core.archive.page_scope).
+"""
+
+import logging
+from typing import Iterator, Optional
+
+from core.archive import PageArchive, current_page_url
+from core.interfaces import BaseLLMProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArchivingLLMProvider(BaseLLMProvider):
+    """Провайдер, сохраняющий каждый диалог с LLM в архив."""
+    
+    name = "Archiving Provider"
+    description = "Запись диалогов с LLM в архив"
+    
+    def __init__(self, provider: BaseLLMProvider, archive: PageArchive):
+        """
+        Инициализация.
+        
+        Args:
+            provider: Провайдер, выполняющий запросы
+            archive: Архив для записи диалогов
+        """
+        self.provider = provider
+        self.archive = archive
+    
+    def _record(self, system_prompt: str, user_prompt: str, response: str) -> None:
+        """Сохранить диалог; ошибка архива не прерывает анализ."""
+        try:
+            self.archive.put_transcript(system_prompt, user_prompt, response, url=current_page_url())
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить ответ LLM в архив: {e}")
+    
+    def call(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> str:
+        """Выполнить запрос и сохранить диалог."""
+        response = self.provider.call(system_prompt, user_prompt, temperature, max_tokens)
+        self._record(system_prompt, user_prompt, response)
+        return response
+    
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> Iterator[str]:
+        """Отдавать ответ по частям и сохранить его целиком после завершения."""
+        chunks = []
+        for chunk in self.provider.stream(system_prompt, user_prompt, temperature, max_tokens):
+            chunks.append(chunk)
+            yield chunk
+        self._record(system_prompt, user_prompt, "".join(chunks))
+    
+    def is_available(self) -> bool:
+        """Доступность обёрнутого провайдера."""
+        return self.provider.is_available()
+    
+    def has_valid_token(self) -> Optional[bool]:
+        """Состояние токена обёрнутого провайдера."""
+        return self.provider.has_valid_token()
+    
+    def warm_up(self) -> None:
+        """Прогреть обёрнутый провайдер."""
+        self.provider.warm_up()
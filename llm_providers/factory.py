@@ -0,0 +1,83 @@
+"""
+Создание LLM-провайдера по настройкам.
+
+Если настроен один провайдер, он возвращается напрямую. Если несколько -
+они объединяются в LLMRouter с выбором по задержке и стоимости.
+При включённом архиве (ARCHIVE_ENABLED) провайдер оборачивается
+в ArchivingLLMProvider.
+"""
+
+import logging
+from typing import List, Optional
+
+from core.config import settings
+from core.exceptions import LLMError
+from core.interfaces import BaseLLMProvider
+from llm_providers.router import LLMRouter, Route
+
+
+logger = logging.getLogger(__name__)
+
+
+def create_llm_provider() -> BaseLLMProvider:
+    """
+    Создать LLM-провайдер из настроек.
+    
+    Маршруты: GigaChat (GIGACHAT_MODEL), вторая модель GigaChat
+    (GIGACHAT_PRO_MODEL) и OpenAI-совместимый API (OPENAI_BASE_URL).
+    
+    Returns:
+        Провайдер или маршрутизатор над несколькими провайдерами
+        
+    Raises:
+        LLMError: Если не настроен ни один провайдер
+    """
+    from core.archive import get_archive
+    
+    provider = _create_provider()
+    archive = get_archive()
+    if archive is not None:
+        from llm_providers.archiving import ArchivingLLMProvider
+        
+        provider = ArchivingLLMProvider(provider, archive)
+    return provider
+
+
+def _create_provider() -> BaseLLMProvider:
+    """Провайдер или маршрутизатор по настройкам (без обёрток)."""
+    from llm_providers.gigachat_provider import GigaChatProvider
+    
+    routes: List[Route] = []
+    gigachat_error: Optional[LLMError] = None
+    
+    try:
+        routes.append(Route(
+            name=settings.gigachat_model,
+            provider=GigaChatProvider(),
+            cost_per_1k=settings.gigachat_cost_per_1k
+        ))
+        if settings.gigachat_pro_model:
+            routes.append(Route(
+                name=settings.gigachat_pro_model,
+                provider=GigaChatProvider(model=settings.gigachat_pro_model),
+                cost_per_1k=settings.gigachat_pro_cost_per_1k
+            ))
+    except LLMError as e:
+        gigachat_error = e
+        
+    if settings.openai_base_url:
+        from llm_providers.openai_compatible import OpenAICompatibleProvider
+        
+        routes.append(Route(
+            name=f"{settings.openai_model} ({settings.openai_base_url})",
+            provider=OpenAICompatibleProvider(),
+            cost_per_1k=settings.openai_cost_per_1k
+        ))
+        
+    if not routes:
+        raise gigachat_error or LLMError("Не настроен ни один LLM-провайдер")
+    if len(routes) == 1:
+        return routes[0].provider
+        
+    logger.info(f"Маршрутизация между провайдерами: {', '.join(r.name for r in routes)}")
+    return LLMRouter(routes)
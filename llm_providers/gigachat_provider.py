@@ -3,10 +3,11 @@ GigaChat LLM Provider - интеграция с GigaChat API (Сбер).
 """
 
 import logging
-from typing import Optional
+import time
+from typing import Iterator, Optional
 
 from gigachat import GigaChat
-from gigachat.models import Chat, Messages, MessagesRole
+from gigachat.models import AccessToken, Chat, Messages, MessagesRole
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -21,6 +22,9 @@ from core.interfaces import BaseLLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Запас до истечения токена, при котором он уже не считается действующим (сек)
+TOKEN_EXPIRY_MARGIN = 60
+
 
 class GigaChatProvider(BaseLLMProvider):
     """
@@ -36,7 +40,9 @@ class GigaChatProvider(BaseLLMProvider):
         self,
         credentials: Optional[str] = None,
         model: Optional[str] = None,
-        scope: Optional[str] = None
+        scope: Optional[str] = None,
+        base_url: Optional[str] = None,
+        auth_url: Optional[str] = None
     ):
         """
         Инициализация провайдера.
@@ -45,12 +51,17 @@ class GigaChatProvider(BaseLLMProvider):
             credentials: API-ключ (Authorization Key)
             model: Модель (GigaChat или GigaChat-Pro)
             scope: Scope (GIGACHAT_API_PERS или GIGACHAT_API_CORP)
+            base_url: Адрес API (например, локальный тестовый сервер)
+            auth_url: Адрес получения токена OAuth
         """
         self.credentials = credentials or settings.gigachat_credentials
         self.model = model or settings.gigachat_model
         self.scope = scope or settings.gigachat_scope
+        self.base_url = base_url or settings.gigachat_base_url or None
+        self.auth_url = auth_url or settings.gigachat_auth_url or None
         
         self._client: Optional[GigaChat] = None
+        self._access_token: Optional[AccessToken] = None
         self._validate_credentials()
     
     def _validate_credentials(self) -> None:
@@ -67,12 +78,38 @@ class GigaChatProvider(BaseLLMProvider):
         if self._client is None:
             logger.info(f"Инициализация GigaChat клиента (модель: {self.model})")
             self._client = GigaChat(
+                base_url=self.base_url,
+                auth_url=self.auth_url,
                 credentials=self.credentials,
                 scope=self.scope,
                 verify_ssl_certs=False  # Для корректной работы на Windows
             )
         return self._client
     
+    def _build_chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Chat:
+        """Собрать запрос к чату из системного и пользовательского промптов."""
+        return Chat(
+            messages=[
+                Messages(
+                    role=MessagesRole.SYSTEM,
+                    content=system_prompt
+                ),
+                Messages(
+                    role=MessagesRole.USER,
+                    content=user_prompt
+                )
+            ],
+            model=self.model,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -108,21 +145,7 @@ class GigaChatProvider(BaseLLMProvider):
         try:
             client = self._get_client()
             
-            chat = Chat(
-                messages=[
-                    Messages(
-                        role=MessagesRole.SYSTEM,
-                        content=system_prompt
-                    ),
-                    Messages(
-                        role=MessagesRole.USER,
-                        content=user_prompt
-                    )
-                ],
-                model=self.model,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
+            chat = self._build_chat(system_prompt, user_prompt, temperature, max_tokens)
             
             response = client.chat(chat)
             
@@ -140,19 +163,91 @@ class GigaChatProvider(BaseLLMProvider):
             logger.error(f"Ошибка GigaChat: {e}")
             raise LLMError(str(e), provider=self.name)
     
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> Iterator[str]:
+        """
+        Отправить запрос к GigaChat и получать ответ потоком.
+        
+        Args:
+            system_prompt: Системный промпт (роль)
+            user_prompt: Пользовательский промпт (контент)
+            temperature: Температура генерации (0.0-1.0)
+            max_tokens: Максимальное количество токенов в ответе
+            
+        Yields:
+            Фрагменты ответа по мере генерации
+            
+        Raises:
+            LLMError: При ошибке вызова API
+        """
+        logger.info(f"Потоковый запрос к GigaChat ({self.model})...")
+        received = 0
+        
+        try:
+            client = self._get_client()
+            chat = self._build_chat(system_prompt, user_prompt, temperature, max_tokens)
+            
+            for chunk in client.stream(chat):
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content or ""
+                if text:
+                    received += len(text)
+                    yield text
+                    
+        except LLMError:
+            raise
+        except Exception as e:
+            logger.error(f"Ошибка GigaChat: {e}")
+            raise LLMError(str(e), provider=self.name)
+            
+        if not received:
+            raise LLMError("Пустой ответ от GigaChat", provider=self.name)
+        logger.info(f"Получен ответ: {received} символов")
+    
     def is_available(self) -> bool:
         """
-        Проверить доступность GigaChat API.
+        Проверить доступность GigaChat API по списку моделей.
+        
+        Запрос не расходует токены генерации; токен доступа
+        запрашивается, только если кэшированный истёк.
         
         Returns:
             True если API доступен
         """
         try:
             client = self._get_client()
-            # Простой тестовый запрос
-            response = client.chat("Привет")
-            return bool(response.choices)
+            return bool(client.get_models().data)
         except Exception as e:
             logger.warning(f"GigaChat недоступен: {e}")
             return False
 
+    def warm_up(self) -> None:
+        """Создать клиент и заранее получить токен доступа OAuth."""
+        self._access_token = self._get_client().get_token()
+    
+    def has_valid_token(self) -> Optional[bool]:
+        """
+        Проверить кэшированный токен доступа без сетевых запросов.
+
+        Срок действия известен только для токена, полученного при
+        прогреве; если клиент с тех пор сменил токен сам, результат
+        неизвестен.
+        
+        Returns:
+            True если токен получен и ещё не истёк, False если токена
+            нет или он истекает, None если срок токена неизвестен
+        """
+        if self._client is None or self._client.token is None:
+            return False
+        if self._access_token is None or self._access_token.access_token != self._client.token:
+            return None
+        expires_at = self._access_token.expires_at
+        if not expires_at:
+            return True  # Токен задан явно и не истекает
+        return expires_at / 1000 > time.time() + TOKEN_EXPIRY_MARGIN
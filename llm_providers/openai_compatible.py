@@ -0,0 +1,180 @@
+"""
+OpenAI-совместимый LLM-провайдер.
+
+Работает с любым сервером, реализующим /v1/chat/completions:
+llama.cpp server, vLLM, Ollama, LM Studio и облачные API.
+"""
+
+import json
+import logging
+from typing import Iterator, Optional
+
+import httpx
+
+from core.config import settings
+from core.exceptions import LLMError
+from core.interfaces import BaseLLMProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAICompatibleProvider(BaseLLMProvider):
+    """
+    Провайдер для OpenAI-совместимых эндпоинтов.
+    
+    Например, локальный llama.cpp server: base_url="http://localhost:8080/v1".
+    """
+    
+    name = "OpenAI-compatible"
+    description = "OpenAI-совместимый API (локальный или облачный)"
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Инициализация провайдера.
+        
+        Args:
+            base_url: Базовый URL API (с /v1)
+            model: Имя модели
+            api_key: API-ключ (локальным серверам обычно не нужен)
+            timeout: Таймаут запроса в секундах
+        """
+        self.base_url = (base_url or settings.openai_base_url).rstrip("/")
+        self.model = model or settings.openai_model
+        self.api_key = api_key if api_key is not None else settings.openai_api_key
+        self.timeout = timeout or settings.llm_timeout
+        
+        if not self.base_url:
+            raise LLMError(
+                "Не указан адрес OpenAI-совместимого API (OPENAI_BASE_URL)",
+                provider=self.name
+            )
+            
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        self._client = httpx.Client(base_url=self.base_url, headers=headers, timeout=self.timeout)
+    
+    def _payload(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        stream: bool = False
+    ) -> dict:
+        """Тело запроса к /chat/completions."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream,
+        }
+    
+    def call(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> str:
+        """
+        Отправить запрос к API.
+        
+        Args:
+            system_prompt: Системный промпт (роль)
+            user_prompt: Пользовательский промпт (контент)
+            temperature: Температура генерации (0.0-1.0)
+            max_tokens: Максимальное количество токенов в ответе
+            
+        Returns:
+            Ответ модели
+            
+        Raises:
+            LLMError: При ошибке вызова API
+        """
+        logger.info(f"Отправка запроса к {self.base_url} ({self.model})...")
+        try:
+            response = self._client.post(
+                "/chat/completions",
+                json=self._payload(system_prompt, user_prompt, temperature, max_tokens)
+            )
+            response.raise_for_status()
+            choices = response.json().get("choices") or []
+        except httpx.HTTPStatusError as e:
+            raise LLMError(f"HTTP {e.response.status_code}: {e.response.text[:200]}", provider=self.name)
+        except (httpx.HTTPError, ValueError) as e:
+            raise LLMError(str(e), provider=self.name)
+            
+        if not choices or not choices[0].get("message", {}).get("content"):
+            raise LLMError("Пустой ответ от модели", provider=self.name)
+            
+        result = choices[0]["message"]["content"]
+        logger.info(f"Получен ответ: {len(result)} символов")
+        return result
+    
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> Iterator[str]:
+        """
+        Отправить запрос к API и получать ответ потоком (server-sent events).
+        
+        Args:
+            system_prompt: Системный промпт (роль)
+            user_prompt: Пользовательский промпт (контент)
+            temperature: Температура генерации (0.0-1.0)
+            max_tokens: Максимальное количество токенов в ответе
+            
+        Yields:
+            Фрагменты ответа по мере генерации
+            
+        Raises:
+            LLMError: При ошибке вызова API
+        """
+        payload = self._payload(system_prompt, user_prompt, temperature, max_tokens, stream=True)
+        try:
+            with self._client.stream("POST", "/chat/completions", json=payload) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = json.loads(data).get("choices") or []
+                    text = choices[0].get("delta", {}).get("content") if choices else None
+                    if text:
+                        yield text
+        except httpx.HTTPStatusError as e:
+            raise LLMError(f"HTTP {e.response.status_code}", provider=self.name)
+        except (httpx.HTTPError, ValueError) as e:
+            raise LLMError(str(e), provider=self.name)
+    
+    def warm_up(self) -> None:
+        """Открыть соединение с API заранее."""
+        self.is_available()
+    
+    def is_available(self) -> bool:
+        """
+        Проверить доступность API по списку моделей.
+        
+        Returns:
+            True если API доступен
+        """
+        try:
+            return self._client.get("/models").status_code == 200
+        except httpx.HTTPError as e:
+            logger.warning(f"{self.base_url} недоступен: {e}")
+            return False
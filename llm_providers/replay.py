@@ -0,0 +1,83 @@
+"""
+LLM-провайдер, отвечающий записанными ответами из архива.
+
+Используется режимом воспроизведения (agent.py --replay). Ответ
+ищется по точному совпадению промптов; если промпт изменился
+(например, после правки парсера), берутся ответы той же страницы
+на тот же системный промпт в порядке записи.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from core.archive import TRANSCRIPT, PageArchive, current_page_url, prompt_key
+from core.exceptions import LLMError
+from core.interfaces import BaseLLMProvider
+from core.timing import StageTimings
+
+
+class ReplayLLMProvider(BaseLLMProvider):
+    """Провайдер ответов из архива, без обращений к LLM."""
+    
+    name = "Replay Provider"
+    description = "Записанные ответы LLM из архива"
+    
+    def __init__(self, archive: PageArchive, timings: Optional[StageTimings] = None):
+        """
+        Загрузить ответы из архива.
+        
+        Args:
+            archive: Архив с диалогами LLM
+            timings: Статистика для замера этапа LLM
+        """
+        self.timings = timings or StageTimings()
+        self._by_key: Dict[str, str] = {}
+        self._by_page: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._positions: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.stats = {"exact": 0, "fallback": 0, "missing": 0}
+        
+        for record in archive.find(TRANSCRIPT):
+            transcript = archive.read(record)
+            self._by_key[record.key] = transcript["response"]
+            self._by_page[(record.url, transcript["system_prompt"])].append(transcript["response"])
+    
+    def _lookup(self, system_prompt: str, user_prompt: str) -> str:
+        """Найти записанный ответ на промпт."""
+        response = self._by_key.get(prompt_key(system_prompt, user_prompt))
+        if response is not None:
+            self.stats["exact"] += 1
+            return response
+            
+        page_key = (current_page_url(), system_prompt)
+        responses = self._by_page.get(page_key)
+        if responses:
+            with self._lock:
+                position = self._positions[page_key]
+                self._positions[page_key] = position + 1
+            self.stats["fallback"] += 1
+            return responses[min(position, len(responses) - 1)]
+            
+        self.stats["missing"] += 1
+        raise LLMError(f"Ответ отсутствует в архиве ({current_page_url() or 'URL неизвестен'})")
+    
+    def call(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> str:
+        """
+        Вернуть записанный ответ.
+        
+        Raises:
+            LLMError: Если ответа на промпт нет в архиве
+        """
+        with self.timings.measure("LLM (из архива)"):
+            return self._lookup(system_prompt, user_prompt)
+    
+    def is_available(self) -> bool:
+        """Архив всегда доступен."""
+        return True
@@ -0,0 +1,294 @@
+"""
+Маршрутизатор запросов между несколькими LLM-провайдерами.
+
+Для каждого маршрута ведётся живая статистика задержек: скользящее
+среднее (EWMA) и p95 по последним вызовам. Запрос отправляется на
+маршрут с наименьшей задержкой среди тех, что укладываются в потолок
+стоимости; при ошибке маршрут временно исключается, а запрос
+повторяется на следующем.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Iterator, List, Optional, Tuple
+
+from core.config import settings
+from core.exceptions import LLMError
+from core.interfaces import BaseLLMProvider
+
+
+logger = logging.getLogger(__name__)
+
+# Число последних вызовов для расчёта p95
+LATENCY_WINDOW = 50
+
+# Минимум замеров, после которого p95 считается надёжнее EWMA
+MIN_SAMPLES_FOR_P95 = 5
+
+# Вес нового замера в EWMA
+EWMA_ALPHA = 0.3
+
+
+@dataclass
+class RouteStats:
+    """Статистика вызовов одного маршрута."""
+    
+    ewma: Optional[float] = None
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    calls: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    cooldown_until: float = 0.0
+    
+    @property
+    def p95(self) -> Optional[float]:
+        """95-й перцентиль задержки по последним вызовам."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    
+    @property
+    def score(self) -> Optional[float]:
+        """
+        Оценка задержки для выбора маршрута (меньше - лучше).
+        
+        Returns:
+            p95 при достаточном числе замеров, иначе EWMA;
+            None, если успешных вызовов ещё не было
+        """
+        if len(self.latencies) >= MIN_SAMPLES_FOR_P95:
+            return self.p95
+        return self.ewma
+    
+    def record_success(self, latency: float) -> None:
+        """Учесть успешный вызов."""
+        self.calls += 1
+        self.consecutive_errors = 0
+        self.latencies.append(latency)
+        self.ewma = latency if self.ewma is None else EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self.ewma
+    
+    def record_error(self, cooldown: float) -> None:
+        """Учесть ошибку и исключить маршрут на время (растёт при повторах)."""
+        self.calls += 1
+        self.errors += 1
+        self.consecutive_errors += 1
+        self.cooldown_until = time.monotonic() + cooldown * 2 ** (self.consecutive_errors - 1)
+
+
+@dataclass
+class Route:
+    """Маршрут: провайдер, его стоимость и статистика."""
+    
+    name: str
+    provider: BaseLLMProvider
+    cost_per_1k: float = 0.0  # Стоимость 1000 токенов (в единицах потолка)
+    stats: RouteStats = field(default_factory=RouteStats)
+
+
+class LLMRouter(BaseLLMProvider):
+    """
+    LLM-провайдер, распределяющий запросы между маршрутами.
+    
+    Политика: маршруты дороже потолка не используются, остальные
+    упорядочиваются по p95 задержки (EWMA, пока замеров мало),
+    маршруты после ошибки временно пропускаются. Если все маршруты
+    на паузе, пробуется тот, чья пауза заканчивается раньше.
+    """
+    
+    name = "LLM Router"
+    description = "Маршрутизация запросов между несколькими LLM"
+    
+    def __init__(
+        self,
+        routes: List[Route],
+        max_cost_per_1k: Optional[float] = None,
+        cooldown: Optional[float] = None
+    ):
+        """
+        Инициализация маршрутизатора.
+        
+        Args:
+            routes: Маршруты в порядке предпочтения при равной задержке
+            max_cost_per_1k: Потолок стоимости 1000 токенов (0 - без ограничения)
+            cooldown: Пауза маршрута после ошибки в секундах
+        """
+        if not routes:
+            raise LLMError("Не настроен ни один LLM-провайдер", provider=self.name)
+        self.routes = routes
+        self.max_cost_per_1k = settings.llm_max_cost_per_1k if max_cost_per_1k is None else max_cost_per_1k
+        self.cooldown = settings.llm_route_cooldown if cooldown is None else cooldown
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _latency_key(route: Route) -> Tuple[int, float]:
+        """Ключ сортировки готовых маршрутов по задержке."""
+        score = route.stats.score
+        if score is None:
+            # Маршруты без статистики пробуются первыми, чтобы её набрать
+            return (0, 0.0)
+        return (1, score)
+    
+    def _candidates(self) -> List[Route]:
+        """Маршруты в порядке попыток для очередного запроса."""
+        routes = [
+            route for route in self.routes
+            if not self.max_cost_per_1k or route.cost_per_1k <= self.max_cost_per_1k
+        ]
+        if not routes:
+            raise LLMError(
+                f"Нет провайдеров дешевле {self.max_cost_per_1k} за 1000 токенов",
+                provider=self.name
+            )
+            
+        now = time.monotonic()
+        with self._lock:
+            ready = [route for route in routes if route.stats.cooldown_until <= now]
+            paused = [route for route in routes if route.stats.cooldown_until > now]
+            ready.sort(key=self._latency_key)
+            paused.sort(key=lambda route: route.stats.cooldown_until)
+        return ready + paused
+    
+    def _record(self, route: Route, started: float, error: Optional[Exception] = None) -> None:
+        """Обновить статистику маршрута."""
+        with self._lock:
+            if error is None:
+                route.stats.record_success(time.monotonic() - started)
+            else:
+                route.stats.record_error(self.cooldown)
+    
+    def call(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> str:
+        """
+        Отправить запрос через лучший доступный маршрут.
+        
+        Args:
+            system_prompt: Системный промпт (роль)
+            user_prompt: Пользовательский промпт (контент)
+            temperature: Температура генерации (0.0-1.0)
+            max_tokens: Максимальное количество токенов в ответе
+            
+        Returns:
+            Ответ от LLM
+            
+        Raises:
+            LLMError: Если запрос не удался ни на одном маршруте
+        """
+        last_error: Optional[Exception] = None
+        for route in self._candidates():
+            started = time.monotonic()
+            try:
+                result = route.provider.call(system_prompt, user_prompt, temperature, max_tokens)
+            except Exception as e:
+                self._record(route, started, e)
+                logger.warning(f"Маршрут {route.name} недоступен, переключение: {e}")
+                last_error = e
+                continue
+            self._record(route, started)
+            logger.info(f"Ответ получен через {route.name}")
+            return result
+            
+        raise LLMError(f"Все провайдеры недоступны: {last_error}", provider=self.name)
+    
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1500
+    ) -> Iterator[str]:
+        """
+        Получать ответ потоком через лучший доступный маршрут.
+        
+        Переключение на другой маршрут возможно только до первого
+        фрагмента ответа: начатый ответ не склеивается из двух моделей.
+        
+        Args:
+            system_prompt: Системный промпт (роль)
+            user_prompt: Пользовательский промпт (контент)
+            temperature: Температура генерации (0.0-1.0)
+            max_tokens: Максимальное количество токенов в ответе
+            
+        Yields:
+            Фрагменты ответа
+            
+        Raises:
+            LLMError: Если запрос не удался ни на одном маршруте
+        """
+        last_error: Optional[Exception] = None
+        for route in self._candidates():
+            started = time.monotonic()
+            received = False
+            try:
+                for chunk in route.provider.stream(system_prompt, user_prompt, temperature, max_tokens):
+                    received = True
+                    yield chunk
+            except Exception as e:
+                self._record(route, started, e)
+                if received:
+                    raise
+                logger.warning(f"Маршрут {route.name} недоступен, переключение: {e}")
+                last_error = e
+                continue
+            self._record(route, started)
+            return
+            
+        raise LLMError(f"Все провайдеры недоступны: {last_error}", provider=self.name)
+    
+    def is_available(self) -> bool:
+        """
+        Проверить, доступен ли хотя бы один маршрут.
+        
+        Returns:
+            True если хотя бы один провайдер доступен
+        """
+        return any(route.provider.is_available() for route in self.routes)
+    
+    def has_valid_token(self) -> Optional[bool]:
+        """
+        Есть ли действующий токен хотя бы у одного маршрута.
+        
+        Returns:
+            True/False по маршрутам с токенами, None если токенов нет ни у кого
+        """
+        results = [route.provider.has_valid_token() for route in self.routes]
+        known = [result for result in results if result is not None]
+        return any(known) if known else None
+    
+    def warm_up(self) -> None:
+        """Подготовить все маршруты; ошибка одного не мешает остальным."""
+        for route in self.routes:
+            try:
+                route.provider.warm_up()
+            except Exception as e:
+                logger.warning(f"Маршрут {route.name} не прогрет: {e}")
+    
+    def snapshot(self) -> List[dict]:
+        """
+        Текущая статистика маршрутов (для логов и мониторинга).
+        
+        Returns:
+            Список словарей со статистикой каждого маршрута
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "name": route.name,
+                    "cost_per_1k": route.cost_per_1k,
+                    "calls": route.stats.calls,
+                    "errors": route.stats.errors,
+                    "ewma": route.stats.ewma,
+                    "p95": route.stats.p95,
+                    "paused": route.stats.cooldown_until > now,
+                }
+                for route in self.routes
+            ]
@@ -2,8 +2,31 @@
 Outputs module - модули вывода результатов.
 """
 
-from outputs.console_output import ConsoleOutput
-from outputs.txt_output import TxtOutput
+from core.lazy import lazy_exports
 
-__all__ = ["ConsoleOutput", "TxtOutput"]
+# Форматы файлового отчёта: формат -> "модуль:Класс".
+# Список доступен без импорта реализаций (нужен справке CLI)
+FILE_FORMATS = {
+    "txt": "outputs.txt_output:TxtOutput",
+    "md": "outputs.formats:MarkdownOutput",
+    "json": "outputs.formats:JsonOutput",
+    "ndjson": "outputs.formats:NdjsonOutput",
+    "csv": "outputs.formats:CsvOutput",
+}
 
+_EXPORTS = {
+    "ConsoleOutput": "outputs.console_output",
+    "TxtOutput": "outputs.txt_output",
+    "FileOutput": "outputs.file_output",
+    "ResultStream": "outputs.file_output",
+    "get_file_output": "outputs.file_output",
+    "JsonOutput": "outputs.formats",
+    "NdjsonOutput": "outputs.formats",
+    "CsvOutput": "outputs.formats",
+    "MarkdownOutput": "outputs.formats",
+    "StreamWriter": "outputs.stream_writer",
+}
+
+__all__ = ["FILE_FORMATS"] + list(_EXPORTS)
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,278 @@
+"""
+Общая основа файловых форматов отчёта.
+
+Формат описывает только заголовок, запись одного результата и
+концовку файла; открытие файла, потоковую запись и синхронизацию
+с диском выполняет FileOutput через StreamWriter. Для пакетных
+прогонов open_stream() возвращает поток, в который результаты
+дописываются по мере готовности.
+"""
+
+import uuid
+from datetime import datetime
+from importlib import import_module
+from pathlib import Path
+from typing import List, Optional
+
+from core.config import settings
+from core.interfaces import BaseOutput
+from core.models import AnalysisResult
+from core.utils import get_file_timestamp
+from outputs import FILE_FORMATS
+from outputs.stream_writer import StreamWriter
+
+
+class ResultStream:
+    """
+    Открытый отчёт, в который результаты дописываются по одному.
+    
+    Использование:
+        with output.open_stream("batch.ndjson") as stream:
+            for result in results:
+                stream.write(result)
+    """
+    
+    def __init__(
+        self,
+        output: "FileOutput",
+        writer: StreamWriter,
+        url: str = "",
+        results: Optional[List[AnalysisResult]] = None
+    ):
+        """
+        Начать отчёт.
+        
+        Args:
+            output: Формат отчёта
+            writer: Открытый файл
+            url: URL для заголовка отчёта
+            results: Все результаты, если известны заранее (для сводки в заголовке)
+        """
+        self.output = output
+        self.writer = writer
+        self.count = 0
+        if writer.is_new or not output.append:
+            if results is not None:
+                # Дата в заголовке - время анализа: одинаковые результаты
+                # дают одинаковый отчёт и один хэш содержимого
+                writer.write(output._header(url, results))
+            else:
+                # Результаты ещё неизвестны, в заголовке текущее время:
+                # в хэш вместо заголовка входит URL
+                writer.update_digest(url)
+                writer.write(output._header(url, results), hashed=False)
+    
+    @property
+    def path(self) -> str:
+        """Путь к файлу отчёта."""
+        return str(self.writer.path)
+    
+    def write(self, result: AnalysisResult) -> None:
+        """
+        Дописать результат в отчёт.
+        
+        Args:
+            result: Результат анализа
+        """
+        self.writer.write(self.output._format_record(result, self.count))
+        self.writer.end_record()
+        self.count += 1
+    
+    def close(self) -> None:
+        """Завершить отчёт и закрыть файл."""
+        if not self.output.append:
+            self.writer.write(self.output._footer())
+        self.writer.close()
+    
+    def __enter__(self) -> "ResultStream":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class FileOutput(BaseOutput):
+    """
+    Базовый класс файловых форматов отчёта.
+    
+    Наследник задаёт extension и _format_result(), при необходимости
+    _header() и _footer(). Форматы с append = True (построчные)
+    дописывают записи в конец существующего файла.
+    """
+    
+    name = "File Output"
+    description = "Сохранение результатов в файл"
+    extension = "txt"
+    append = False
+    
+    def __init__(self, output_dir: Optional[str] = None):
+        """
+        Инициализация.
+        
+        Args:
+            output_dir: Директория для сохранения файлов
+        """
+        self.output_dir = Path(output_dir) if output_dir else Path.cwd()
+    
+    def _generate_filename(self, url: str = "", prefix: str = "analysis") -> str:
+        """
+        Сгенерировать уникальное имя файла.
+        
+        Метка времени с точностью до секунды дополняется случайным
+        идентификатором: параллельные анализы одного домена не
+        перезаписывают отчёты друг друга. В режиме адресации по
+        содержимому имя дополняет хэш отчёта (см. StreamWriter).
+        """
+        # Извлекаем домен из URL для имени файла
+        domain = url.replace("https://", "").replace("http://", "")
+        domain = domain.split("/")[0].replace(".", "_").replace(":", "_")
+        name = f"{prefix}_{domain}" if domain else prefix
+        if self._content_addressed():
+            return f"{name}.{self.extension}"
+        return f"{name}_{get_file_timestamp()}_{uuid.uuid4().hex[:8]}.{self.extension}"
+    
+    def _content_addressed(self) -> bool:
+        """Называть файлы по хэшу содержимого (только для отчётов целиком)."""
+        return settings.output_content_addressed and not self.append
+    
+    def _header(self, url: str, results: Optional[List[AnalysisResult]]) -> str:
+        """Начало файла (results - все результаты, если известны заранее)."""
+        return ""
+    
+    @staticmethod
+    def _report_date(results: Optional[List[AnalysisResult]]) -> str:
+        """Дата для заголовка: время анализа, если результаты известны, иначе текущее."""
+        date = min(result.analyzed_at for result in results) if results else datetime.now()
+        return date.strftime("%d.%m.%Y %H:%M:%S")
+    
+    def _format_result(self, result: AnalysisResult) -> str:
+        """Форматировать результат одного модуля."""
+        raise NotImplementedError
+    
+    def _format_record(self, result: AnalysisResult, index: int) -> str:
+        """Запись результата с учётом его позиции в отчёте."""
+        return self._format_result(result)
+    
+    def _footer(self) -> str:
+        """Конец файла."""
+        return ""
+    
+    def open_stream(
+        self,
+        filename: Optional[str] = None,
+        url: str = "",
+        results: Optional[List[AnalysisResult]] = None,
+        prefix: str = "analysis"
+    ) -> ResultStream:
+        """
+        Открыть отчёт для потоковой записи результатов.
+        
+        Args:
+            filename: Имя файла (по умолчанию - уникальное по URL и времени)
+            url: URL для имени файла и заголовка
+            results: Все результаты, если известны заранее
+            prefix: Префикс автоматического имени файла
+            
+        Returns:
+            ResultStream
+        """
+        writer = StreamWriter(
+            self.output_dir / (filename or self._generate_filename(url, prefix)),
+            append=self.append,
+            content_addressed=filename is None and self._content_addressed()
+        )
+        return ResultStream(self, writer, url, results)
+    
+    def render(self, results: List[AnalysisResult]) -> str:
+        """
+        Сформировать отчёт в памяти, без записи на диск.
+        
+        Args:
+            results: Список результатов анализа
+            
+        Returns:
+            Текст отчёта
+        """
+        url = results[0].url if results else ""
+        parts = [self._header(url, results)]
+        parts.extend(self._format_record(result, index) for index, result in enumerate(results))
+        if not self.append:
+            parts.append(self._footer())
+        return "".join(parts)
+    
+    def _save(
+        self,
+        results: List[AnalysisResult],
+        filename: Optional[str],
+        summary: bool
+    ) -> str:
+        """Записать результаты в файл одним потоком."""
+        with self.open_stream(filename, results[0].url, results if summary else None) as stream:
+            for result in results:
+                stream.write(result)
+        return stream.path
+    
+    def output(self, result: AnalysisResult, filename: Optional[str] = None) -> str:
+        """
+        Сохранить результат анализа в файл.
+        
+        Args:
+            result: Результат анализа
+            filename: Имя файла (опционально)
+            
+        Returns:
+            Путь к сохранённому файлу
+        """
+        return self._save([result], filename, summary=False)
+    
+    def output_full(self, results: List[AnalysisResult], filename: Optional[str] = None) -> str:
+        """
+        Сохранить результаты от нескольких модулей.
+        
+        Args:
+            results: Список результатов анализа
+            filename: Имя файла (опционально)
+            
+        Returns:
+            Путь к сохранённому файлу
+        """
+        if not results:
+            return ""
+        return self._save(results, filename, summary=True)
+
+
+def get_file_output(fmt: str, output_dir: Optional[str] = None) -> FileOutput:
+    """
+    Создать вывод в файл заданного формата.
+    
+    Args:
+        fmt: Формат из FILE_FORMATS
+        output_dir: Директория для сохранения файлов
+        
+    Returns:
+        Экземпляр FileOutput
+        
+    Raises:
+        KeyError: Если формат не поддерживается
+    """
+    module_name, class_name = FILE_FORMATS[fmt].split(":")
+    return getattr(import_module(module_name), class_name)(output_dir)
+
+
+def format_from_filename(filename: Optional[str], default: str = "txt") -> str:
+    """
+    Определить формат по расширению имени файла.
+    
+    Args:
+        filename: Имя файла (может быть None)
+        default: Формат, если расширение не распознано
+        
+    Returns:
+        Ключ формата из FILE_FORMATS
+    """
+    if filename:
+        extension = Path(filename).suffix.lstrip(".").lower()
+        extension = {"markdown": "md", "jsonl": "ndjson"}.get(extension, extension)
+        if extension in FILE_FORMATS:
+            return extension
+    return default
@@ -0,0 +1,129 @@
+"""
+Машиночитаемые и Markdown-форматы отчёта.
+
+- NDJSON: по строке JSON на результат модуля, дописывается в конец
+  файла - подходит для пакетных прогонов по сотням URL;
+- JSON: массив результатов;
+- CSV: по строке на рекомендацию;
+- Markdown: читаемый отчёт для вики и задач.
+"""
+
+import csv
+import io
+from typing import List, Optional
+
+from core.models import AnalysisResult
+from outputs.file_output import FileOutput
+
+
+# Служебные поля результата, которые не нужны в отчёте
+EXCLUDED_FIELDS = {"raw_response", "section_fingerprints"}
+
+CSV_COLUMNS = ["url", "module", "number", "priority", "title", "description", "analyzed_at"]
+
+
+class NdjsonOutput(FileOutput):
+    """Результаты в формате NDJSON (JSON Lines), с дописыванием в конец файла."""
+    
+    name = "NDJSON Output"
+    description = "Построчный JSON для пакетной обработки"
+    extension = "ndjson"
+    append = True
+    
+    def _format_result(self, result: AnalysisResult) -> str:
+        """Строка JSON с результатом модуля."""
+        return result.model_dump_json(exclude=EXCLUDED_FIELDS) + "\n"
+
+
+class JsonOutput(FileOutput):
+    """Результаты в виде JSON-массива, который пишется по элементу."""
+    
+    name = "JSON Output"
+    description = "Сохранение результатов в JSON"
+    extension = "json"
+    
+    def _header(self, url: str, results: Optional[List[AnalysisResult]]) -> str:
+        """Начало массива."""
+        return "["
+    
+    def _format_record(self, result: AnalysisResult, index: int) -> str:
+        """Элемент массива (с разделителем перед всеми, кроме первого)."""
+        separator = "\n" if index == 0 else ",\n"
+        return separator + result.model_dump_json(exclude=EXCLUDED_FIELDS)
+    
+    def _format_result(self, result: AnalysisResult) -> str:
+        """Результат модуля в JSON."""
+        return result.model_dump_json(exclude=EXCLUDED_FIELDS)
+    
+    def _footer(self) -> str:
+        """Конец массива."""
+        return "\n]\n"
+
+
+class CsvOutput(FileOutput):
+    """Рекомендации в CSV: одна строка на рекомендацию, с дописыванием в конец файла."""
+    
+    name = "CSV Output"
+    description = "Таблица рекомендаций в CSV"
+    extension = "csv"
+    append = True
+    
+    def _rows(self, rows: List[list]) -> str:
+        """Строки CSV в виде текста."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+    
+    def _header(self, url: str, results: Optional[List[AnalysisResult]]) -> str:
+        """Строка с названиями столбцов."""
+        return self._rows([CSV_COLUMNS])
+    
+    def _format_result(self, result: AnalysisResult) -> str:
+        """Строки с рекомендациями модуля."""
+        analyzed_at = result.analyzed_at.isoformat()
+        return self._rows([
+            [
+                result.url,
+                result.module_name,
+                rec.number,
+                rec.priority or "",
+                rec.title,
+                rec.description,
+                analyzed_at,
+            ]
+            for rec in result.recommendations
+        ])
+
+
+class MarkdownOutput(FileOutput):
+    """Отчёт в формате Markdown."""
+    
+    name = "Markdown Output"
+    description = "Сохранение результатов в Markdown"
+    extension = "md"
+    
+    def _header(self, url: str, results: Optional[List[AnalysisResult]]) -> str:
+        """Заголовок отчёта."""
+        lines = ["# Анализ лендинга", ""]
+        if url:
+            lines.append(f"- **URL:** {url}")
+        lines.append(f"- **Дата:** {self._report_date(results)}")
+        if results is not None:
+            lines.append(f"- **Модулей анализа:** {len(results)}")
+            lines.append(f"- **Всего рекомендаций:** {sum(len(r.recommendations) for r in results)}")
+        return "\n".join(lines) + "\n"
+    
+    def _format_result(self, result: AnalysisResult) -> str:
+        """Раздел с рекомендациями модуля."""
+        lines = ["", f"## {result.module_name}", "", f"_{result.module_description}_", ""]
+        if not result.recommendations:
+            lines.append("Рекомендации не найдены.")
+        for rec in result.recommendations:
+            priority = f" _({rec.priority})_" if rec.priority else ""
+            lines.append(f"{rec.number}. **{rec.title}**{priority}  ")
+            lines.append("   " + rec.description.replace("\n", "\n   "))
+        return "\n".join(lines) + "\n"
+    
+    def _footer(self) -> str:
+        """Подпись в конце отчёта."""
+        return "\n---\n\n_Сгенерировано: Landing Redesign Assistant_\n"
@@ -0,0 +1,170 @@
+"""
+Ограничение объёма директории отчётов.
+
+Отчёты удаляются, начиная с самых старых, пока директория не уложится
+во все лимиты: срок хранения, общий размер и число файлов. Удаляются
+только файлы отчётов (analysis_*, batch_*, replay_*): служебные файлы и
+поддиректории (хранилище результатов, .gitkeep) не затрагиваются.
+Заодно удаляются временные файлы, брошенные процессами, которые
+упали во время записи отчёта.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from core.config import settings
+from outputs.stream_writer import TEMP_SUFFIX
+
+
+logger = logging.getLogger(__name__)
+
+# Префиксы имён файлов, которые создают модули вывода
+REPORT_PREFIXES = ("analysis_", "batch_", "replay_")
+
+# Возраст, после которого временный файл считается брошенным (процесс упал при записи)
+STALE_TEMP_AGE = 3600
+
+
+class OutputRetention:
+    """Политика хранения файлов отчётов в директории."""
+    
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_age_days: Optional[float] = None,
+        max_total_mb: Optional[float] = None,
+        max_files: Optional[int] = None
+    ):
+        """
+        Инициализация политики (0 в любом лимите - без ограничения).
+        
+        Args:
+            directory: Директория отчётов
+            max_age_days: Срок хранения в днях
+            max_total_mb: Наибольший общий размер в МБ
+            max_files: Наибольшее число файлов
+        """
+        self.directory = Path(directory or settings.output_dir)
+        self.max_age = (settings.output_max_age_days if max_age_days is None else max_age_days) * 86400
+        self.max_total_bytes = (settings.output_max_total_mb if max_total_mb is None else max_total_mb) * 1024 * 1024
+        self.max_files = settings.output_max_files if max_files is None else max_files
+    
+    def _scan(self) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+        """Файлы отчётов (от старых к новым) и временные файлы незавершённых отчётов."""
+        reports, temp_files = [], []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.name.startswith(REPORT_PREFIXES):
+                        reports.append(entry)
+                    elif entry.name.startswith(".") and entry.name.endswith(TEMP_SUFFIX):
+                        temp_files.append(entry)
+        except FileNotFoundError:
+            return [], []
+        reports.sort(key=lambda entry: entry.stat().st_mtime)
+        return reports, temp_files
+    
+    def _remove_stale_temp_files(self, temp_files: List[os.DirEntry]) -> None:
+        """Удалить временные файлы, брошенные упавшими процессами."""
+        stale_before = time.time() - STALE_TEMP_AGE
+        for entry in temp_files:
+            try:
+                if entry.stat().st_mtime < stale_before:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+    
+    def sweep(self) -> int:
+        """
+        Удалить отчёты сверх лимитов.
+        
+        Returns:
+            Количество удалённых файлов
+        """
+        reports, temp_files = self._scan()
+        self._remove_stale_temp_files(temp_files)
+        total_bytes = sum(entry.stat().st_size for entry in reports)
+        count = len(reports)
+        expire_before = time.time() - self.max_age if self.max_age else None
+        
+        removed = 0
+        for entry in reports:
+            stat = entry.stat()
+            if not (
+                (expire_before is not None and stat.st_mtime < expire_before)
+                or (self.max_total_bytes and total_bytes > self.max_total_bytes)
+                or (self.max_files and count > self.max_files)
+            ):
+                # Остальные файлы новее и лимиты соблюдены
+                break
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                # Удалён параллельно (другим воркером)
+                pass
+            except OSError as e:
+                logger.warning(f"Не удалось удалить отчёт {entry.path}: {e}")
+                continue
+            total_bytes -= stat.st_size
+            count -= 1
+            removed += 1
+            
+        if removed:
+            logger.info(f"Очистка {self.directory}: удалено отчётов - {removed}")
+        return removed
+
+
+class RetentionSweeper:
+    """
+    Фоновый поток, периодически выполняющий задачи очистки.
+    
+    Ошибка одной задачи записывается в лог и не останавливает остальные.
+    """
+    
+    def __init__(self, tasks: List[Callable[[], object]], interval: Optional[float] = None):
+        """
+        Инициализация.
+        
+        Args:
+            tasks: Функции очистки (например, OutputRetention.sweep)
+            interval: Интервал между проходами в секундах
+        """
+        self.tasks = tasks
+        self.interval = interval or settings.output_sweep_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def run_once(self) -> None:
+        """Выполнить все задачи очистки."""
+        for task in self.tasks:
+            try:
+                task()
+            except Exception as e:
+                logger.warning(f"Ошибка фоновой очистки: {e}")
+    
+    def start(self) -> None:
+        """Запустить фоновую очистку (первый проход выполняется сразу)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="retention-sweeper", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Остановить фоновую очистку."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+    
+    def _run(self) -> None:
+        """Цикл фоновой очистки."""
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval)
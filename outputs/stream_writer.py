@@ -0,0 +1,169 @@
+"""
+Потоковая запись отчётов на диск.
+
+Отчёт пишется по мере поступления результатов, а не собирается
+целиком в памяти. Чтобы записи пакетного прогона не терялись при
+сбое и при этом не платить за fsync после каждой строки, синхронизация
+с диском выполняется пачками: раз в settings.output_fsync_every
+записей или раз в settings.output_fsync_interval секунд.
+
+Запись безопасна при параллельных писателях (пакетные прогоны,
+несколько воркеров) и не требует блокировок:
+- отчёт целиком пишется во временный файл рядом с итоговым и
+  появляется под своим именем атомарно (os.replace) только готовым;
+- построчные форматы дописываются в общий файл с O_APPEND, каждая
+  запись - одним системным вызовом write, поэтому записи разных
+  процессов не перемешиваются.
+"""
+
+import hashlib
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import BinaryIO, List, Optional
+
+from core.config import settings
+
+
+# Суффикс временных файлов (их имена начинаются с точки)
+TEMP_SUFFIX = ".tmp"
+
+
+class StreamWriter:
+    """
+    Файл отчёта, открытый для последовательной записи.
+    
+    Запись - логическая единица отчёта (результат модуля, строка CSV);
+    после каждой вызывается end_record(). Текст записи накапливается
+    в памяти и уходит в файл целиком.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        append: bool = False,
+        fsync_every: Optional[int] = None,
+        fsync_interval: Optional[float] = None,
+        content_addressed: bool = False
+    ):
+        """
+        Открыть файл для записи.
+        
+        Args:
+            path: Путь к файлу
+            append: Дописывать в конец существующего файла
+            fsync_every: Записей между синхронизациями с диском (0 - без fsync)
+            fsync_interval: Наибольший интервал между синхронизациями в секундах
+            content_addressed: Дополнить имя файла хэшем содержимого;
+                одинаковые отчёты хранятся одним файлом
+        """
+        self.path = Path(path)
+        self.append = append
+        self.fsync_every = settings.output_fsync_every if fsync_every is None else fsync_every
+        self.fsync_interval = settings.output_fsync_interval if fsync_interval is None else fsync_interval
+        self._digest = hashlib.sha256() if content_addressed and not append else None
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._temp_path: Optional[Path]
+        self._file: BinaryIO
+        if append:
+            # Без буфера: каждая запись - один write() с O_APPEND
+            self._temp_path = None
+            self._file = open(self.path, "ab", buffering=0)
+            self.is_new = os.fstat(self._file.fileno()).st_size == 0
+        else:
+            self._temp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:8]}{TEMP_SUFFIX}")
+            self._file = open(self._temp_path, "wb")
+            self.is_new = True
+            
+        self._buffer: List[str] = []
+        self._pending = 0
+        self._last_sync = time.monotonic()
+    
+    def write(self, text: str, hashed: bool = True) -> None:
+        """
+        Добавить фрагмент к текущей записи.
+        
+        Args:
+            text: Фрагмент отчёта
+            hashed: Учитывать фрагмент в хэше содержимого (False - для
+                частей, меняющихся от запуска к запуску, например даты)
+        """
+        if hashed or self._digest is None:
+            self._buffer.append(text)
+            return
+        self._write_buffer()
+        self._file.write(text.encode("utf-8"))
+    
+    def update_digest(self, text: str) -> None:
+        """Учесть в хэше содержимого текст, который не пишется в файл."""
+        if self._digest is not None:
+            self._digest.update(text.encode("utf-8"))
+    
+    def _write_buffer(self) -> None:
+        """Отправить накопленный текст в файл одним вызовом."""
+        if not self._buffer:
+            return
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer.clear()
+        if self._digest is not None:
+            self._digest.update(data)
+        self._file.write(data)
+    
+    def end_record(self) -> None:
+        """Отметить конец записи и при необходимости синхронизировать файл с диском."""
+        self._write_buffer()
+        self._pending += 1
+        if not self.fsync_every:
+            return
+        if (
+            self._pending >= self.fsync_every
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+    
+    def sync(self) -> None:
+        """Сбросить буфер и дождаться записи на диск."""
+        self._write_buffer()
+        self._file.flush()
+        if self.fsync_every:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+    
+    def close(self) -> None:
+        """Дописать оставшееся, закрыть файл и опубликовать его под итоговым именем."""
+        if self._file.closed:
+            return
+        self._write_buffer()
+        if self._pending or self._temp_path is not None:
+            # Перед переименованием данные должны быть на диске,
+            # иначе после сбоя под итоговым именем окажется пустой файл
+            self.sync()
+        self._file.close()
+        if self._temp_path is not None:
+            self._publish(self._temp_path)
+    
+    def _publish(self, temp_path: Path) -> None:
+        """
+        Переименовать временный файл в итоговый.
+        
+        Args:
+            temp_path: Путь к временному файлу
+        """
+        if self._digest is not None:
+            digest = self._digest.hexdigest()[:16]
+            self.path = self.path.with_name(f"{self.path.stem}_{digest}{self.path.suffix}")
+            if self.path.exists():
+                # Такой же отчёт уже сохранён: обновляем время для очистки
+                os.unlink(temp_path)
+                os.utime(self.path)
+                return
+        os.replace(temp_path, self.path)
+    
+    def __enter__(self) -> "StreamWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
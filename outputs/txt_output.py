@@ -2,16 +2,13 @@
 TXT Output - сохранение результатов в текстовый файл.
 """
 
-from datetime import datetime
-from pathlib import Path
 from typing import List, Optional
 
-from core.interfaces import BaseOutput
 from core.models import AnalysisResult
-from core.utils import get_file_timestamp
+from outputs.file_output import FileOutput
 
 
-class TxtOutput(BaseOutput):
+class TxtOutput(FileOutput):
     """
     Сохранение результатов анализа в TXT-файл.
     
@@ -20,23 +17,24 @@ class TxtOutput(BaseOutput):
     
     name = "TXT Output"
     description = "Сохранение результатов в текстовый файл"
+    extension = "txt"
     
-    def __init__(self, output_dir: Optional[str] = None):
-        """
-        Инициализация.
-        
-        Args:
-            output_dir: Директория для сохранения файлов
-        """
-        self.output_dir = Path(output_dir) if output_dir else Path.cwd()
-    
-    def _generate_filename(self, url: str) -> str:
-        """Сгенерировать имя файла."""
-        timestamp = get_file_timestamp()
-        # Извлекаем домен из URL для имени файла
-        domain = url.replace("https://", "").replace("http://", "")
-        domain = domain.split("/")[0].replace(".", "_")
-        return f"analysis_{domain}_{timestamp}.txt"
+    def _header(self, url: str, results: Optional[List[AnalysisResult]]) -> str:
+        """Шапка отчёта (со сводкой, если результаты известны заранее)."""
+        content = []
+        content.append("=" * 60)
+        content.append("  АНАЛИЗ ЛЕНДИНГА")
+        content.append("=" * 60)
+        if url:
+            content.append(f"\nURL: {url}")
+            content.append(f"Дата: {self._report_date(results)}")
+        else:
+            content.append(f"\nДата: {self._report_date(results)}")
+        if results is not None:
+            total_recommendations = sum(len(r.recommendations) for r in results)
+            content.append(f"Модулей анализа: {len(results)}")
+            content.append(f"Всего рекомендаций: {total_recommendations}")
+        return "\n".join(content)
     
     def _format_result(self, result: AnalysisResult) -> str:
         """Форматировать результат одного модуля."""
@@ -48,89 +46,20 @@ class TxtOutput(BaseOutput):
         
         if not result.recommendations:
             lines.append("   Рекомендации не найдены.\n")
-            return "\n".join(lines)
+            return "\n" + "\n".join(lines)
         
         for rec in result.recommendations:
             lines.append(f"{rec.number}. {rec.title}")
             lines.append(f"   {rec.description}")
             lines.append("")
         
-        return "\n".join(lines)
-    
-    def output(self, result: AnalysisResult, filename: Optional[str] = None) -> str:
-        """
-        Сохранить результат анализа в файл.
-        
-        Args:
-            result: Результат анализа
-            filename: Имя файла (опционально)
-            
-        Returns:
-            Путь к сохранённому файлу
-        """
-        if filename is None:
-            filename = self._generate_filename(result.url)
-        
-        filepath = self.output_dir / filename
-        
-        content = []
-        content.append("=" * 60)
-        content.append("  АНАЛИЗ ЛЕНДИНГА")
-        content.append("=" * 60)
-        content.append(f"\nURL: {result.url}")
-        content.append(f"Дата: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
-        content.append(self._format_result(result))
-        content.append("\n" + "=" * 60)
-        content.append("  Сгенерировано: Landing Redesign Assistant")
-        content.append("=" * 60)
-        
-        text = "\n".join(content)
-        
-        filepath.write_text(text, encoding="utf-8")
-        
-        return str(filepath)
+        return "\n" + "\n".join(lines)
     
-    def output_full(self, results: List[AnalysisResult], filename: Optional[str] = None) -> str:
-        """
-        Сохранить результаты от нескольких модулей.
-        
-        Args:
-            results: Список результатов анализа
-            filename: Имя файла (опционально)
-            
-        Returns:
-            Путь к сохранённому файлу
-        """
-        if not results:
-            return ""
-        
-        url = results[0].url
-        if filename is None:
-            filename = self._generate_filename(url)
-        
-        filepath = self.output_dir / filename
-        
-        total_recommendations = sum(len(r.recommendations) for r in results)
-        
+    def _footer(self) -> str:
+        """Подпись в конце отчёта."""
         content = []
-        content.append("=" * 60)
-        content.append("  АНАЛИЗ ЛЕНДИНГА")
-        content.append("=" * 60)
-        content.append(f"\nURL: {url}")
-        content.append(f"Дата: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
-        content.append(f"Модулей анализа: {len(results)}")
-        content.append(f"Всего рекомендаций: {total_recommendations}")
-        
-        for result in results:
-            content.append(self._format_result(result))
-        
         content.append("\n" + "=" * 60)
         content.append("  Сгенерировано: Landing Redesign Assistant")
         content.append("=" * 60)
-        
-        text = "\n".join(content)
-        
-        filepath.write_text(text, encoding="utf-8")
-        
-        return str(filepath)
-
+        return "\n" + "\n".join(content)
+        
\ No newline at end of file
@@ -6,6 +6,10 @@
     python run_web.py
     python run_web.py --port 8080
     python run_web.py --host 0.0.0.0 --port 8000
+    python run_web.py --host 0.0.0.0 --workers 4
+
+В режиме нескольких воркеров сигнал SIGHUP главному процессу
+перезапускает воркеры по одному без остановки сервера.
 """
 
 import argparse
@@ -17,6 +21,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import uvicorn
 
+from core.config import settings
+
+# Время на завершение текущих запросов при остановке/перезапуске воркера
+GRACEFUL_SHUTDOWN_TIMEOUT = 30
+
 
 def main():
     parser = argparse.ArgumentParser(description="Запуск веб-сервера Landing Redesign Assistant")
@@ -37,7 +46,18 @@ def main():
         help="Автоматическая перезагрузка при изменении кода (для разработки)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.web_workers,
+        help="Число процессов-воркеров (по умолчанию: WEB_WORKERS или 1)"
+    )
+    
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers должно быть не меньше 1")
+    if args.reload and args.workers > 1:
+        parser.error("--reload несовместим с --workers больше 1")
     
     print(f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -56,7 +76,9 @@ def main():
         "web.app:app",
         host=args.host,
         port=args.port,
-        reload=args.reload
+        reload=args.reload,
+        workers=args.workers,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT
     )
 
 
@@ -1,8 +1,18 @@
 """
 Scrapers module - модули парсинга веб-страниц.
+
+Классы импортируются лениво: синхронному парсеру не нужен httpx.
 """
 
-from scrapers.html_parser import HTMLParser
+from core.lazy import lazy_exports
+
+_EXPORTS = {
+    "HTMLParser": "scrapers.html_parser",
+    "AsyncHTMLParser": "scrapers.async_html_parser",
+    "ReplayScraper": "scrapers.replay",
+    "FetchScheduler": "scrapers.scheduler",
+}
 
-__all__ = ["HTMLParser"]
+__all__ = list(_EXPORTS)
 
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,403 @@
+"""
+Асинхронный HTML-парсер на базе httpx.
+
+Один HTTP-клиент разделяется всеми запросами event loop: пул соединений
+с keep-alive, HTTP/2, лимиты соединений на хост и кэш DNS-ответов.
+Клиент и семафоры хостов создаются для каждого event loop отдельно:
+объекты asyncio привязаны к циклу, в котором созданы.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import socket
+import time
+import weakref
+from contextlib import contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import httpcore
+import httpx
+
+from core.archive import archive_page, get_archive
+from core.config import settings
+from core.exceptions import ScraperError
+from core.interfaces import AsyncBaseScraper
+from core.models import PageContent
+from scrapers.html_parser import HTMLParser, connection_error, http_error
+from scrapers.negative_cache import CONNECT, TIMEOUT, get_negative_cache
+from scrapers.parse_pool import get_parse_pool
+from scrapers.session_pool import DEFAULT_HEADERS
+
+
+logger = logging.getLogger(__name__)
+
+# Общие клиенты и семафоры хостов по event loop (удаляются вместе с циклом)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_host_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+# Исключения httpcore и соответствующие им исключения httpx
+HTTPCORE_ERRORS = {
+    httpcore.ConnectTimeout: httpx.ConnectTimeout,
+    httpcore.ReadTimeout: httpx.ReadTimeout,
+    httpcore.WriteTimeout: httpx.WriteTimeout,
+    httpcore.PoolTimeout: httpx.PoolTimeout,
+    httpcore.TimeoutException: httpx.TimeoutException,
+    httpcore.ConnectError: httpx.ConnectError,
+    httpcore.ReadError: httpx.ReadError,
+    httpcore.WriteError: httpx.WriteError,
+    httpcore.NetworkError: httpx.NetworkError,
+    httpcore.ProxyError: httpx.ProxyError,
+    httpcore.UnsupportedProtocol: httpx.UnsupportedProtocol,
+    httpcore.RemoteProtocolError: httpx.RemoteProtocolError,
+    httpcore.LocalProtocolError: httpx.LocalProtocolError,
+    httpcore.ProtocolError: httpx.ProtocolError,
+}
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """
+    Сетевой бэкенд httpcore с кэшированием DNS-ответов.
+    
+    Разрешённые адреса хранятся settings.scraper_dns_cache_ttl секунд,
+    повторные подключения к хосту не выполняют DNS-запрос.
+    """
+    
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float):
+        """
+        Инициализация бэкенда.
+        
+        Args:
+            backend: Бэкенд, выполняющий реальные подключения
+            ttl: Время жизни записи кэша в секундах
+        """
+        self._backend = backend
+        self._ttl = ttl
+        self._cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+    
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        """Разрешить имя хоста с учётом кэша."""
+        cached = self._cache.get((host, port))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+            
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._cache[(host, port)] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+    
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        """Подключиться к первому доступному адресу хоста."""
+        try:
+            addresses = await self._resolve(host, port)
+        except OSError:
+            addresses = [host]
+            
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+        self._cache.pop((host, port), None)
+        raise last_error
+    
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        """Подключиться к unix-сокету."""
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+    
+    async def sleep(self, seconds: float) -> None:
+        """Асинхронная пауза."""
+        await self._backend.sleep(seconds)
+
+
+@contextmanager
+def _httpx_errors() -> Iterator[None]:
+    """Преобразовать исключения httpcore в исключения httpx."""
+    try:
+        yield
+    except tuple(HTTPCORE_ERRORS) as e:
+        error = next(HTTPCORE_ERRORS[cls] for cls in type(e).__mro__ if cls in HTTPCORE_ERRORS)
+        raise error(str(e)) from e
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """Тело ответа httpcore как поток httpx."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _httpx_errors():
+            async for part in self._stream:
+                yield part
+    
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            with _httpx_errors():
+                await self._stream.aclose()
+
+
+class CachingDNSTransport(httpx.AsyncBaseTransport):
+    """
+    Транспорт httpx поверх пула httpcore с кэширующим DNS-бэкендом.
+    
+    httpx.AsyncHTTPTransport не принимает сетевой бэкенд, поэтому пул
+    создаётся здесь через публичный конструктор httpcore.
+    """
+    
+    def __init__(self, http2: bool, limits: httpx.Limits, dns_ttl: float):
+        """
+        Инициализация транспорта.
+        
+        Args:
+            http2: Разрешить HTTP/2
+            limits: Лимиты пула соединений
+            dns_ttl: Время жизни записи кэша DNS в секундах
+        """
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=CachingDNSBackend(httpcore.AnyIOBackend(), dns_ttl)
+        )
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Выполнить запрос через пул соединений."""
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions
+        )
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(core_request)
+            
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions
+        )
+    
+    async def aclose(self) -> None:
+        """Закрыть пул соединений."""
+        await self._pool.aclose()
+
+
+def _detect_encoding(content: bytes) -> str:
+    """Определить кодировку ответа без заголовка charset."""
+    from charset_normalizer import from_bytes
+    
+    best = from_bytes(content).best()
+    return best.encoding if best else "utf-8"
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Создать общий HTTP-клиент с пулом соединений."""
+    http2 = settings.scraper_http2 and importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(
+        max_connections=settings.scraper_max_connections,
+        max_keepalive_connections=settings.scraper_max_connections,
+        keepalive_expiry=settings.scraper_keepalive_expiry
+    )
+    
+    transport: httpx.AsyncBaseTransport
+    if settings.scraper_dns_cache_ttl > 0:
+        transport = CachingDNSTransport(http2, limits, settings.scraper_dns_cache_ttl)
+    else:
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        
+    headers = dict(DEFAULT_HEADERS)
+    if importlib.util.find_spec("brotli") is None:
+        headers["Accept-Encoding"] = "gzip, deflate"
+        
+    logger.info(f"Создание общего HTTP-клиента (HTTP/2: {http2})")
+    return httpx.AsyncClient(
+        transport=transport,
+        headers=headers,
+        follow_redirects=True,
+        default_encoding=_detect_encoding
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Получить общий асинхронный HTTP-клиент текущего event loop.
+    
+    Вызывается только из корутин: соединения пула привязаны к циклу.
+    
+    Returns:
+        Клиент httpx с общим пулом соединений
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _create_client()
+        _clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Закрыть общий HTTP-клиент текущего event loop и освободить соединения."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    _host_limits.pop(loop, None)
+
+
+def _host_limit(url: str) -> asyncio.Semaphore:
+    """Получить семафор текущего event loop, ограничивающий число запросов к хосту."""
+    limits = _host_limits.setdefault(asyncio.get_running_loop(), {})
+    host = urlparse(url).netloc.lower()
+    semaphore = limits.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.scraper_max_connections_per_host)
+        limits[host] = semaphore
+    return semaphore
+
+
+class AsyncHTMLParser(AsyncBaseScraper):
+    """
+    Асинхронный парсер HTML-страниц.
+    
+    Использует общий клиент httpx для загрузки и HTMLParser для разбора.
+    """
+    
+    name = "Async HTML Parser"
+    description = "Асинхронный парсер HTML-страниц с пулом соединений"
+    
+    def __init__(self, timeout: Optional[int] = None):
+        """
+        Инициализация парсера.
+        
+        Args:
+            timeout: Таймаут запроса в секундах
+        """
+        self.timeout = timeout or settings.scraper_timeout
+        self._parser = HTMLParser(timeout=self.timeout)
+    
+    async def fetch(self, url: str) -> str:
+        """
+        Загрузить HTML-код страницы.
+        
+        Args:
+            url: URL страницы для загрузки
+            
+        Returns:
+            HTML-код страницы
+            
+        Raises:
+            ScraperError: При ошибке загрузки (в том числе запомненной
+                кэшем ошибок - тогда сразу, без запроса)
+        """
+        negative_cache = get_negative_cache()
+        if negative_cache is not None:
+            negative_cache.check(url)
+            
+        try:
+            return await self._download(url)
+        except ScraperError as e:
+            if negative_cache is not None:
+                negative_cache.remember(e)
+            raise
+    
+    async def _download(self, url: str) -> str:
+        """Загрузить страницу по сети (без кэша ошибок)."""
+        logger.info(f"Загрузка страницы: {url}")
+        client = get_async_client()
+        
+        try:
+            async with _host_limit(url):
+                response = await client.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            
+            html = response.text
+            logger.info(f"Страница загружена: {len(html)} символов")
+            if get_archive() is not None:
+                # Запись на диск не должна задерживать event loop
+                await asyncio.to_thread(archive_page, url, html)
+            return html
+            
+        except httpx.TimeoutException as e:
+            raise ScraperError(
+                f"Превышен таймаут ({self.timeout} сек)",
+                url=url,
+                kind=CONNECT if isinstance(e, httpx.ConnectTimeout) else TIMEOUT
+            )
+        except httpx.ConnectError as e:
+            raise connection_error(e, url)
+        except httpx.HTTPStatusError as e:
+            raise http_error(e.response, url)
+        except httpx.HTTPError as e:
+            raise ScraperError(str(e), url=url)
+    
+    def parse(self, html: str, url: str = "") -> PageContent:
+        """
+        Извлечь контент из HTML.
+        
+        Args:
+            html: HTML-код страницы
+            url: URL страницы (опционально)
+            
+        Returns:
+            PageContent с извлечённым контентом
+        """
+        return self._parser.parse(html, url=url)
+    
+    async def fetch_and_parse(self, url: str) -> PageContent:
+        """
+        Загрузить и распарсить страницу.
+        
+        Разбор не блокирует event loop: при включённом пуле
+        (PARSE_POOL_SIZE > 0) он выполняется в отдельном процессе,
+        иначе - в потоке.
+        
+        Args:
+            url: URL страницы
+            
+        Returns:
+            PageContent с контентом страницы
+        """
+        html = await self.fetch(url)
+        pool = get_parse_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.parse, html, url=url)
+        return await pool.parse(html, url=url)
+    
+    async def fetch_many(self, urls: List[str]) -> List[Union[PageContent, ScraperError]]:
+        """
+        Параллельно загрузить и распарсить несколько страниц.
+        
+        Args:
+            urls: Список URL
+            
+        Returns:
+            Список PageContent или ScraperError в порядке исходных URL
+        """
+        async def load(url: str) -> Union[PageContent, ScraperError]:
+            try:
+                return await self.fetch_and_parse(url)
+            except ScraperError as e:
+                return e
+                
+        return list(await asyncio.gather(*(load(url) for url in urls)))
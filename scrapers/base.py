@@ -2,7 +2,7 @@
 Базовый класс парсера (реэкспорт из core).
 """
 
-from core.interfaces import BaseScraper
+from core.interfaces import BaseScraper, AsyncBaseScraper
 
-__all__ = ["BaseScraper"]
+__all__ = ["BaseScraper", "AsyncBaseScraper"]
 
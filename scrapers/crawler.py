@@ -0,0 +1,277 @@
+"""
+Обход нескольких страниц сайта (воронки лендинга).
+
+Находит ссылки того же origin до заданной глубины, загружает страницы
+через FetchScheduler (параллельно, с паузами между запросами к хосту и
+повторами после 429/503) с учётом robots.txt.
+Страницы отдаются потоком по мере загрузки, чтобы анализ первых страниц
+начинался до окончания обхода.
+"""
+
+import logging
+import re
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
+
+from core.config import settings
+from core.models import PageContent
+from core.sections import fingerprint_text
+from scrapers.html_parser import HTMLParser
+from scrapers.scheduler import FetchResult, FetchScheduler
+from scrapers.session_pool import DEFAULT_HEADERS
+
+
+logger = logging.getLogger(__name__)
+
+# Ссылки и канонический URL извлекаются регулярными выражениями:
+# полный разбор BeautifulSoup уже выполняется в HTMLParser.parse
+HREF_PATTERN = re.compile(r"""<a\s[^>]*?href\s*=\s*["']([^"'#]+)""", re.IGNORECASE)
+CANONICAL_PATTERN = re.compile(
+    r"""<link\s[^>]*?rel\s*=\s*["']canonical["'][^>]*?href\s*=\s*["']([^"']+)""",
+    re.IGNORECASE
+)
+
+# Ссылки на файлы, которые не являются HTML-страницами
+SKIP_EXTENSIONS = re.compile(
+    r"\.(pdf|jpe?g|png|gif|svg|webp|ico|css|js|zip|rar|docx?|xlsx?|pptx?|mp4|mp3|xml|json)$",
+    re.IGNORECASE
+)
+
+# Параметры запроса, не влияющие на содержимое страницы
+TRACKING_PARAMS = ("utm_", "yclid", "gclid", "fbclid", "_openstat")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Привести URL к каноническому виду для дедупликации.
+    
+    Убирает фрагмент, трекинговые параметры и завершающий слэш,
+    приводит схему и хост к нижнему регистру.
+    
+    Args:
+        url: Исходный URL
+        
+    Returns:
+        Нормализованный URL
+    """
+    parts = urlparse(url)
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ])
+    path = parts.path.rstrip("/") or "/"
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), path, "", query, ""))
+
+
+def extract_links(html: str, base_url: str) -> List[str]:
+    """
+    Извлечь ссылки на страницы того же origin.
+    
+    Args:
+        html: HTML-код страницы
+        base_url: URL страницы (для относительных ссылок)
+        
+    Returns:
+        Нормализованные URL без повторов, в порядке появления
+    """
+    origin = urlparse(base_url).netloc.lower()
+    links: Dict[str, None] = {}
+    
+    for href in HREF_PATTERN.findall(html):
+        href = href.strip()
+        if href.startswith(("mailto:", "tel:", "javascript:")):
+            continue
+        absolute = urljoin(base_url, href)
+        parts = urlparse(absolute)
+        if parts.scheme not in ("http", "https") or parts.netloc.lower() != origin:
+            continue
+        if SKIP_EXTENSIONS.search(parts.path):
+            continue
+        links[normalize_url(absolute)] = None
+        
+    return list(links)
+
+
+class SiteCrawler:
+    """
+    Обходчик страниц одного сайта поверх HTMLParser.
+    
+    Загружает страницы через FetchScheduler с ограничением параллельности,
+    соблюдает паузу между запросами и правила robots.txt,
+    пропускает дубликаты по каноническому URL и хэшу содержимого.
+    """
+    
+    def __init__(
+        self,
+        scraper: Optional[HTMLParser] = None,
+        max_depth: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        delay: Optional[float] = None,
+        respect_robots: bool = True
+    ):
+        """
+        Инициализация обходчика.
+        
+        Args:
+            scraper: Парсер для загрузки страниц
+            max_depth: Максимальная глубина переходов от стартовой страницы
+            max_pages: Максимальное количество страниц
+            concurrency: Количество одновременных загрузок
+            delay: Пауза между запросами к сайту в секундах
+            respect_robots: Учитывать robots.txt
+        """
+        self.scraper = scraper or HTMLParser()
+        self.max_depth = settings.crawl_max_depth if max_depth is None else max_depth
+        self.max_pages = max_pages or settings.crawl_max_pages
+        self.concurrency = concurrency or settings.crawl_concurrency
+        self.delay = settings.crawl_delay if delay is None else delay
+        self.respect_robots = respect_robots
+        
+        self._robots: Optional[RobotFileParser] = None
+    
+    def _load_robots(self, start_url: str) -> None:
+        """Загрузить robots.txt сайта (при ошибке обход не ограничивается)."""
+        if not self.respect_robots:
+            return
+            
+        parts = urlparse(start_url)
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        parser = RobotFileParser(robots_url)
+        try:
+            response = self.scraper.session.get(robots_url, timeout=self.scraper.timeout)
+            if response.status_code >= 400:
+                return
+            parser.parse(response.text.splitlines())
+        except Exception as e:
+            logger.info(f"robots.txt недоступен ({robots_url}): {e}")
+            return
+            
+        self._robots = parser
+        crawl_delay = parser.crawl_delay(DEFAULT_HEADERS["User-Agent"])
+        if crawl_delay:
+            self.delay = max(self.delay, float(crawl_delay))
+    
+    def _allowed(self, url: str) -> bool:
+        """Разрешён ли URL правилами robots.txt."""
+        if self._robots is None:
+            return True
+        return self._robots.can_fetch(DEFAULT_HEADERS["User-Agent"], url)
+    
+    def _fetch(self, url: str) -> Tuple[str, PageContent]:
+        """Загрузить и распарсить страницу."""
+        html = self.scraper.fetch(url)
+        return html, self.scraper.parse(html, url=url)
+    
+    def crawl(self, start_url: str) -> Iterator[PageContent]:
+        """
+        Обойти сайт начиная со стартовой страницы.
+        
+        Обход заканчивается, когда отдано max_pages страниц или ссылки
+        кончились. Ещё не загруженные ссылки и начатые загрузки при этом
+        отбрасываются (см. FetchScheduler.close); так же - если перебор
+        прерван вызывающим кодом.
+        
+        Args:
+            start_url: URL стартовой страницы
+            
+        Yields:
+            PageContent каждой уникальной страницы по мере загрузки
+            
+        Raises:
+            ScraperError: Если не удалось загрузить стартовую страницу
+        """
+        start_url = normalize_url(start_url)
+        self._load_robots(start_url)
+        
+        seen_urls: Set[str] = {start_url}
+        seen_hashes: Set[str] = set()
+        depths: Dict[str, int] = {start_url: 0}
+        # Найденные ссылки ждут очереди: в загрузке одновременно не больше
+        # страниц, чем осталось до max_pages, а дубликаты и ошибки в лимит
+        # не засчитываются и освобождают место для следующих ссылок
+        frontier: Deque[str] = deque()
+        in_flight = 1
+        yielded = 0
+        
+        # Паузу и параллельность для хоста соблюдает планировщик;
+        # с одним хостом общий лимит совпадает с лимитом хоста
+        with FetchScheduler(
+            self._fetch,
+            concurrency=self.concurrency,
+            host_concurrency=self.concurrency,
+            host_delay=self.delay
+        ) as scheduler:
+            scheduler.submit(start_url)
+            
+            for result in scheduler.as_completed():
+                in_flight -= 1
+                content = self._accept(result, start_url, depths, seen_urls, seen_hashes, frontier)
+                if content is not None:
+                    yielded += 1
+                    logger.info(f"Страница {yielded}: {result.url} (глубина {depths[result.url]})")
+                    yield content
+                    if yielded >= self.max_pages:
+                        return
+                        
+                while frontier and yielded + in_flight < self.max_pages:
+                    scheduler.submit(frontier.popleft())
+                    in_flight += 1
+    
+    def _accept(
+        self,
+        result: FetchResult,
+        start_url: str,
+        depths: Dict[str, int],
+        seen_urls: Set[str],
+        seen_hashes: Set[str],
+        frontier: Deque[str]
+    ) -> Optional[PageContent]:
+        """
+        Обработать загруженную страницу: отсеять дубликат, добавить ссылки в очередь.
+        
+        Args:
+            result: Результат загрузки
+            start_url: URL стартовой страницы
+            depths: Глубина каждого найденного URL
+            seen_urls: Уже найденные URL (включая канонические)
+            seen_hashes: Хэши содержимого отданных страниц
+            frontier: Очередь ссылок на загрузку
+            
+        Returns:
+            PageContent новой страницы или None (ошибка загрузки или дубликат)
+            
+        Raises:
+            ScraperError: Если не удалось загрузить стартовую страницу
+        """
+        url, depth = result.url, depths[result.url]
+        if result.error is not None:
+            if url == start_url:
+                raise result.error
+            logger.warning(f"Страница пропущена: {result.error}")
+            return None
+        html, content = result.value
+        
+        canonical = CANONICAL_PATTERN.search(html)
+        if canonical and url != start_url:
+            canonical_url = normalize_url(urljoin(url, canonical.group(1)))
+            if canonical_url != url and canonical_url in seen_urls:
+                return None
+            seen_urls.add(canonical_url)
+            
+        content_hash = fingerprint_text(content.text)
+        if content_hash in seen_hashes:
+            return None
+        seen_hashes.add(content_hash)
+        
+        if depth < self.max_depth:
+            for link in extract_links(html, url):
+                if link in seen_urls or not self._allowed(link):
+                    continue
+                seen_urls.add(link)
+                depths[link] = depth + 1
+                frontier.append(link)
+        return content
+                    
\ No newline at end of file
@@ -3,20 +3,141 @@ HTML-парсер для извлечения контента из веб-ст
 """
 
 import logging
-from typing import Optional
+import re
+import socket
+import time
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
 
+from core.archive import archive_page
 from core.config import settings
 from core.exceptions import ScraperError
 from core.interfaces import BaseScraper
-from core.models import PageContent
+from core.models import PageContent, PageSection, PageStructure
+from core.sections import fingerprint_text, make_section_key
+from core.tokens import truncate_to_tokens
 from core.utils import clean_text, truncate_text
+from scrapers.negative_cache import CONNECT, DNS, TIMEOUT, get_negative_cache
+from scrapers.session_pool import get_session
+from scrapers.spa_fallback import extract_embedded_text, load_snapshot, looks_like_empty_shell
 
 
 logger = logging.getLogger(__name__)
 
+# Понятные сообщения для HTTP-ошибок
+HTTP_ERROR_MESSAGES = {
+    401: "Сайт требует авторизации или блокирует автоматические запросы (401 Unauthorized)",
+    403: "Доступ запрещён - сайт блокирует запросы (403 Forbidden)",
+    404: "Страница не найдена (404 Not Found)",
+    429: "Слишком много запросов - сайт ограничивает частоту (429 Too Many Requests)",
+    500: "Внутренняя ошибка сервера (500)",
+    503: "Сервис временно недоступен (503 Service Unavailable)"
+}
+
+# Признаки CTA-элементов: классы кнопок и типовые тексты призывов
+CTA_CLASS_PATTERN = re.compile(r"\b(btn|button|cta)\b", re.IGNORECASE)
+CTA_TEXT_PATTERN = re.compile(
+    r"^(купить|заказать|оформить|записаться|подписаться|зарегистрироваться|"
+    r"оставить заявку|получить|попробовать|начать|скачать|"
+    r"buy|order|sign ?up|subscribe|get started|try|download|start)",
+    re.IGNORECASE
+)
+
+# Теги текстовых блоков для поиска «стен текста»
+TEXT_BLOCK_TAGS = ["p", "li", "blockquote", "td"]
+
+# Заголовки, с которых начинается новая секция страницы
+SECTION_HEADING_TAGS = {"h1", "h2"}
+
+
+def http_error_message(status_code: int) -> str:
+    """
+    Получить понятное сообщение для HTTP-статуса.
+    
+    Args:
+        status_code: Код ответа сервера
+        
+    Returns:
+        Текст ошибки
+    """
+    return HTTP_ERROR_MESSAGES.get(status_code, f"HTTP ошибка: {status_code}")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Разобрать заголовок Retry-After.
+    
+    Args:
+        value: Значение заголовка (секунды или HTTP-дата)
+        
+    Returns:
+        Пауза в секундах или None, если заголовок отсутствует или некорректен
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def http_error(response, url: str) -> ScraperError:
+    """
+    Построить ScraperError по ответу с кодом ошибки.
+    
+    Args:
+        response: Ответ requests или httpx
+        url: URL страницы
+        
+    Returns:
+        ScraperError с кодом ответа и паузой из Retry-After
+    """
+    return ScraperError(
+        http_error_message(response.status_code),
+        url=url,
+        status_code=response.status_code,
+        retry_after=parse_retry_after(response.headers.get("Retry-After"))
+    )
+
+
+def is_dns_failure(error: BaseException) -> bool:
+    """
+    Вызвана ли ошибка подключения неудачным разрешением имени хоста.
+    
+    requests и httpx оборачивают socket.gaierror в свои исключения,
+    поэтому просматривается цепочка причин (включая MaxRetryError.reason).
+    
+    Args:
+        error: Ошибка подключения
+        
+    Returns:
+        True, если хост не найден в DNS
+    """
+    pending, seen = [error], set()
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, socket.gaierror) or "NameResolution" in type(current).__name__:
+            return True
+        linked = (current.__cause__, current.__context__, getattr(current, "reason", None), *current.args)
+        pending.extend(item for item in linked if isinstance(item, BaseException))
+    return False
+
+
+def connection_error(error: BaseException, url: str) -> ScraperError:
+    """ScraperError для ошибки подключения (с отдельным видом для ошибок DNS)."""
+    if is_dns_failure(error):
+        return ScraperError("Сервер не найден (ошибка DNS)", url=url, kind=DNS)
+    return ScraperError("Не удалось подключиться к серверу", url=url, kind=CONNECT)
+
 
 class HTMLParser(BaseScraper):
     """
@@ -31,7 +152,8 @@ class HTMLParser(BaseScraper):
     def __init__(
         self,
         timeout: Optional[int] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        keep_html: Optional[bool] = None
     ):
         """
         Инициализация парсера.
@@ -39,27 +161,16 @@ class HTMLParser(BaseScraper):
         Args:
             timeout: Таймаут запроса в секундах
             user_agent: User-Agent для HTTP-запросов
+            keep_html: Сохранять исходный HTML в PageContent
         """
         self.timeout = timeout or settings.scraper_timeout
         self.user_agent = user_agent or settings.scraper_user_agent
-        self.session = self._create_session()
+        self.keep_html = settings.keep_raw_html if keep_html is None else keep_html
     
-    def _create_session(self) -> requests.Session:
-        """Создать HTTP-сессию с настроенными заголовками."""
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Cache-Control": "max-age=0",
-        })
-        return session
+    @property
+    def session(self) -> requests.Session:
+        """Общая HTTP-сессия процесса (пул соединений)."""
+        return get_session()
     
     def fetch(self, url: str) -> str:
         """
@@ -72,8 +183,22 @@ class HTMLParser(BaseScraper):
             HTML-код страницы
             
         Raises:
-            ScraperError: При ошибке загрузки
+            ScraperError: При ошибке загрузки (в том числе запомненной
+                кэшем ошибок - тогда сразу, без запроса)
         """
+        negative_cache = get_negative_cache()
+        if negative_cache is not None:
+            negative_cache.check(url)
+            
+        try:
+            return self._download(url)
+        except ScraperError as e:
+            if negative_cache is not None:
+                negative_cache.remember(e)
+            raise
+    
+    def _download(self, url: str) -> str:
+        """Загрузить страницу по сети (без кэша ошибок)."""
         logger.info(f"Загрузка страницы: {url}")
         
         try:
@@ -87,40 +212,35 @@ class HTMLParser(BaseScraper):
             # Определяем кодировку
             response.encoding = response.apparent_encoding or "utf-8"
             
-            logger.info(f"Страница загружена: {len(response.text)} символов")
-            return response.text
+            html = response.text
+            logger.info(f"Страница загружена: {len(html)} символов")
+            archive_page(url, html)
+            return html
             
-        except requests.exceptions.Timeout:
+        except requests.exceptions.Timeout as e:
             raise ScraperError(
                 f"Превышен таймаут ({self.timeout} сек)", 
-                url=url
-            )
-        except requests.exceptions.ConnectionError:
-            raise ScraperError(
-                "Не удалось подключиться к серверу", 
-                url=url
+                url=url,
+                kind=CONNECT if isinstance(e, requests.exceptions.ConnectTimeout) else TIMEOUT
             )
+        except requests.exceptions.ConnectionError as e:
+            raise connection_error(e, url)
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            error_messages = {
-                401: "Сайт требует авторизации или блокирует автоматические запросы (401 Unauthorized)",
-                403: "Доступ запрещён - сайт блокирует запросы (403 Forbidden)",
-                404: "Страница не найдена (404 Not Found)",
-                500: "Внутренняя ошибка сервера (500)",
-                503: "Сервис временно недоступен (503 Service Unavailable)"
-            }
-            message = error_messages.get(status_code, f"HTTP ошибка: {status_code}")
-            raise ScraperError(message, url=url)
+            raise http_error(e.response, url)
         except requests.exceptions.RequestException as e:
             raise ScraperError(str(e), url=url)
     
-    def parse(self, html: str, url: str = "") -> PageContent:
+    def parse(self, html: str, url: str = "", use_fallbacks: bool = True) -> PageContent:
         """
         Извлечь контент из HTML.
         
+        Если страница оказалась пустым SPA-каркасом, текст ищется в снимке
+        страницы, встроенном JSON-состоянии и блоках <noscript>.
+        
         Args:
             html: HTML-код страницы
             url: URL страницы (опционально)
+            use_fallbacks: Искать текст SPA-страницы в альтернативных источниках
             
         Returns:
             PageContent с извлечённым контентом
@@ -129,6 +249,9 @@ class HTMLParser(BaseScraper):
         
         soup = BeautifulSoup(html, "lxml")
         
+        # Структуру извлекаем до удаления тегов: meta, header и nav нужны проверкам
+        structure = self._extract_structure(soup)
+        
         # Удаляем ненужные теги
         for tag in soup(["script", "style", "meta", "link", "noscript", "header", "footer", "nav"]):
             tag.decompose()
@@ -138,10 +261,47 @@ class HTMLParser(BaseScraper):
         if soup.title:
             title = soup.title.get_text(strip=True)
         
+        sections = self._extract_sections(soup)
+        
         # Извлекаем текст
         text = soup.get_text(separator="\n", strip=True)
+        
+        # Дерево BeautifulSoup содержит циклические ссылки и без явного
+        # разрушения живёт до прохода сборщика мусора
+        soup.decompose()
         text = clean_text(text)
-        text = truncate_text(text, settings.max_text_length)
+        
+        text_source = "html"
+        is_empty_shell = looks_like_empty_shell(html, text)
+        if is_empty_shell and use_fallbacks:
+            # Готовый снимок точнее всего, поэтому проверяется первым
+            snapshot = load_snapshot(url)
+            if snapshot is not None:
+                content = self.parse(snapshot, url=url, use_fallbacks=False)
+                content.text_source = "snapshot"
+                return content
+                
+            embedded = extract_embedded_text(html)
+            if embedded is not None:
+                text_source, text = embedded
+                text = clean_text(text)
+                sections = [PageSection(
+                    key="intro",
+                    text=text,
+                    fingerprint=fingerprint_text(text)
+                )]
+                if text_source != "noscript":
+                    # Разметка <noscript> уже учтена в структуре, а во встроенном
+                    # состоянии её нет: нули H1 и CTA каркаса ничего не говорят
+                    # о странице, поэтому признаки разметки помечаются неизвестными
+                    structure = PageStructure(meta_description=structure.meta_description, markup_known=False)
+                is_empty_shell = False
+                
+        if is_empty_shell:
+            logger.warning(f"Страница не содержит текста (SPA-каркас): {url}")
+            
+        structure.word_count = len(text.split())
+        text = truncate_text(truncate_to_tokens(text, settings.max_text_tokens), settings.max_text_length)
         
         logger.info(f"Извлечено: {len(text)} символов текста")
         
@@ -149,7 +309,114 @@ class HTMLParser(BaseScraper):
             url=url,
             title=title,
             text=text,
-            html=html[:50000] if len(html) > 50000 else html  # Ограничиваем HTML
+            html=html if self.keep_html else None,  # Ссылка на исходную строку, без копии
+            structure=structure,
+            sections=sections,
+            text_source=text_source,
+            is_empty_shell=is_empty_shell
+        )
+    
+    def _extract_sections(self, soup: BeautifulSoup) -> List[PageSection]:
+        """
+        Разбить страницу на секции по заголовкам H1/H2.
+        
+        Документ обходится один раз; текст до первого заголовка
+        попадает во вводную секцию.
+        
+        Args:
+            soup: Разобранный HTML-документ (без служебных тегов)
+            
+        Returns:
+            Список секций с отпечатками содержимого
+        """
+        root = soup.body or soup
+        seen_keys: dict = {}
+        sections: List[PageSection] = []
+        
+        heading = ""
+        heading_strings: set = set()
+        parts: List[str] = []
+        # Текст секций хранится в пределах того же бюджета, что и текст
+        # страницы: отпечаток считается по полному тексту, а длинный хвост
+        # документа LLM всё равно не видит
+        budget = [settings.max_text_length]
+        
+        def flush() -> None:
+            text = clean_text("\n".join(parts))
+            if heading or text:
+                stored = text[:budget[0]]
+                budget[0] -= len(stored)
+                sections.append(PageSection(
+                    key=make_section_key(heading, seen_keys),
+                    heading=heading or None,
+                    text=stored,
+                    fingerprint=fingerprint_text(f"{heading}\n{text}")
+                ))
+                
+        for node in root.descendants:
+            if isinstance(node, Tag) and node.name in SECTION_HEADING_TAGS:
+                flush()
+                heading = node.get_text(" ", strip=True)
+                heading_strings = {id(string) for string in node.strings}
+                parts = []
+            elif isinstance(node, NavigableString) and not isinstance(node, Comment):
+                if id(node) in heading_strings:
+                    continue
+                string = node.strip()
+                if string:
+                    parts.append(string)
+        flush()
+        
+        return sections
+    
+    def _extract_structure(self, soup: BeautifulSoup) -> PageStructure:
+        """
+        Извлечь структурные признаки страницы.
+        
+        Args:
+            soup: Разобранный HTML-документ
+        
+        Returns:
+            PageStructure с признаками для локальных проверок
+        """
+        meta = soup.find("meta", attrs={"name": re.compile(r"^description$", re.I)})
+        meta_description = meta.get("content", "").strip() if meta else ""
+        
+        headings = [
+            tag.get_text(" ", strip=True)
+            for tag in soup.find_all(["h1", "h2", "h3"])
+        ]
+        
+        cta_count = 0
+        for tag in soup.find_all(["button", "a", "input"]):
+            if tag.name == "button" or tag.get("role") == "button":
+                cta_count += 1
+            elif tag.name == "input":
+                if tag.get("type") in ("submit", "button"):
+                    cta_count += 1
+            elif CTA_CLASS_PATTERN.search(" ".join(tag.get("class", []))):
+                cta_count += 1
+            elif CTA_TEXT_PATTERN.match(tag.get_text(strip=True)):
+                cta_count += 1
+        
+        images = soup.find_all("img")
+        images_without_alt = sum(
+            1 for img in images if not (img.get("alt") or "").strip()
+        )
+        
+        longest_block_length = max(
+            (len(tag.get_text(" ", strip=True)) for tag in soup.find_all(TEXT_BLOCK_TAGS)),
+            default=0
+        )
+        
+        return PageStructure(
+            meta_description=meta_description or None,
+            h1_count=len(soup.find_all("h1")),
+            headings=headings,
+            cta_count=cta_count,
+            images_total=len(images),
+            images_without_alt=images_without_alt,
+            longest_block_length=longest_block_length
         )
     
     def fetch_and_parse(self, url: str) -> PageContent:
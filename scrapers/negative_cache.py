@@ -0,0 +1,184 @@
+"""
+Кэш неудачных загрузок (negative cache).
+
+Если сайт отвечает 403/404 или его имя не разрешается, повторный
+анализ того же URL снова проходит весь путь до ошибки, а недоступный
+хост каждый раз занимает воркер на время таймаута. Кэш запоминает
+ошибку загрузки на короткое время, зависящее от её вида, и повторные
+загрузки сразу завершаются той же ScraperError:
+
+- ошибки DNS и подключения к серверу - для всего хоста;
+- HTTP-ошибки и таймаут чтения ответа - для URL;
+- 429/502/503/504 не кэшируются: их повторяет FetchScheduler.
+
+Подавленные загрузки учитываются в счётчиках core.metrics.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from core import metrics
+from core.config import settings
+from core.exceptions import ScraperError
+from scrapers.scheduler import RETRYABLE_STATUSES, host_of
+
+
+logger = logging.getLogger(__name__)
+
+# Виды ошибок загрузки без HTTP-ответа (ScraperError.kind)
+DNS = "dns"
+CONNECT = "connect"
+TIMEOUT = "timeout"
+
+# Ошибки, при которых недоступен весь хост
+HOST_KINDS = {DNS, CONNECT}
+
+# Счётчики в core.metrics
+SUPPRESSED_METRIC = "scraper.negative_cache.suppressed"
+STORED_METRIC = "scraper.negative_cache.stored"
+
+
+def error_ttl(error: ScraperError) -> float:
+    """
+    Время хранения ошибки в кэше.
+    
+    Args:
+        error: Ошибка загрузки
+        
+    Returns:
+        Время в секундах (0 - ошибка не кэшируется)
+    """
+    status = error.status_code
+    if status is not None:
+        if status in RETRYABLE_STATUSES:
+            return 0.0
+        if status in (401, 403):
+            return settings.negative_cache_ttl_forbidden
+        if status >= 500:
+            return settings.negative_cache_ttl_server_error
+        return settings.negative_cache_ttl_not_found
+    if error.kind == DNS:
+        return settings.negative_cache_ttl_dns
+    if error.kind in (CONNECT, TIMEOUT):
+        return settings.negative_cache_ttl_unreachable
+    return 0.0
+
+
+def error_label(error: ScraperError) -> str:
+    """Вид ошибки для счётчиков: HTTP-статус или kind."""
+    return str(error.status_code) if error.status_code is not None else error.kind or "other"
+
+
+class NegativeCache:
+    """
+    Кэш ошибок загрузки по URL и хосту.
+    
+    Потокобезопасен; при переполнении вытесняются самые старые записи.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Инициализация кэша.
+        
+        Args:
+            max_entries: Наибольшее число записей
+        """
+        self.max_entries = max_entries or settings.negative_cache_max_entries
+        self._entries: "OrderedDict[str, Tuple[float, ScraperError]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return "url:" + url.split("#", 1)[0]
+    
+    @staticmethod
+    def _host_key(url: str) -> str:
+        return "host:" + host_of(url)
+    
+    def _lookup(self, key: str, now: float) -> Optional[Tuple[float, ScraperError]]:
+        """Найти действующую запись (просроченная удаляется)."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= now:
+            del self._entries[key]
+            return None
+        return entry
+    
+    def check(self, url: str) -> None:
+        """
+        Проверить, не завершалась ли загрузка URL ошибкой недавно.
+        
+        Args:
+            url: URL страницы
+            
+        Raises:
+            ScraperError: Запомненная ошибка URL или его хоста
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._lookup(self._host_key(url), now) or self._lookup(self._url_key(url), now)
+        if entry is None:
+            return
+            
+        expires_at, error = entry
+        label = error_label(error)
+        metrics.increment(SUPPRESSED_METRIC)
+        metrics.increment(f"{SUPPRESSED_METRIC}.{label}")
+        logger.info(f"Загрузка {url} подавлена кэшем ошибок ({label}, ещё {expires_at - now:.0f} сек)")
+        raise ScraperError(
+            f"{error.reason} (повтор из кэша ошибок, ещё {expires_at - now:.0f} сек)",
+            url=url,
+            status_code=error.status_code,
+            kind=error.kind
+        )
+    
+    def remember(self, error: ScraperError) -> None:
+        """
+        Запомнить ошибку загрузки, если её вид кэшируется.
+        
+        Args:
+            error: Ошибка загрузки (с URL)
+        """
+        ttl = error_ttl(error)
+        if ttl <= 0 or not error.url:
+            return
+            
+        key = self._host_key(error.url) if error.kind in HOST_KINDS else self._url_key(error.url)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, error)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        metrics.increment(STORED_METRIC)
+    
+    def clear(self) -> None:
+        """Очистить кэш."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache: Optional[NegativeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_negative_cache() -> Optional[NegativeCache]:
+    """
+    Получить кэш ошибок процесса.
+    
+    Returns:
+        NegativeCache или None, если кэш отключён (NEGATIVE_CACHE_ENABLED=false)
+    """
+    global _cache
+    if not settings.negative_cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = NegativeCache()
+    return _cache
@@ -0,0 +1,206 @@
+"""
+Пул процессов для разбора HTML.
+
+BeautifulSoup держит GIL всё время разбора, поэтому в одном воркере
+веб-сервера тяжёлые страницы разбираются строго по очереди. Пул
+отдельных процессов разбирает страницы параллельно и возвращает
+только извлечённый контент (PageContent без исходного HTML).
+
+Большие страницы передаются через общую память: в процесс разбора
+уходит только имя сегмента, а не копия тела через pipe. Разбор,
+превысивший settings.parse_timeout, прерывается вместе с процессами
+пула, и пул создаётся заново.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple
+
+from core.config import settings
+from core.exceptions import ScraperError
+from core.models import PageContent
+
+
+logger = logging.getLogger(__name__)
+
+# Аргументы задачи разбора: URL, HTML (если передаётся через pipe),
+# имя сегмента общей памяти и размер тела в нём
+ParseArgs = Tuple[str, Optional[str], Optional[str], int]
+
+# Парсер процесса разбора (создаётся при первой задаче)
+_worker_parser = None
+
+_pool: Optional["ParsePool"] = None
+_pool_lock = threading.Lock()
+
+
+def _attach(name: str) -> SharedMemory:
+    """Подключиться к сегменту общей памяти; удаляет его только создатель."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Python < 3.13: процессы spawn используют resource_tracker
+    # родителя, повторная регистрация сегмента ничего не меняет
+    return SharedMemory(name=name)
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    """Буфер открытого сегмента общей памяти."""
+    if shm.buf is None:
+        raise ScraperError(f"Сегмент общей памяти {shm.name} закрыт")
+    return shm.buf
+
+
+def _read_shared(shm_name: str, size: int) -> str:
+    """Прочитать HTML из сегмента общей памяти."""
+    shm = _attach(shm_name)
+    try:
+        with _buffer(shm)[:size] as view:
+            return str(view, "utf-8")
+    finally:
+        shm.close()
+
+
+def _parse_in_worker(url: str, html: Optional[str], shm_name: Optional[str], size: int) -> PageContent:
+    """Разобрать страницу в процессе пула."""
+    global _worker_parser
+    if _worker_parser is None:
+        from scrapers.html_parser import HTMLParser
+        
+        _worker_parser = HTMLParser()
+        
+    if shm_name is not None:
+        html = _read_shared(shm_name, size)
+    if html is None:
+        raise ScraperError("Задача разбора без HTML", url=url)
+    return _worker_parser.parse(html, url=url)
+
+
+class ParsePool:
+    """
+    Пул процессов разбора HTML с ограничением времени на задачу.
+    
+    Процессы запускаются методом spawn: воркер веб-сервера уже держит
+    потоки и сетевые клиенты, копировать их через fork небезопасно.
+    """
+    
+    def __init__(self, size: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        Инициализация пула.
+        
+        Args:
+            size: Число процессов разбора
+            timeout: Предельное время разбора одной страницы в секундах
+        """
+        self.size = size or settings.parse_pool_size
+        self.timeout = timeout or settings.parse_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Текущий пул процессов (создаётся при первой задаче)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+    
+    def _restart(self, executor: ProcessPoolExecutor) -> None:
+        """Завершить процессы пула (в том числе зависший разбор); новый пул создастся при следующей задаче."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            
+        # У ProcessPoolExecutor нет публичного способа прервать
+        # выполняющуюся задачу: процессы завершаются через _processes,
+        # если он есть, иначе зависший разбор закончится сам
+        processes = getattr(executor, "_processes", None) or {}
+        for process in list(processes.values()):
+            process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def parse(self, html: str, url: str = "") -> PageContent:
+        """
+        Разобрать страницу в пуле процессов.
+        
+        Args:
+            html: HTML-код страницы
+            url: URL страницы
+            
+        Returns:
+            PageContent с извлечённым контентом
+            
+        Raises:
+            ScraperError: При превышении времени разбора или падении процесса
+        """
+        body = html.encode("utf-8")
+        shm: Optional[SharedMemory] = None
+        args: ParseArgs
+        if len(body) >= settings.parse_shm_threshold:
+            shm = SharedMemory(create=True, size=len(body))
+            _buffer(shm)[:len(body)] = body
+            args = (url, None, shm.name, len(body))
+        else:
+            args = (url, html, None, 0)
+        del body
+        
+        try:
+            # Задачи, попавшие под перезапуск пула из-за чужого
+            # зависшего разбора, повторяются один раз
+            for _ in range(2):
+                executor = self._get_executor()
+                try:
+                    future = executor.submit(_parse_in_worker, *args)
+                    return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Разбор {url} превысил {self.timeout} сек, процессы пула перезапускаются")
+                    self._restart(executor)
+                    raise ScraperError(f"Превышено время разбора страницы ({self.timeout} сек)", url=url)
+                except BrokenProcessPool:
+                    self._restart(executor)
+            raise ScraperError("Процесс разбора страницы завершился аварийно", url=url)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+    
+    def close(self) -> None:
+        """Остановить процессы пула."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def get_parse_pool() -> Optional[ParsePool]:
+    """
+    Получить общий пул разбора процесса.
+    
+    Returns:
+        ParsePool или None, если пул отключён (PARSE_POOL_SIZE=0)
+    """
+    global _pool
+    if settings.parse_pool_size <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ParsePool()
+    return _pool
+
+
+def close_parse_pool() -> None:
+    """Остановить общий пул разбора."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
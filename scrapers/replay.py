@@ -0,0 +1,87 @@
+"""
+Парсер, отдающий страницы из архива вместо загрузки по сети.
+
+Используется режимом воспроизведения (agent.py --replay): записанный
+HTML проходит через текущий HTMLParser, как при обычной загрузке.
+"""
+
+from typing import Dict, List, Optional
+
+from core.archive import PAGE, ArchiveRecord, PageArchive
+from core.exceptions import ScraperError
+from core.interfaces import BaseScraper
+from core.models import PageContent
+from core.timing import StageTimings
+from scrapers.html_parser import HTMLParser
+
+
+class ReplayScraper(BaseScraper):
+    """Парсер страниц из архива (последний снимок каждого URL)."""
+    
+    name = "Replay Scraper"
+    description = "Страницы из архива без сетевых запросов"
+    
+    def __init__(self, archive: PageArchive, timings: Optional[StageTimings] = None):
+        """
+        Инициализация.
+        
+        Args:
+            archive: Архив страниц
+            timings: Статистика для замера этапов чтения и разбора
+        """
+        self.archive = archive
+        self.timings = timings or StageTimings()
+        self._parser = HTMLParser()
+        self._latest: Dict[str, ArchiveRecord] = {}
+        for record in archive.find(PAGE):
+            self._latest[record.url] = record
+    
+    @property
+    def urls(self) -> List[str]:
+        """URL страниц архива в порядке первой записи."""
+        return list(self._latest)
+    
+    def fetch(self, url: str) -> str:
+        """
+        Прочитать HTML страницы из архива.
+        
+        Args:
+            url: URL страницы
+            
+        Returns:
+            HTML-код страницы
+            
+        Raises:
+            ScraperError: Если страницы нет в архиве
+        """
+        record = self._latest.get(url)
+        if record is None:
+            raise ScraperError("Страница отсутствует в архиве", url=url)
+        with self.timings.measure("Чтение архива"):
+            return self.archive.read(record)["html"]
+    
+    def parse(self, html: str, url: str = "") -> PageContent:
+        """
+        Разобрать HTML текущим HTMLParser.
+        
+        Args:
+            html: HTML-код страницы
+            url: URL страницы
+            
+        Returns:
+            PageContent с извлечённым контентом
+        """
+        with self.timings.measure("Разбор HTML"):
+            return self._parser.parse(html, url=url)
+    
+    def fetch_and_parse(self, url: str) -> PageContent:
+        """
+        Прочитать страницу из архива и разобрать её.
+        
+        Args:
+            url: URL страницы
+            
+        Returns:
+            PageContent с контентом страницы
+        """
+        return self.parse(self.fetch(url), url=url)
@@ -0,0 +1,264 @@
+"""
+Планировщик загрузок с очередями по хостам.
+
+В пакетных прогонах и при обходе много URL приходится на один хост.
+Запросы к нему подряд без пауз приводят к блокировкам (401/403), а
+остальные хосты в это время простаивают. Планировщик держит отдельную
+очередь для каждого хоста и выбирает задачи по кругу между хостами:
+
+- общий лимит одновременных загрузок (потоки-исполнители);
+- лимит одновременных загрузок и пауза между запросами для хоста;
+- ответы 429/503 (и 502/504) возвращают задачу в начало очереди хоста,
+  а хост приостанавливается на время из Retry-After или на растущую
+  паузу (экспоненциальная задержка со случайным разбросом).
+
+Результаты отдаются по мере готовности, поэтому анализ первых страниц
+начинается до окончания загрузки остальных.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Iterator, List, NamedTuple, Optional
+from urllib.parse import urlparse
+
+from core.config import settings
+from core.exceptions import ScraperError
+
+
+logger = logging.getLogger(__name__)
+
+# HTTP-статусы, после которых запрос повторяется позже
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+# Ожидание завершения потока-исполнителя при close() в секундах
+WORKER_JOIN_TIMEOUT = 1.0
+
+
+class FetchResult(NamedTuple):
+    """Результат загрузки одного URL."""
+    
+    url: str
+    value: Any = None
+    error: Optional[ScraperError] = None
+
+
+@dataclass
+class _Task:
+    """URL в очереди с числом уже выполненных попыток."""
+    
+    url: str
+    attempts: int = 0
+
+
+@dataclass
+class _HostQueue:
+    """Очередь и состояние одного хоста."""
+    
+    tasks: Deque[_Task] = field(default_factory=deque)
+    active: int = 0
+    next_slot: float = 0.0
+
+
+def host_of(url: str) -> str:
+    """Хост URL (с портом) в нижнем регистре."""
+    return urlparse(url).netloc.lower()
+
+
+class FetchScheduler:
+    """
+    Загрузка URL в потоках с очередями и паузами по хостам.
+    
+    Использование:
+        with FetchScheduler(HTMLParser().fetch_and_parse) as scheduler:
+            for url in urls:
+                scheduler.submit(url)
+            for result in scheduler.as_completed():
+                ...
+                
+    Новые URL можно добавлять и во время перебора результатов (обход сайта).
+    """
+    
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        concurrency: Optional[int] = None,
+        host_concurrency: Optional[int] = None,
+        host_delay: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None
+    ):
+        """
+        Инициализация планировщика.
+        
+        Args:
+            fetch: Загрузка одного URL (ошибки - ScraperError)
+            concurrency: Общее число одновременных загрузок
+            host_concurrency: Одновременных загрузок с одного хоста
+            host_delay: Пауза между началом запросов к одному хосту в секундах
+            max_retries: Повторов после ответов 429/503
+            retry_backoff: Начальная пауза перед повтором без Retry-After в секундах
+        """
+        self.fetch = fetch
+        self.concurrency = concurrency or settings.scraper_concurrency
+        self.host_concurrency = host_concurrency or settings.scraper_host_concurrency
+        self.host_delay = settings.scraper_host_delay if host_delay is None else host_delay
+        self.max_retries = settings.scraper_max_retries if max_retries is None else max_retries
+        self.retry_backoff = retry_backoff or settings.scraper_retry_backoff
+        
+        self._condition = threading.Condition()
+        self._hosts: "OrderedDict[str, _HostQueue]" = OrderedDict()
+        self._results: Deque[FetchResult] = deque()
+        self._unreported = 0
+        self._closed = False
+        self._workers: List[threading.Thread] = []
+    
+    def submit(self, url: str) -> None:
+        """
+        Поставить URL в очередь его хоста.
+        
+        Args:
+            url: URL для загрузки
+        """
+        with self._condition:
+            host = self._hosts.setdefault(host_of(url), _HostQueue())
+            host.tasks.append(_Task(url))
+            self._unreported += 1
+            self._condition.notify_all()
+        self._start_workers()
+    
+    def _start_workers(self) -> None:
+        """Запустить потоки-исполнители при первой задаче."""
+        if self._workers:
+            return
+        for number in range(self.concurrency):
+            worker = threading.Thread(target=self._work, name=f"fetch-{number}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+    
+    def _next_task(self) -> Optional[tuple]:
+        """
+        Дождаться задачи, которую можно выполнить сейчас.
+        
+        Хосты просматриваются по кругу: хост, получивший задачу,
+        переносится в конец, чтобы один сайт не занимал все потоки.
+        
+        Returns:
+            Кортеж (хост, задача) или None после close()
+        """
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                wake_at: Optional[float] = None
+                for name, host in self._hosts.items():
+                    if not host.tasks or host.active >= self.host_concurrency:
+                        continue
+                    if host.next_slot > now:
+                        wake_at = host.next_slot if wake_at is None else min(wake_at, host.next_slot)
+                        continue
+                    host.active += 1
+                    host.next_slot = now + self.host_delay
+                    self._hosts.move_to_end(name)
+                    return name, host.tasks.popleft()
+                self._condition.wait(None if wake_at is None else wake_at - now)
+        return None
+    
+    def _retry_delay(self, error: ScraperError, attempts: int) -> float:
+        """Пауза перед повтором: Retry-After или экспоненциальная задержка."""
+        if error.retry_after is not None:
+            delay = error.retry_after
+        else:
+            delay = self.retry_backoff * 2 ** attempts * random.uniform(0.75, 1.25)
+        return min(delay, settings.scraper_retry_max_delay)
+    
+    def _work(self) -> None:
+        """Цикл потока-исполнителя."""
+        while True:
+            picked = self._next_task()
+            if picked is None:
+                return
+            name, task = picked
+            try:
+                result = FetchResult(task.url, value=self.fetch(task.url))
+            except ScraperError as e:
+                result = FetchResult(task.url, error=e)
+            except Exception as e:
+                # Не ошибка загрузки, а сбой в fetch: трассировка нужна в логе
+                logger.exception(f"Непредвиденная ошибка при загрузке {task.url}")
+                wrapped = ScraperError(f"{type(e).__name__}: {e}", url=task.url)
+                wrapped.__cause__ = e
+                result = FetchResult(task.url, error=wrapped)
+                
+            with self._condition:
+                host = self._hosts[name]
+                host.active -= 1
+                error = result.error
+                if (
+                    error is not None
+                    and error.status_code in RETRYABLE_STATUSES
+                    and task.attempts < self.max_retries
+                ):
+                    # Сайт просит подождать: приостанавливается весь хост
+                    delay = self._retry_delay(error, task.attempts)
+                    host.next_slot = max(host.next_slot, time.monotonic() + delay)
+                    task.attempts += 1
+                    host.tasks.appendleft(task)
+                    logger.info(
+                        f"{task.url}: HTTP {error.status_code}, повтор {task.attempts}/"
+                        f"{self.max_retries} через {delay:.1f} сек"
+                    )
+                else:
+                    self._results.append(result)
+                self._condition.notify_all()
+    
+    def as_completed(self) -> Iterator[FetchResult]:
+        """
+        Отдавать результаты по мере готовности.
+        
+        Перебор завершается, когда все поставленные URL загружены
+        (включая добавленные во время перебора).
+        
+        Yields:
+            FetchResult в порядке завершения загрузок
+        """
+        while True:
+            with self._condition:
+                while not self._results and self._unreported:
+                    self._condition.wait()
+                if not self._results:
+                    return
+                result = self._results.popleft()
+                self._unreported -= 1
+            yield result
+    
+    def close(self) -> None:
+        """
+        Остановить потоки-исполнители.
+        
+        Задачи, ещё не взятые из очередей, отбрасываются (их число
+        пишется в лог), а результаты, не полученные через as_completed(),
+        теряются. Начатая загрузка не прерывается: поток ждёт до
+        WORKER_JOIN_TIMEOUT секунд и дальше завершается в фоне, его
+        результат отбрасывается. Чтобы получить все результаты,
+        переберите as_completed() до конца перед выходом из блока with.
+        """
+        with self._condition:
+            self._closed = True
+            dropped = sum(len(host.tasks) for host in self._hosts.values())
+            for host in self._hosts.values():
+                host.tasks.clear()
+            self._condition.notify_all()
+        if dropped:
+            logger.info(f"Планировщик остановлен, отменено загрузок из очереди: {dropped}")
+        for worker in self._workers:
+            worker.join(timeout=WORKER_JOIN_TIMEOUT)
+        self._workers = []
+    
+    def __enter__(self) -> "FetchScheduler":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,110 @@
+"""
+Общий пул HTTP-соединений для синхронного парсера.
+
+Одна сессия requests разделяется всеми экземплярами HTMLParser и потоками
+процесса: повторные запросы к тем же хостам переиспользуют открытые
+соединения и не тратят время на TCP- и TLS-рукопожатия.
+"""
+
+import atexit
+import logging
+import socket
+import threading
+from typing import List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Заголовки HTTP-запросов, имитирующие браузер
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+}
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """Опции сокета для TCP keep-alive (с учётом платформы)."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    
+    idle = settings.scraper_tcp_keepalive_idle
+    for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP-адаптер с включённым TCP keep-alive на сокетах пула."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        """Создать менеджер пулов с опциями keep-alive."""
+        kwargs["socket_options"] = _keepalive_socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _create_session() -> requests.Session:
+    """Создать HTTP-сессию с настроенными заголовками и пулом соединений."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    
+    adapter = KeepAliveAdapter(
+        pool_connections=settings.scraper_pool_hosts,
+        pool_maxsize=settings.scraper_pool_maxsize,
+        pool_block=True
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    logger.info(
+        f"Создан пул HTTP-соединений (хостов: {settings.scraper_pool_hosts}, "
+        f"соединений на хост: {settings.scraper_pool_maxsize})"
+    )
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Получить общую HTTP-сессию процесса.
+    
+    Безопасно для вызова из нескольких потоков: сессия создаётся один раз.
+    
+    Returns:
+        Сессия requests с общим пулом соединений
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def close_session_pool() -> None:
+    """Закрыть общую сессию и все открытые соединения."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+            logger.info("Пул HTTP-соединений закрыт")
+
+
+atexit.register(close_session_pool)
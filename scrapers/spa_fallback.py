@@ -0,0 +1,184 @@
+"""
+Обработка SPA-страниц, которые отдают пустой HTML-каркас.
+
+Такие страницы рендерят контент JavaScript-ом, и обычный парсинг получает
+лишь несколько строк текста. Здесь собраны дешёвые способы достать текст
+без headless-браузера: встроенное JSON-состояние (__NEXT_DATA__, __NUXT__),
+содержимое <noscript> и заранее подготовленные снимки страниц.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Маркеры корневых элементов SPA-фреймворков
+SPA_ROOT_PATTERN = re.compile(
+    r"""id\s*=\s*["'](?:root|app|__next|__nuxt|___gatsby)["']|data-reactroot|ng-version=|<app-root""",
+    re.IGNORECASE
+)
+
+# Доля текста в HTML, ниже которой страница считается каркасом
+SHELL_TEXT_RATIO = 0.02
+
+NEXT_DATA_PATTERN = re.compile(
+    r"""<script[^>]*id\s*=\s*["']__NEXT_DATA__["'][^>]*>(.*?)</script>""",
+    re.IGNORECASE | re.DOTALL
+)
+NUXT_PATTERN = re.compile(
+    r"""window\.__NUXT__\s*=\s*(.*?)</script>""",
+    re.IGNORECASE | re.DOTALL
+)
+NOSCRIPT_PATTERN = re.compile(r"<noscript[^>]*>(.*?)</noscript>", re.IGNORECASE | re.DOTALL)
+
+# Строковые литералы JavaScript в состоянии Nuxt
+JS_STRING_PATTERN = re.compile(r'"((?:[^"\\]|\\.){3,})"')
+
+# Признак человекочитаемого текста: буквы и пробел
+HUMAN_TEXT_PATTERN = re.compile(r"[A-Za-zА-Яа-яЁё]{2,}.*\s.*[A-Za-zА-Яа-яЁё]", re.DOTALL)
+
+
+def looks_like_empty_shell(html: str, text: str) -> bool:
+    """
+    Проверить, является ли страница пустым SPA-каркасом.
+    
+    Args:
+        html: HTML-код страницы
+        text: Извлечённый из HTML текст
+        
+    Returns:
+        True если текста слишком мало для анализа
+    """
+    if len(text) >= settings.min_text_length:
+        return False
+    ratio = len(text) / max(len(html), 1)
+    return ratio < SHELL_TEXT_RATIO or bool(SPA_ROOT_PATTERN.search(html))
+
+
+def _is_human_text(value: str) -> bool:
+    """Похожа ли строка на текст для людей, а не на служебное значение."""
+    value = value.strip()
+    if len(value) < 3 or value.startswith(("http://", "https://", "/", "{", "<")):
+        return False
+    return bool(HUMAN_TEXT_PATTERN.search(value))
+
+
+def _collect_strings(data: Any, out: Dict[str, None]) -> None:
+    """Рекурсивно собрать человекочитаемые строки из JSON-структуры."""
+    if isinstance(data, str):
+        if _is_human_text(data):
+            out[data.strip()] = None
+    elif isinstance(data, dict):
+        for value in data.values():
+            _collect_strings(value, out)
+    elif isinstance(data, list):
+        for value in data:
+            _collect_strings(value, out)
+
+
+def _from_next_data(html: str) -> str:
+    """Текст из встроенного состояния Next.js."""
+    match = NEXT_DATA_PATTERN.search(html)
+    if not match:
+        return ""
+    try:
+        data = json.loads(match.group(1))
+    except ValueError:
+        return ""
+    strings: Dict[str, None] = {}
+    _collect_strings(data.get("props", data), strings)
+    return "\n".join(strings)
+
+
+def _from_nuxt(html: str) -> str:
+    """Текст из встроенного состояния Nuxt (JavaScript-литерал)."""
+    match = NUXT_PATTERN.search(html)
+    if not match:
+        return ""
+    strings: Dict[str, None] = {}
+    for literal in JS_STRING_PATTERN.findall(match.group(1)):
+        try:
+            value = json.loads(f'"{literal}"')
+        except ValueError:
+            continue
+        if _is_human_text(value):
+            strings[value.strip()] = None
+    return "\n".join(strings)
+
+
+def _from_noscript(html: str) -> str:
+    """Текст из блоков <noscript>."""
+    parts = [
+        BeautifulSoup(block, "lxml").get_text(separator="\n", strip=True)
+        for block in NOSCRIPT_PATTERN.findall(html)
+    ]
+    return "\n".join(part for part in parts if part)
+
+
+def extract_embedded_text(html: str) -> Optional[Tuple[str, str]]:
+    """
+    Достать текст SPA-страницы из встроенных в HTML данных.
+    
+    Args:
+        html: HTML-код страницы
+        
+    Returns:
+        Кортеж (источник, текст) или None, если текст не найден
+    """
+    extractors: List[Tuple[str, Any]] = [
+        ("next_data", _from_next_data),
+        ("nuxt", _from_nuxt),
+        ("noscript", _from_noscript),
+    ]
+    for source, extractor in extractors:
+        text = extractor(html)
+        if len(text) >= settings.min_text_length:
+            logger.info(f"Текст SPA-страницы извлечён из {source}: {len(text)} символов")
+            return source, text
+    return None
+
+
+def snapshot_path(url: str) -> Optional[Path]:
+    """
+    Путь к файлу снимка страницы.
+    
+    Снимок для https://example.com/pricing ищется в файле
+    example.com_pricing.html, для главной страницы - example.com.html.
+    
+    Args:
+        url: URL страницы
+        
+    Returns:
+        Путь к файлу или None, если директория снимков не настроена
+    """
+    if not settings.prerender_snapshot_dir or not url:
+        return None
+    parts = urlparse(url)
+    slug = re.sub(r"[^\w.-]+", "_", f"{parts.netloc}{parts.path}".rstrip("/"))
+    return Path(settings.prerender_snapshot_dir) / f"{slug}.html"
+
+
+def load_snapshot(url: str) -> Optional[str]:
+    """
+    Загрузить заранее подготовленный снимок страницы.
+    
+    Args:
+        url: URL страницы
+        
+    Returns:
+        HTML снимка или None, если снимка нет
+    """
+    path = snapshot_path(url)
+    if path is None or not path.is_file():
+        return None
+    logger.info(f"Используется снимок страницы: {path}")
+    return path.read_text(encoding="utf-8", errors="replace")
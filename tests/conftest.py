@@ -0,0 +1,94 @@
+"""
+Общие фикстуры тестов.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+import pytest
+
+from core import registry
+from core.models import PageContent, PageStructure
+
+
+@pytest.fixture
+def page() -> PageContent:
+    """Разобранная страница лендинга с текстом и структурой."""
+    return PageContent(
+        url="https://example.com/",
+        title="Курсы английского онлайн",
+        text=(
+            "Курсы английского онлайн\n"
+            "Занятия с преподавателем 3 раза в неделю. Первый урок бесплатно.\n"
+            "Записаться на пробный урок"
+        ),
+        structure=PageStructure()
+    )
+
+
+@pytest.fixture
+def analyzers_config(tmp_path, monkeypatch):
+    """
+    Реестр модулей с конфигурацией из временного файла.
+    
+    Возвращает путь к файлу ANALYZERS_CONFIG; кэш реестра сбрасывается
+    до и после теста.
+    """
+    path = tmp_path / "analyzers.json"
+    monkeypatch.setenv(registry.CONFIG_ENV, str(path))
+    monkeypatch.setattr(registry, "_analyzers", None)
+    monkeypatch.setattr(registry, "_instances", {})
+    yield path
+    registry._analyzers = None
+
+
+class LocalServer:
+    """
+    HTTP-сервер на 127.0.0.1 со статическими ответами.
+    
+    routes: путь -> (статус, заголовки, тело); неизвестные пути - 404.
+    requests: пути полученных запросов в порядке поступления.
+    """
+    
+    def __init__(self):
+        self.routes: Dict[str, Tuple[int, Dict[str, str], str]] = {}
+        self.requests: List[str] = []
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(self.path)
+                status, headers, body = server.routes.get(self.path, (404, {}, "not found"))
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def log_message(self, *args):
+                pass
+                
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+    
+    def url(self, path: str) -> str:
+        return self.base_url + path
+    
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def http_server():
+    """Локальный HTTP-сервер (см. LocalServer)."""
+    server = LocalServer()
+    yield server
+    server.close()
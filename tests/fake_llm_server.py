@@ -0,0 +1,170 @@
+"""
+Локальный подставной сервер LLM API для тестов.
+
+Отвечает как OpenAI-совместимый API (/v1/chat/completions, /v1/models)
+и как GigaChat API (выдача токена OAuth, /api/v1/chat/completions,
+/api/v1/models), в том числе потоком (server-sent events). Ответ,
+задержка и код ошибки задаются атрибутами сервера во время теста.
+
+Можно запустить отдельно, чтобы проверить агента без внешних API:
+    python -m tests.fake_llm_server --port 8090
+    OPENAI_BASE_URL=http://127.0.0.1:8090/v1 python agent.py <url>
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+
+# Путь выдачи токена OAuth GigaChat
+OAUTH_PATH = "/api/v2/oauth"
+
+
+class FakeLLMServer:
+    """
+    Подставной сервер LLM API на 127.0.0.1.
+    
+    Атрибуты, меняемые в тесте:
+        reply: Текст ответа модели
+        delay: Задержка перед ответом в секундах
+        fail_status: Код ошибки для запросов к чату (None - отвечать успешно)
+        
+    requests: пути полученных запросов к чату в порядке поступления.
+    """
+    
+    def __init__(self, port: int = 0, reply: str = "1. Усилить оффер\nДобавьте выгоду в заголовок."):
+        self.reply = reply
+        self.delay = 0.0
+        self.fail_status: Optional[int] = None
+        self.requests: List[str] = []
+        self.tokens_issued = 0
+        
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+    
+    @property
+    def openai_url(self) -> str:
+        """Базовый URL для OpenAICompatibleProvider."""
+        return f"{self.base_url}/v1"
+    
+    @property
+    def gigachat_url(self) -> str:
+        """Базовый URL для GigaChatProvider."""
+        return f"{self.base_url}/api/v1"
+    
+    @property
+    def gigachat_auth_url(self) -> str:
+        """Адрес выдачи токена для GigaChatProvider."""
+        return self.base_url + OAUTH_PATH
+    
+    def _handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def _send_json(self, status: int, body: dict) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def _send_events(self, model: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for word in server.reply.split(" "):
+                    chunk = {
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"role": "assistant", "content": word + " "}}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.close_connection = True
+            
+            def do_GET(self):
+                if self.path.endswith("/models"):
+                    self._send_json(200, {
+                        "object": "list",
+                        "data": [{"id": "fake-model", "object": "model", "owned_by": "tests"}],
+                    })
+                else:
+                    self._send_json(404, {"message": "not found"})
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                
+                if self.path == OAUTH_PATH:
+                    server.tokens_issued += 1
+                    self._send_json(200, {
+                        "access_token": f"token-{server.tokens_issued}",
+                        "expires_at": int((time.time() + 1800) * 1000),
+                    })
+                    return
+                if not self.path.endswith("/chat/completions"):
+                    self._send_json(404, {"message": "not found"})
+                    return
+                    
+                server.requests.append(self.path)
+                if server.delay:
+                    time.sleep(server.delay)
+                if server.fail_status is not None:
+                    self._send_json(server.fail_status, {"message": "fake failure"})
+                    return
+                    
+                payload = json.loads(body or b"{}")
+                model = payload.get("model") or "fake-model"
+                if payload.get("stream"):
+                    self._send_events(model)
+                    return
+                self._send_json(200, {
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": server.reply},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+                })
+            
+            def log_message(self, *args):
+                pass
+                
+        return Handler
+    
+    def close(self) -> None:
+        """Остановить сервер."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Подставной сервер LLM API")
+    parser.add_argument("--port", type=int, default=8090)
+    args = parser.parse_args()
+    
+    server = FakeLLMServer(port=args.port)
+    print(f"OpenAI-совместимый API: {server.openai_url}")
+    print(f"GigaChat API: {server.gigachat_url} (токен: {server.gigachat_auth_url})")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
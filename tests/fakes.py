@@ -0,0 +1,56 @@
+"""
+Подставные реализации для тестов.
+"""
+
+from typing import List, Optional
+
+from core.interfaces import BaseAnalyzer, BaseLLMProvider
+from core.models import AnalysisResult, PageContent, Recommendation
+
+
+class FakeLLMProvider(BaseLLMProvider):
+    """LLM-провайдер, отвечающий заданным текстом и запоминающий промпты."""
+    
+    name = "Fake Provider"
+    
+    def __init__(self, response: str = "1. Усилить оффер\nДобавьте выгоду в заголовок."):
+        self.response = response
+        self.prompts: List[tuple] = []
+    
+    def call(self, system_prompt, user_prompt, temperature=0.7, max_tokens=1500) -> str:
+        self.prompts.append((system_prompt, user_prompt))
+        return self.response
+    
+    def is_available(self) -> bool:
+        return True
+
+
+class SEOAnalyzer(BaseAnalyzer):
+    """Внешний модуль анализа без LLM (как из entry point или ANALYZERS_CONFIG)."""
+    
+    name = "SEO-аудитор"
+    description = "Проверка мета-тегов"
+    requires_llm = False
+    
+    def __init__(self, llm_provider: Optional[BaseLLMProvider] = None):
+        super().__init__(llm_provider)
+    
+    def get_system_prompt(self) -> str:
+        return ""
+    
+    def parse_response(self, response: str) -> List[Recommendation]:
+        return []
+    
+    def analyze(
+        self,
+        content: PageContent,
+        known_issues: Optional[List[Recommendation]] = None
+    ) -> AnalysisResult:
+        return AnalysisResult(
+            module_name=self.name,
+            module_description=self.description,
+            url=content.url,
+            recommendations=[
+                Recommendation(number=1, title="Добавить canonical", description="Нет rel=canonical.")
+            ]
+        )
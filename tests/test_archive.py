@@ -0,0 +1,113 @@
+"""
+Тесты архива страниц и диалогов с LLM: запись и чтение, переход
+на новый сегмент, повторное отображение дописанного сегмента и
+выбор сжатия.
+"""
+
+import gzip
+import os
+
+import pytest
+
+import core.archive as archive_module
+from core.archive import PAGE, TRANSCRIPT, PageArchive, prompt_key
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = PageArchive(str(tmp_path), codec="gzip", segment_mb=1)
+    yield archive
+    archive.close()
+
+
+def test_page_and_transcript_round_trip(archive):
+    page_id = archive.put_page("https://example.com/", "<h1>Привет</h1>")
+    archive.put_transcript("system", "user", "1. Усилить оффер", url="https://example.com/")
+    
+    [page] = archive.find(PAGE, url="https://example.com/")
+    [transcript] = archive.find(TRANSCRIPT, key=prompt_key("system", "user"))
+    
+    assert page.id == page_id
+    assert archive.read(page) == {"url": "https://example.com/", "html": "<h1>Привет</h1>"}
+    assert archive.read(transcript)["response"] == "1. Усилить оффер"
+    assert [html for _, html in archive.iter_pages()] == ["<h1>Привет</h1>"]
+
+
+def test_find_filters_by_url_and_keeps_order(archive):
+    for version in range(3):
+        archive.put_page("https://example.com/", f"версия {version}")
+    archive.put_page("https://example.org/", "другая страница")
+    
+    records = archive.find(PAGE, url="https://example.com/")
+    
+    assert [archive.read(record)["html"] for record in records] == ["версия 0", "версия 1", "версия 2"]
+    assert archive.find(TRANSCRIPT) == []
+
+
+def test_new_segment_starts_after_size_limit(tmp_path):
+    archive = PageArchive(str(tmp_path), codec="gzip", segment_mb=0.001)
+    # Случайные данные не сжимаются: каждая запись больше сегмента
+    pages = [os.urandom(4096).hex() for _ in range(3)]
+    for html in pages:
+        archive.put_page("https://example.com/", html)
+        
+    records = archive.find(PAGE)
+    
+    assert [record.segment for record in records] == [1, 2, 3]
+    assert all(record.offset == 0 for record in records)
+    assert [archive.read(record)["html"] for record in records] == pages
+    assert sorted(path.name for path in tmp_path.glob("*.arc")) == [
+        "segment_000001.arc", "segment_000002.arc", "segment_000003.arc"
+    ]
+    archive.close()
+
+
+def test_segment_is_remapped_after_it_grows(archive):
+    archive.put_page("https://example.com/", "первая")
+    [first] = archive.find(PAGE)
+    assert archive.read(first)["html"] == "первая"
+    mapped_before = len(archive._maps[first.segment])
+    
+    archive.put_page("https://example.com/", "вторая")
+    second = archive.find(PAGE)[1]
+    
+    assert second.segment == first.segment
+    assert archive.read(second)["html"] == "вторая"
+    assert len(archive._maps[first.segment]) > mapped_before
+    assert archive.read(first)["html"] == "первая"
+
+
+def test_gzip_segment_unpacks_without_project_code(tmp_path, archive):
+    archive.put_page("https://example.com/", "раз")
+    archive.put_page("https://example.com/", "два")
+    
+    data = (tmp_path / "segment_000001.arc").read_bytes()
+    
+    assert data[:2] == b"\x1f\x8b"
+    unpacked = gzip.decompress(data).decode("utf-8")
+    assert "раз" in unpacked and "два" in unpacked
+
+
+def test_zstd_falls_back_to_gzip_without_package(monkeypatch, tmp_path):
+    monkeypatch.setattr(archive_module, "zstandard", None)
+    
+    archive = PageArchive(str(tmp_path), codec="zstd")
+    archive.put_page("https://example.com/", "страница")
+    [record] = archive.find(PAGE)
+    
+    assert archive.codec == "gzip"
+    assert record.codec == "gzip"
+    assert archive.read(record)["html"] == "страница"
+    archive.close()
+
+
+def test_zstd_records_are_stored_with_their_codec(tmp_path):
+    pytest.importorskip("zstandard")
+    archive = PageArchive(str(tmp_path), codec="zstd")
+    archive.put_page("https://example.com/", "страница")
+    [record] = archive.find(PAGE)
+    
+    assert record.codec == "zstd"
+    assert (tmp_path / "segment_000001.arc").read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+    assert archive.read(record)["html"] == "страница"
+    archive.close()
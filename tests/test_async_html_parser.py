@@ -0,0 +1,100 @@
+"""
+Тесты асинхронного парсера: общий клиент с кэшем DNS и привязка
+к event loop.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.config import settings
+from core.exceptions import ScraperError
+from scrapers import async_html_parser
+from scrapers.async_html_parser import AsyncHTMLParser, CachingDNSTransport, close_async_client, get_async_client
+from scrapers.negative_cache import CONNECT
+
+
+PAGE = "<html><head><title>Курсы</title></head><body><h1>Курсы английского</h1></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def no_negative_cache(monkeypatch):
+    monkeypatch.setattr(settings, "negative_cache_enabled", False)
+
+
+def test_client_uses_caching_dns_transport(http_server):
+    http_server.routes["/"] = (200, {}, PAGE)
+    
+    async def scenario():
+        client = get_async_client()
+        assert isinstance(client._transport, CachingDNSTransport)
+        html = await AsyncHTMLParser().fetch(http_server.url("/"))
+        await close_async_client()
+        assert client.is_closed
+        return html
+        
+    assert "Курсы английского" in asyncio.run(scenario())
+
+
+def test_each_event_loop_gets_its_own_client(http_server):
+    http_server.routes["/"] = (200, {}, PAGE)
+    
+    async def scenario():
+        # Клиент не закрывается: следующий цикл не должен его использовать
+        page = await AsyncHTMLParser().fetch_and_parse(http_server.url("/"))
+        return page.title, get_async_client(), async_html_parser._host_limit(http_server.url("/"))
+        
+    first = asyncio.run(scenario())
+    second = asyncio.run(scenario())
+    
+    assert first[0] == second[0] == "Курсы"
+    assert first[1] is not second[1]
+    assert first[2] is not second[2]
+
+
+def test_transport_errors_are_mapped_to_scraper_errors(http_server):
+    url = http_server.url("/")
+    http_server.close()
+    
+    async def scenario():
+        try:
+            with pytest.raises(ScraperError) as error:
+                await AsyncHTMLParser(timeout=2).fetch(url)
+            return error.value
+        finally:
+            await close_async_client()
+            
+    assert asyncio.run(scenario()).kind == CONNECT
+
+
+def test_parse_without_pool_does_not_block_event_loop(http_server, monkeypatch):
+    http_server.routes["/"] = (200, {}, PAGE)
+    monkeypatch.setattr(settings, "parse_pool_size", 0)
+    parse = AsyncHTMLParser.parse
+    
+    def slow_parse(self, html, url=""):
+        time.sleep(0.5)  # Как тяжёлая страница: BeautifulSoup держит поток
+        return parse(self, html, url=url)
+        
+    monkeypatch.setattr(AsyncHTMLParser, "parse", slow_parse)
+    
+    async def scenario():
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+                
+        task = asyncio.create_task(ticker())
+        page = await AsyncHTMLParser().fetch_and_parse(http_server.url("/"))
+        task.cancel()
+        await close_async_client()
+        return page, ticks
+        
+    page, ticks = asyncio.run(scenario())
+    
+    assert page.title == "Курсы"
+    assert ticks >= 5
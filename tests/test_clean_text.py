@@ -0,0 +1,42 @@
+"""
+Тесты нормализации текста страницы: абзацы, невидимые символы
+и удаление склеенных повторов строк.
+"""
+
+from core.utils import clean_text
+
+
+def test_paragraphs_are_preserved_and_blank_runs_collapsed():
+    text = "  Заголовок \n\n\n\nПервый   абзац\nвторая строка\n\n  \nВторой абзац  \n\n"
+    
+    assert clean_text(text) == "Заголовок\n\nПервый абзац\nвторая строка\n\nВторой абзац"
+
+
+def test_nbsp_and_zero_width_characters_are_normalized():
+    text = "Цена\u00a0от\u00a0990\u00a0₽\nБес\u200bплат\u00adная до\u200dставка\ufeff"
+    
+    assert clean_text(text) == "Цена от 990 ₽\nБесплатная доставка"
+
+
+def test_adjacent_duplicates_are_dropped():
+    text = "Мы используем cookie\nМы используем cookie\nКаталог\n\nКаталог\nДоставка"
+    
+    assert clean_text(text) == "Мы используем cookie\nКаталог\n\nДоставка"
+
+
+def test_repeats_across_blocks_are_kept():
+    # Одинаковые пункты списков и кнопки в разных блоках нужны анализу
+    text = "Тариф Старт\n✓ Поддержка\nПодключить\nТариф Про\n✓ Поддержка\nПодключить"
+    
+    assert clean_text(text) == text
+
+
+def test_lines_with_digits_are_never_dropped():
+    assert clean_text("1 990 ₽\n1 990 ₽") == "1 990 ₽\n1 990 ₽"
+
+
+def test_dedupe_can_be_disabled():
+    text = "Купить\nКупить\nКупить"
+    
+    assert clean_text(text, dedupe=False) == text
+    assert clean_text(text) == "Купить"
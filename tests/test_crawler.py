@@ -0,0 +1,58 @@
+"""
+Тесты обхода сайта: дубликаты и лимит страниц.
+"""
+
+import pytest
+
+from core.config import settings
+from scrapers.crawler import SiteCrawler, extract_links, normalize_url
+
+
+def html(title: str, body: str, links=(), canonical: str = "") -> str:
+    head = f'<link rel="canonical" href="{canonical}">' if canonical else ""
+    anchors = "".join(f'<a href="{link}">{link}</a>' for link in links)
+    return f"<html><head><title>{title}</title>{head}</head><body><h1>{title}</h1><p>{body}</p>{anchors}</body></html>"
+
+
+@pytest.fixture(autouse=True)
+def no_negative_cache(monkeypatch):
+    monkeypatch.setattr(settings, "negative_cache_enabled", False)
+
+
+def test_normalize_url_drops_tracking_and_fragment():
+    assert normalize_url("HTTPS://Example.com/path/?utm_source=x&id=1#top") == "https://example.com/path?id=1"
+
+
+def test_extract_links_keeps_same_origin_pages():
+    page = '<a href="/a">a</a><a href="https://other.com/">x</a><a href="/doc.pdf">pdf</a><a href="mailto:a@b">m</a>'
+    
+    assert extract_links(page, "https://example.com/") == ["https://example.com/a"]
+
+
+def test_duplicates_do_not_count_against_max_pages(http_server):
+    links = ["/copy", "/alias", "/one", "/two", "/three"]
+    http_server.routes.update({
+        "/": (200, {}, html("Главная", "Курсы английского онлайн", links)),
+        # Тот же текст, что у главной, и ссылка с каноническим URL главной
+        "/copy": (200, {}, html("Главная", "Курсы английского онлайн", links)),
+        "/alias": (200, {}, html("Копия", "Другой текст копии", canonical="/")),
+        "/one": (200, {}, html("Первая", "Страница с тарифами")),
+        "/two": (200, {}, html("Вторая", "Страница с отзывами")),
+        "/three": (200, {}, html("Третья", "Страница с контактами")),
+    })
+    crawler = SiteCrawler(max_depth=1, max_pages=3, concurrency=1, delay=0)
+    
+    pages = list(crawler.crawl(http_server.url("/")))
+    
+    assert [page.title for page in pages] == ["Главная", "Первая", "Вторая"]
+    assert "/three" not in http_server.requests
+
+
+def test_failed_pages_do_not_count_against_max_pages(http_server):
+    http_server.routes.update({
+        "/": (200, {}, html("Главная", "Курсы", ["/missing", "/one"])),
+        "/one": (200, {}, html("Первая", "Тарифы")),
+    })
+    crawler = SiteCrawler(max_depth=1, max_pages=2, concurrency=2, delay=0)
+    
+    assert [page.title for page in crawler.crawl(http_server.url("/"))] == ["Главная", "Первая"]
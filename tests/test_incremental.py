@@ -0,0 +1,153 @@
+"""
+Тесты инкрементального анализа: отпечатки секций, сравнение версий
+страницы, порог полного анализа и объединение рекомендаций.
+"""
+
+from typing import Dict
+
+import pytest
+
+import core.sections as sections
+from analyzers.ui_designer import UIDesignerAnalyzer
+from core.models import AnalysisResult, PageContent
+from core.sections import diff_sections, fingerprint_text, make_section_key
+from scrapers.html_parser import HTMLParser
+from tests.fakes import FakeLLMProvider
+
+
+BLOCKS = {
+    "Курсы английского": "Занятия с преподавателем 3 раза в неделю. Первый урок бесплатно.",
+    "Тарифы": "Базовый тариф 4 900 рублей в месяц. Интенсив 8 900 рублей в месяц.",
+    "Преподаватели": "Все преподаватели сдали CELTA и ведут занятия больше пяти лет.",
+    "Отзывы": "Через три месяца я свободно говорю на собеседованиях.",
+}
+
+FIRST_RESPONSE = (
+    "1. Упростить блок «Тарифы»\n"
+    "Тарифы стоит показать таблицей.\n\n"
+    "2. Добавить фото в блок «Отзывы»\n"
+    "Отзывы без фото вызывают меньше доверия.\n\n"
+    "3. Усилить первый экран\n"
+    "Главное предложение не видно сразу."
+)
+
+DELTA_RESPONSE = "1. Добавить сравнение в блок «Тарифы»\nПокажите, что входит в каждый тариф."
+
+
+def landing(**changes: str) -> PageContent:
+    """Страница с блоками BLOCKS; changes заменяет текст блоков по заголовку."""
+    blocks = {**BLOCKS, **changes}
+    body = "".join(f"<h2>{heading}</h2><p>{text}</p>" for heading, text in blocks.items())
+    html = f"<html><head><title>Курсы английского онлайн</title></head><body>{body}</body></html>"
+    return HTMLParser().parse(html, url="https://example.com/", use_fallbacks=False)
+
+
+@pytest.fixture
+def previous() -> AnalysisResult:
+    """Результат полного анализа исходной версии страницы."""
+    return UIDesignerAnalyzer(FakeLLMProvider(FIRST_RESPONSE)).analyze(landing())
+
+
+def test_fingerprint_ignores_formatting_but_not_content():
+    assert fingerprint_text("Первый  урок\nбесплатно") == fingerprint_text("первый урок бесплатно ")
+    assert fingerprint_text("Первый урок бесплатно") != fingerprint_text("Первый урок платный")
+
+
+def test_fingerprint_changes_with_version(monkeypatch):
+    before = fingerprint_text("Первый урок бесплатно")
+    monkeypatch.setattr(sections, "FINGERPRINT_VERSION", sections.FINGERPRINT_VERSION + 1)
+    
+    assert fingerprint_text("Первый урок бесплатно") != before
+
+
+def test_section_keys_are_stable_and_unique():
+    seen: Dict[str, int] = {}
+    
+    keys = [make_section_key(heading, seen) for heading in ["Тарифы", "", "Тарифы!", "Отзывы клиентов"]]
+    
+    assert keys == ["тарифы", "intro", "тарифы-2", "отзывы-клиентов"]
+
+
+def test_parser_fingerprints_change_only_for_edited_section():
+    original = {s.key: s.fingerprint for s in landing().sections}
+    edited = {s.key: s.fingerprint for s in landing(Тарифы="Базовый тариф 5 900 рублей в месяц.").sections}
+    
+    assert original.keys() == edited.keys()
+    assert [key for key in original if original[key] != edited[key]] == ["тарифы"]
+
+
+def test_diff_sections_classifies_changes():
+    previous = {s.key: s.fingerprint for s in landing().sections}
+    previous["акции"] = "0" * 16
+    current = landing(Тарифы="Новые цены").sections + landing(Контакты="Москва").sections[-1:]
+    
+    diff = diff_sections(previous, current)
+    
+    assert diff.changed == {"тарифы"}
+    assert diff.removed == {"акции"}
+    assert diff.added == {"контакты"}
+    assert "отзывы" in diff.unchanged
+    assert diff.affected == {"тарифы", "контакты"}
+    assert diff.change_ratio == pytest.approx(3 / 6)
+
+
+def test_unchanged_page_reuses_previous_result(previous):
+    provider = FakeLLMProvider()
+    
+    result = UIDesignerAnalyzer(provider).analyze_incremental(landing(), previous)
+    
+    assert provider.prompts == []
+    assert result.recommendations == previous.recommendations
+    assert result.analyzed_at >= previous.analyzed_at
+
+
+def test_small_change_merges_kept_and_new_recommendations(previous):
+    provider = FakeLLMProvider(DELTA_RESPONSE)
+    content = landing(Тарифы="Базовый тариф 5 900 рублей в месяц.")
+    
+    result = UIDesignerAnalyzer(provider).analyze_incremental(content, previous, max_change_ratio=0.5)
+    
+    [(_, prompt)] = provider.prompts
+    assert "Изменённые блоки" in prompt
+    assert "5 900 рублей" in prompt
+    assert "CELTA" not in prompt
+    # Рекомендация по неизменённым «Отзывам» сохраняется, по изменённым «Тарифам» - заменяется,
+    # общая (без привязки к секциям) запрашивается заново
+    assert [rec.title for rec in result.recommendations] == [
+        "Добавить фото в блок «Отзывы»",
+        "Добавить сравнение в блок «Тарифы»",
+    ]
+    assert [rec.number for rec in result.recommendations] == [1, 2]
+    assert result.section_fingerprints == {s.key: s.fingerprint for s in content.sections}
+
+
+def test_large_change_forces_full_analysis(previous):
+    provider = FakeLLMProvider(FIRST_RESPONSE)
+    content = landing(Тарифы="Новые цены", Преподаватели="Новые лица", Отзывы="Новые отзывы")
+    
+    result = UIDesignerAnalyzer(provider).analyze_incremental(content, previous, max_change_ratio=0.5)
+    
+    [(_, prompt)] = provider.prompts
+    assert "Изменённые блоки" not in prompt
+    assert "Новые лица" in prompt
+    assert len(result.recommendations) == 3
+
+
+def test_fingerprints_from_older_version_force_full_analysis(monkeypatch, previous):
+    # После смены очистки текста все сохранённые отпечатки не совпадают
+    monkeypatch.setattr(sections, "FINGERPRINT_VERSION", sections.FINGERPRINT_VERSION + 1)
+    provider = FakeLLMProvider(FIRST_RESPONSE)
+    
+    UIDesignerAnalyzer(provider).analyze_incremental(landing(), previous, max_change_ratio=0.5)
+    
+    [(_, prompt)] = provider.prompts
+    assert "Изменённые блоки" not in prompt
+
+
+def test_missing_previous_result_runs_full_analysis():
+    provider = FakeLLMProvider(FIRST_RESPONSE)
+    
+    result = UIDesignerAnalyzer(provider).analyze_incremental(landing(), None)
+    
+    assert len(provider.prompts) == 1
+    assert result.section_fingerprints
@@ -0,0 +1,58 @@
+"""
+Тесты исправления и разбора JSON-ответов LLM.
+"""
+
+import json
+
+from core.json_output import parse_json_recommendations, repair_json
+
+
+def test_bracket_inside_string_does_not_break_truncation():
+    text = '[{"title":"A","description":"d [1]"},{"title":"B","descr'
+    
+    assert json.loads(repair_json(text)) == [{"title": "A", "description": "d [1]"}]
+    recommendations = parse_json_recommendations(text)
+    assert [rec.title for rec in recommendations] == ["A"]
+
+
+def test_truncated_wrapper_object_is_closed():
+    text = (
+        '{"recommendations": [{"title": "A", "description": "a", "priority": "high"}, '
+        '{"title": "B", "description": "b"}, {"title": "C", "desc'
+    )
+    
+    assert json.loads(repair_json(text)) == {"recommendations": [
+        {"title": "A", "description": "a", "priority": "high"},
+        {"title": "B", "description": "b"}
+    ]}
+    recommendations = parse_json_recommendations(text)
+    assert [rec.title for rec in recommendations] == ["A", "B"]
+    assert recommendations[0].priority == "high"
+
+
+def test_markdown_wrapper_and_trailing_commas_are_removed():
+    text = (
+        "Вот рекомендации:\n```json\n"
+        '[{"title": "A", "description": "Кнопки: купить, заказать, ]",},]\n'
+        "```\nНадеюсь, это поможет!"
+    )
+    
+    assert json.loads(repair_json(text)) == [{"title": "A", "description": "Кнопки: купить, заказать, ]"}]
+
+
+def test_escaped_quote_keeps_string_state():
+    text = '[{"title": "Кнопка \\"Купить\\" [CTA]", "description": "x"}, {"title": "B"'
+    
+    assert json.loads(repair_json(text)) == [{"title": 'Кнопка "Купить" [CTA]', "description": "x"}]
+
+
+def test_valid_json_is_parsed_without_repair():
+    text = json.dumps([{"title": "A", "description": "a", "priority": "low"}])
+    
+    assert repair_json(text) == text
+    assert parse_json_recommendations(text)[0].priority == "low"
+
+
+def test_unrecoverable_answer_returns_none():
+    assert parse_json_recommendations('[{"title": "A", "descr') is None
+    assert parse_json_recommendations("1. Текстовый ответ без JSON") is None
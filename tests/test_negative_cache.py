@@ -0,0 +1,91 @@
+"""
+Тесты кэша неудачных загрузок.
+"""
+
+import time
+
+import pytest
+
+from core import metrics
+from core.config import settings
+from core.exceptions import ScraperError
+from scrapers.html_parser import HTMLParser
+from scrapers.negative_cache import CONNECT, DNS, SUPPRESSED_METRIC, TIMEOUT, NegativeCache, get_negative_cache
+
+
+@pytest.fixture
+def cache():
+    metrics.reset()
+    return NegativeCache(max_entries=100)
+
+
+def test_http_error_is_remembered_for_url_only(cache):
+    cache.remember(ScraperError("HTTP 404", url="https://example.com/a", status_code=404))
+    
+    with pytest.raises(ScraperError) as error:
+        cache.check("https://example.com/a#section")
+    assert error.value.status_code == 404
+    assert "кэша ошибок" in str(error.value)
+    cache.check("https://example.com/b")
+    assert metrics.get(SUPPRESSED_METRIC) == 1
+    assert metrics.get(f"{SUPPRESSED_METRIC}.404") == 1
+
+
+@pytest.mark.parametrize("kind", [DNS, CONNECT])
+def test_unreachable_host_is_remembered_for_all_urls(cache, kind):
+    cache.remember(ScraperError("нет соединения", url="https://down.example/a", kind=kind))
+    
+    with pytest.raises(ScraperError) as error:
+        cache.check("https://down.example/other")
+    assert error.value.kind == kind
+    cache.check("https://up.example/a")
+
+
+def test_read_timeout_is_remembered_for_url(cache):
+    cache.remember(ScraperError("таймаут", url="https://slow.example/a", kind=TIMEOUT))
+    
+    with pytest.raises(ScraperError):
+        cache.check("https://slow.example/a")
+    cache.check("https://slow.example/b")
+
+
+@pytest.mark.parametrize("status", [429, 502, 503, 504])
+def test_retryable_statuses_are_not_cached(cache, status):
+    cache.remember(ScraperError(f"HTTP {status}", url="https://example.com/", status_code=status))
+    
+    cache.check("https://example.com/")
+    assert len(cache) == 0
+
+
+def test_entries_expire(cache, monkeypatch):
+    monkeypatch.setattr(settings, "negative_cache_ttl_not_found", 0.05)
+    cache.remember(ScraperError("HTTP 404", url="https://example.com/", status_code=404))
+    
+    time.sleep(0.06)
+    cache.check("https://example.com/")
+    assert len(cache) == 0
+
+
+def test_oldest_entries_are_evicted():
+    cache = NegativeCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.remember(ScraperError("HTTP 404", url=f"https://example.com/{name}", status_code=404))
+        
+    assert len(cache) == 2
+    cache.check("https://example.com/a")
+    with pytest.raises(ScraperError):
+        cache.check("https://example.com/c")
+
+
+def test_repeated_fetch_does_not_reach_server(http_server, monkeypatch):
+    monkeypatch.setattr(settings, "negative_cache_enabled", True)
+    get_negative_cache().clear()
+    parser = HTMLParser(timeout=2)
+    
+    for _ in range(2):
+        with pytest.raises(ScraperError) as error:
+            parser.fetch(http_server.url("/missing"))
+        assert error.value.status_code == 404
+        
+    assert http_server.requests == ["/missing"]
+    get_negative_cache().clear()
@@ -0,0 +1,110 @@
+"""
+Тесты пула процессов разбора HTML: передача через общую память,
+прерывание зависшего разбора и повтор задачи после перезапуска пула.
+"""
+
+import asyncio
+import os
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from core.config import settings
+from core.exceptions import ScraperError
+from scrapers import parse_pool
+from scrapers.parse_pool import ParsePool
+
+
+PAGE = "<html><head><title>Курсы</title></head><body><h1>Курсы английского</h1><p>{}</p></body></html>"
+
+# Файл, в который процессы пула записывают начатые задачи
+ATTEMPTS_ENV = "PARSE_POOL_TEST_ATTEMPTS"
+
+
+def _parse_with_delays(url, html, shm_name, size):
+    """Разбор в процессе пула с задержкой, заданной в URL (?sleep=секунды)."""
+    path = os.environ.get(ATTEMPTS_ENV)
+    if path:
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(url + "\n")
+    if "?sleep=" in url:
+        time.sleep(float(url.split("?sleep=")[1]))
+    # В процессе пула модуль импортирован заново, подмена теста там не действует
+    return parse_pool._parse_in_worker(url, html, shm_name, size)
+
+
+@pytest.fixture
+def pool(monkeypatch, tmp_path):
+    attempts = tmp_path / "attempts.txt"
+    monkeypatch.setenv(ATTEMPTS_ENV, str(attempts))
+    monkeypatch.setattr(parse_pool, "_parse_in_worker", _parse_with_delays)
+    pool = ParsePool(size=2, timeout=3.0)
+    pool.attempts = attempts
+    yield pool
+    pool.close()
+
+
+def attempts(pool) -> list:
+    return pool.attempts.read_text(encoding="utf-8").splitlines() if pool.attempts.exists() else []
+
+
+def test_small_page_is_parsed_in_pool(pool):
+    page = asyncio.run(pool.parse(PAGE.format("текст"), url="https://example.com/"))
+    
+    assert page.title == "Курсы"
+    assert "Курсы английского" in page.text
+
+
+def test_large_page_goes_through_shared_memory_and_is_released(pool, monkeypatch):
+    created = []
+    
+    class RecordingSharedMemory(SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self.name)
+            
+    monkeypatch.setattr(parse_pool, "SharedMemory", RecordingSharedMemory)
+    monkeypatch.setattr(settings, "parse_shm_threshold", 1024)
+    html = PAGE.format("Первый урок бесплатно. " * 200)
+    
+    page = asyncio.run(pool.parse(html, url="https://example.com/big"))
+    
+    assert "Первый урок бесплатно." in page.text
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=created[0])
+
+
+def test_hung_parse_is_killed_and_pool_restarts(pool):
+    async def scenario():
+        started = time.monotonic()
+        with pytest.raises(ScraperError, match="Превышено время разбора"):
+            await pool.parse(PAGE.format("x"), url="https://example.com/?sleep=60")
+        elapsed = time.monotonic() - started
+        page = await pool.parse(PAGE.format("после перезапуска"), url="https://example.com/next")
+        return elapsed, page
+        
+    executor = pool._get_executor()
+    elapsed, page = asyncio.run(scenario())
+    
+    assert elapsed < 10
+    assert pool._executor is not executor
+    assert not any(process.is_alive() for process in (executor._processes or {}).values())
+    assert "после перезапуска" in page.text
+
+
+def test_task_killed_by_restart_is_retried_once(pool):
+    async def scenario():
+        hung = asyncio.create_task(pool.parse(PAGE.format("x"), url="https://example.com/hung?sleep=60"))
+        # Вторая задача выполняется в момент перезапуска пула из-за первой
+        await asyncio.sleep(2.0)
+        neighbour = asyncio.create_task(pool.parse(PAGE.format("соседняя"), url="https://example.com/n?sleep=1.5"))
+        results = await asyncio.gather(hung, neighbour, return_exceptions=True)
+        return results
+        
+    hung, neighbour = asyncio.run(scenario())
+    
+    assert isinstance(hung, ScraperError)
+    assert "соседняя" in neighbour.text
+    assert attempts(pool).count("https://example.com/n?sleep=1.5") == 2
@@ -0,0 +1,87 @@
+"""
+Тесты потокового разбора рекомендаций из текстового ответа LLM.
+"""
+
+from core.recommendation_parser import RecommendationParser, parse_recommendations
+
+
+RESPONSE = """Вот что стоит улучшить:
+
+1. Усилить оффер [высокий]
+Добавьте выгоду в заголовок первого экрана.
+Сейчас непонятно, что получит клиент.
+
+## 2) Упростить форму
+Оставьте два поля:
+   1. имя
+   2. телефон
+Приоритет: низкий
+
+**3. Добавить отзывы**: покажите реальные отзывы с фото.
+"""
+
+
+def test_numbered_items_with_markup_and_priorities():
+    recommendations = parse_recommendations(RESPONSE)
+    
+    assert [(rec.number, rec.title, rec.priority) for rec in recommendations] == [
+        (1, "Усилить оффер", "high"),
+        (2, "Упростить форму", "low"),
+        (3, "Добавить отзывы", "medium"),
+    ]
+    assert recommendations[0].description == (
+        "Добавьте выгоду в заголовок первого экрана.\nСейчас непонятно, что получит клиент."
+    )
+    assert recommendations[2].description == "покажите реальные отзывы с фото."
+
+
+def test_nested_numbering_stays_in_description():
+    description = parse_recommendations(RESPONSE)[1].description
+    
+    assert "1. имя" in description and "2. телефон" in description
+    assert "Приоритет" not in description
+
+
+def test_streamed_tokens_give_same_result_as_whole_response():
+    parser = RecommendationParser()
+    completed = []
+    for start in range(0, len(RESPONSE), 3):
+        completed.extend(parser.feed(RESPONSE[start:start + 3]))
+    completed.extend(parser.close())
+    
+    assert completed == parse_recommendations(RESPONSE)
+
+
+def test_item_is_returned_when_next_one_starts():
+    parser = RecommendationParser()
+    
+    assert parser.feed("1. Первый\nОписание первого\n") == []
+    completed = parser.feed("2. Второй\n")
+    assert [rec.title for rec in completed] == ["Первый"]
+    assert [rec.title for rec in parser.feed("Описание второго")] == []
+    assert [rec.title for rec in parser.close()] == ["Второй"]
+
+
+def test_limit_and_sequential_numbering():
+    response = "\n".join(f"{n}. Пункт {n}\nОписание {n}" for n in range(3, 10))
+    
+    recommendations = parse_recommendations(response, limit=3)
+    
+    assert [(rec.number, rec.title) for rec in recommendations] == [
+        (1, "Пункт 3"), (2, "Пункт 4"), (3, "Пункт 5")
+    ]
+
+
+def test_items_without_description_are_skipped():
+    recommendations = parse_recommendations("1. Без описания\n2. С описанием\nТекст")
+    
+    assert [(rec.number, rec.title) for rec in recommendations] == [(1, "С описанием")]
+
+
+def test_unstructured_answer_falls_back_to_single_recommendation():
+    recommendations = parse_recommendations("Страница в целом хорошая.", fallback_title="Итог")
+    
+    assert len(recommendations) == 1
+    assert recommendations[0].title == "Итог"
+    assert recommendations[0].description == "Страница в целом хорошая."
+    assert parse_recommendations("   ") == []
@@ -0,0 +1,79 @@
+"""
+Тесты реестра модулей анализа: выбор модулей для роли.
+"""
+
+import json
+
+from agent import analyze_page
+from core.registry import needs_llm, role_choices, role_keys
+from tests.fakes import FakeLLMProvider
+
+
+SEO_PLUGIN = {
+    "key": "seo",
+    "name": "SEO-аудитор",
+    "description": "Проверка мета-тегов",
+    "target": "tests.fakes:SEOAnalyzer",
+    "requires_llm": False
+}
+
+
+def write_config(path, entries):
+    path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+
+
+def test_local_plugin_role_runs_plugin_and_prefilter(analyzers_config, page):
+    write_config(analyzers_config, [SEO_PLUGIN])
+    
+    assert "seo" in role_choices()
+    assert role_keys("seo") == ["instant", "seo"]
+    assert not needs_llm("seo")
+    
+    results = analyze_page(page, "seo", None)
+    assert [result.module_name for result in results] == ["Экспресс-проверка", "SEO-аудитор"]
+    assert results[1].recommendations[0].title == "Добавить canonical"
+
+
+def test_all_role_includes_local_plugins_before_llm_modules(analyzers_config):
+    write_config(analyzers_config, [SEO_PLUGIN])
+    
+    assert role_keys("all") == ["instant", "seo", "ui", "content"]
+    assert needs_llm("all")
+
+
+def test_disabled_prefilter_is_not_run(analyzers_config, page):
+    write_config(analyzers_config, [SEO_PLUGIN, {"key": "instant", "enabled": False}])
+    
+    assert role_keys("seo") == ["seo"]
+    assert role_keys("ui") == ["ui"]
+    
+    provider = FakeLLMProvider()
+    results = analyze_page(page, "ui", provider)
+    assert [result.module_name for result in results] == ["UI-дизайнер"]
+    assert "Автоматическая проверка" not in provider.prompts[0][1]
+
+
+def test_prefilter_findings_reach_llm_prompt(analyzers_config, page):
+    provider = FakeLLMProvider()
+    results = analyze_page(page, "content", provider)
+    
+    rules_result, llm_result = results
+    assert rules_result.module_name == "Экспресс-проверка"
+    assert rules_result.recommendations
+    user_prompt = provider.prompts[0][1]
+    for issue in rules_result.recommendations:
+        assert issue.title in user_prompt
+    assert llm_result.recommendations[0].title == "Усилить оффер"
+
+
+def test_unknown_role_runs_nothing(analyzers_config):
+    assert role_keys("missing") == []
+    assert not needs_llm("missing")
+
+
+def test_web_run_analyzers_uses_registry(analyzers_config, page):
+    from web.app import run_analyzers
+    
+    write_config(analyzers_config, [SEO_PLUGIN])
+    results = run_analyzers(page, "seo", None)
+    assert [result.module_name for result in results] == ["Экспресс-проверка", "SEO-аудитор"]
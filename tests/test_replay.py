@@ -0,0 +1,121 @@
+"""
+Тесты воспроизведения из архива: ответы LLM по точному промпту и
+по странице с системным промптом, прогон agent.py --replay без сети.
+"""
+
+import sys
+
+import pytest
+
+import agent
+from agent import analyze_page
+from core.archive import PageArchive, page_scope
+from core.exceptions import LLMError
+from llm_providers.archiving import ArchivingLLMProvider
+from llm_providers.replay import ReplayLLMProvider
+from scrapers.html_parser import HTMLParser
+from tests.fakes import FakeLLMProvider
+
+
+URL = "https://example.com/"
+
+HTML = (
+    "<html><head><title>Курсы английского онлайн</title>"
+    "<meta name='description' content='Занятия с преподавателем'></head><body>"
+    "<h1>Курсы английского онлайн</h1>"
+    "<p>Занятия с преподавателем 3 раза в неделю. Первый урок бесплатно. Группы до 6 человек.</p>"
+    "<a class='btn' href='/signup'>Записаться на пробный урок</a>"
+    "</body></html>"
+)
+
+RESPONSE = "1. Показать цену в первом экране\nПосетитель уходит искать стоимость."
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    """Архив со страницей и диалогами LLM, записанными обычным анализом."""
+    directory = tmp_path / "archive"
+    archive = PageArchive(str(directory))
+    archive.put_page(URL, HTML)
+    provider = ArchivingLLMProvider(FakeLLMProvider(RESPONSE), archive)
+    analyze_page(HTMLParser().parse(HTML, url=URL), "all", provider)
+    archive.close()
+    return str(directory)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = PageArchive(str(tmp_path / "transcripts"))
+    yield archive
+    archive.close()
+
+
+def test_exact_prompt_returns_recorded_response(archive):
+    archive.put_transcript("system", "user", "ответ", url=URL)
+    archive.put_transcript("system", "другой промпт", "другой ответ", url=URL)
+    provider = ReplayLLMProvider(archive)
+    
+    assert provider.call("system", "другой промпт") == "другой ответ"
+    assert provider.call("system", "user") == "ответ"
+    assert provider.stats == {"exact": 2, "fallback": 0, "missing": 0}
+
+
+def test_changed_prompt_falls_back_to_page_responses_in_order(archive):
+    archive.put_transcript("system", "старый промпт 1", "первый", url=URL)
+    archive.put_transcript("system", "старый промпт 2", "второй", url=URL)
+    archive.put_transcript("другая роль", "старый промпт", "чужой", url=URL)
+    provider = ReplayLLMProvider(archive)
+    
+    with page_scope(URL):
+        answers = [provider.call("system", f"новый промпт {index}") for index in range(3)]
+        
+    # Ответов больше, чем записано: повторяется последний
+    assert answers == ["первый", "второй", "второй"]
+    assert provider.stats["fallback"] == 3
+
+
+def test_fallback_requires_same_page_and_system_prompt(archive):
+    archive.put_transcript("system", "старый промпт", "ответ", url=URL)
+    provider = ReplayLLMProvider(archive)
+    
+    with page_scope("https://example.org/"):
+        with pytest.raises(LLMError):
+            provider.call("system", "новый промпт")
+    with page_scope(URL):
+        with pytest.raises(LLMError):
+            provider.call("другая роль", "новый промпт")
+    assert provider.stats["missing"] == 2
+
+
+def test_pipeline_replays_recorded_responses_exactly(archive_dir):
+    archive = PageArchive(archive_dir)
+    provider = ReplayLLMProvider(archive)
+    
+    results = analyze_page(HTMLParser().parse(HTML, url=URL), "all", provider)
+    archive.close()
+    
+    llm_results = [result for result in results if result.recommendations and result.module_name != "Экспресс-проверка"]
+    assert llm_results
+    assert all(result.recommendations[0].title == "Показать цену в первом экране" for result in llm_results)
+    assert provider.stats["exact"] == len(llm_results)
+    assert provider.stats["fallback"] == provider.stats["missing"] == 0
+
+
+def test_agent_replay_writes_report_without_network(monkeypatch, tmp_path, archive_dir, capsys):
+    report = tmp_path / "replay.ndjson"
+    monkeypatch.setattr(sys, "argv", [
+        "agent.py", "--replay", archive_dir, "--role", "all", "--output", str(report), "--no-color"
+    ])
+    
+    assert agent.main() == 0
+    
+    output = capsys.readouterr().out
+    assert "Воспроизведено страниц: 1 из 1" in output
+    assert "точное совпадение промпта - 2, по странице и модулю - 0, нет в архиве - 0" in output
+    assert "Показать цену в первом экране" in report.read_text(encoding="utf-8")
+
+
+def test_agent_replay_reports_missing_archive(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "argv", ["agent.py", "--replay", str(tmp_path / "missing"), "--role", "all"])
+    
+    assert agent.main() == 1
@@ -0,0 +1,110 @@
+"""
+Тесты очистки директории отчётов: лимиты срока, размера и числа
+файлов, порядок удаления и брошенные временные файлы.
+"""
+
+import os
+import threading
+import time
+
+from outputs.retention import STALE_TEMP_AGE, OutputRetention, RetentionSweeper
+
+
+def make_file(directory, name: str, age: float = 0.0, size: int = 10):
+    """Создать файл заданного размера с временем изменения age секунд назад."""
+    path = directory / name
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def names(directory) -> set:
+    return {path.name for path in directory.iterdir()}
+
+
+def retention(directory, max_age_days: float = 0, max_total_mb: float = 0, max_files: int = 0) -> OutputRetention:
+    return OutputRetention(str(directory), max_age_days=max_age_days, max_total_mb=max_total_mb, max_files=max_files)
+
+
+def test_reports_older_than_max_age_are_removed(tmp_path):
+    make_file(tmp_path, "analysis_old.txt", age=3 * 86400)
+    make_file(tmp_path, "analysis_new.txt", age=3600)
+    
+    assert retention(tmp_path, max_age_days=1).sweep() == 1
+    assert names(tmp_path) == {"analysis_new.txt"}
+
+
+def test_oldest_reports_are_removed_to_fit_total_size(tmp_path):
+    megabyte = 1024 * 1024
+    for index, name in enumerate(["analysis_a.txt", "batch_b.ndjson", "replay_c.md"]):
+        make_file(tmp_path, name, age=300 - index * 100, size=megabyte)
+        
+    assert retention(tmp_path, max_total_mb=2).sweep() == 1
+    assert names(tmp_path) == {"batch_b.ndjson", "replay_c.md"}
+
+
+def test_oldest_reports_are_removed_to_fit_max_files(tmp_path):
+    # Порядок создания не совпадает с порядком по времени изменения
+    make_file(tmp_path, "analysis_2.txt", age=200)
+    make_file(tmp_path, "analysis_3.txt", age=100)
+    make_file(tmp_path, "analysis_1.txt", age=300)
+    make_file(tmp_path, "analysis_4.txt", age=0)
+    
+    assert retention(tmp_path, max_files=2).sweep() == 2
+    assert names(tmp_path) == {"analysis_3.txt", "analysis_4.txt"}
+
+
+def test_zero_limits_keep_everything(tmp_path):
+    for index in range(3):
+        make_file(tmp_path, f"analysis_{index}.txt", age=400 * 86400)
+        
+    assert retention(tmp_path).sweep() == 0
+    assert len(names(tmp_path)) == 3
+
+
+def test_service_files_and_directories_are_left_alone(tmp_path):
+    make_file(tmp_path, ".gitkeep", age=400 * 86400)
+    make_file(tmp_path, "results.sqlite3", age=400 * 86400)
+    (tmp_path / "archive").mkdir()
+    make_file(tmp_path / "archive", "analysis_inside.txt", age=400 * 86400)
+    make_file(tmp_path, "analysis_old.txt", age=400 * 86400)
+    
+    assert retention(tmp_path, max_age_days=1, max_files=1).sweep() == 1
+    assert names(tmp_path) == {".gitkeep", "results.sqlite3", "archive"}
+    assert names(tmp_path / "archive") == {"analysis_inside.txt"}
+
+
+def test_stale_temp_files_are_removed(tmp_path):
+    make_file(tmp_path, ".analysis_x.txt.1a2b3c4d.tmp", age=STALE_TEMP_AGE + 60)
+    make_file(tmp_path, ".analysis_y.txt.5e6f7a8b.tmp", age=10)
+    
+    # Временные файлы не считаются отчётами
+    assert retention(tmp_path, max_files=1).sweep() == 0
+    assert names(tmp_path) == {".analysis_y.txt.5e6f7a8b.tmp"}
+
+
+def test_missing_directory_is_not_an_error(tmp_path):
+    assert retention(tmp_path / "missing", max_files=1).sweep() == 0
+
+
+def test_sweeper_runs_tasks_despite_failures():
+    calls = []
+    done = threading.Event()
+    
+    def failing():
+        calls.append("failing")
+        raise OSError("диск недоступен")
+    
+    def working():
+        calls.append("working")
+        done.set()
+        
+    sweeper = RetentionSweeper([failing, working], interval=60)
+    sweeper.start()
+    try:
+        assert done.wait(timeout=2)
+    finally:
+        sweeper.stop()
+        
+    assert calls == ["failing", "working"]
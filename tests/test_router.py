@@ -0,0 +1,180 @@
+"""
+Тесты маршрутизатора LLM на локальных подставных серверах:
+переключение при ошибке, пауза маршрута и потолок стоимости.
+"""
+
+import time
+
+import pytest
+
+from core.config import settings
+from core.exceptions import LLMError
+from llm_providers.factory import create_llm_provider
+from llm_providers.gigachat_provider import GigaChatProvider
+from llm_providers.openai_compatible import OpenAICompatibleProvider
+from llm_providers.router import MIN_SAMPLES_FOR_P95, LLMRouter, Route, RouteStats
+from tests.fake_llm_server import FakeLLMServer
+from tests.fakes import FakeLLMProvider
+
+
+CREDENTIALS = "dGVzdDp0ZXN0"
+
+
+@pytest.fixture
+def openai_server():
+    server = FakeLLMServer(reply="Ответ локальной модели")
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def gigachat_server():
+    server = FakeLLMServer(reply="Ответ GigaChat")
+    yield server
+    server.close()
+
+
+def openai_route(server: FakeLLMServer, cost: float = 0.0) -> Route:
+    provider = OpenAICompatibleProvider(base_url=server.openai_url, model="local-model", timeout=5)
+    return Route(name="local", provider=provider, cost_per_1k=cost)
+
+
+def gigachat_route(server: FakeLLMServer, cost: float = 0.2) -> Route:
+    provider = GigaChatProvider(
+        credentials=CREDENTIALS,
+        base_url=server.gigachat_url,
+        auth_url=server.gigachat_auth_url
+    )
+    return Route(name="gigachat", provider=provider, cost_per_1k=cost)
+
+
+def stats(router: LLMRouter) -> dict:
+    return {item["name"]: item for item in router.snapshot()}
+
+
+def test_route_score_without_samples_is_none():
+    stats = RouteStats()
+    assert stats.score is None
+    
+    stats.record_success(0.4)
+    assert stats.score == pytest.approx(0.4)
+    
+    for latency in [0.1] * (MIN_SAMPLES_FOR_P95 - 2) + [2.0]:
+        stats.record_success(latency)
+    assert stats.score == stats.p95 == 2.0
+
+
+def test_route_without_samples_is_tried_before_measured_ones():
+    measured, fresh = FakeLLMProvider("measured"), FakeLLMProvider("fresh")
+    measured_route = Route(name="measured", provider=measured)
+    measured_route.stats.record_success(0.01)
+    router = LLMRouter([measured_route, Route(name="fresh", provider=fresh)])
+    
+    assert router.call("system", "user") == "fresh"
+    assert measured.prompts == []
+
+
+def test_failed_route_fails_over_to_next(openai_server, gigachat_server):
+    openai_server.fail_status = 500
+    router = LLMRouter([openai_route(openai_server), gigachat_route(gigachat_server)], cooldown=60)
+    
+    assert router.call("system", "user") == "Ответ GigaChat"
+    assert len(openai_server.requests) == 1
+    assert stats(router)["local"]["errors"] == 1
+    assert stats(router)["local"]["paused"]
+    assert not stats(router)["gigachat"]["paused"]
+
+
+def test_stream_fails_over_before_first_chunk(openai_server, gigachat_server):
+    openai_server.fail_status = 503
+    router = LLMRouter([openai_route(openai_server), gigachat_route(gigachat_server)], cooldown=60)
+    
+    assert "".join(router.stream("system", "user")).strip() == "Ответ GigaChat"
+    assert stats(router)["local"]["paused"]
+
+
+def test_paused_route_is_skipped_until_cooldown_ends(openai_server, gigachat_server):
+    openai_server.fail_status = 500
+    router = LLMRouter([openai_route(openai_server), gigachat_route(gigachat_server)], cooldown=0.3)
+    
+    router.call("system", "user")
+    router.call("system", "user")
+    assert len(openai_server.requests) == 1
+    
+    time.sleep(0.35)
+    openai_server.fail_status = None
+    assert router.call("system", "user") == "Ответ локальной модели"
+    assert len(openai_server.requests) == 2
+    assert not stats(router)["local"]["paused"]
+
+
+def test_cooldown_doubles_on_consecutive_errors(openai_server, gigachat_server):
+    openai_server.fail_status = 500
+    local = openai_route(openai_server)
+    router = LLMRouter([local, gigachat_route(gigachat_server)], cooldown=0.3)
+    
+    router.call("system", "user")
+    time.sleep(0.35)
+    router.call("system", "user")
+    
+    assert len(openai_server.requests) == 2
+    assert local.stats.cooldown_until - time.monotonic() > 0.45
+
+
+def test_routes_above_cost_ceiling_are_never_called(openai_server, gigachat_server):
+    gigachat_server.delay = 0.05  # Дешёвый маршрут медленнее дорогого
+    router = LLMRouter(
+        [openai_route(openai_server, cost=2.0), gigachat_route(gigachat_server, cost=0.2)],
+        max_cost_per_1k=1.0
+    )
+    
+    for _ in range(3):
+        assert router.call("system", "user") == "Ответ GigaChat"
+    assert openai_server.requests == []
+
+
+def test_no_route_within_cost_ceiling(openai_server, gigachat_server):
+    router = LLMRouter(
+        [openai_route(openai_server, cost=2.0), gigachat_route(gigachat_server, cost=0.2)],
+        max_cost_per_1k=0.1
+    )
+    
+    with pytest.raises(LLMError):
+        router.call("system", "user")
+    assert openai_server.requests == gigachat_server.requests == []
+
+
+def test_all_routes_failing_raises_llm_error(openai_server, gigachat_server):
+    openai_server.fail_status = 500
+    gigachat_server.fail_status = 500
+    router = LLMRouter([openai_route(openai_server), gigachat_route(gigachat_server)], cooldown=60)
+    
+    with pytest.raises(LLMError):
+        router.call("system", "user")
+    assert all(item["paused"] for item in router.snapshot())
+
+
+def test_factory_builds_router_from_settings(monkeypatch, openai_server, gigachat_server):
+    monkeypatch.setattr(settings, "gigachat_credentials", CREDENTIALS)
+    monkeypatch.setattr(settings, "gigachat_base_url", gigachat_server.gigachat_url)
+    monkeypatch.setattr(settings, "gigachat_auth_url", gigachat_server.gigachat_auth_url)
+    monkeypatch.setattr(settings, "gigachat_pro_model", "")
+    monkeypatch.setattr(settings, "openai_base_url", openai_server.openai_url)
+    monkeypatch.setattr(settings, "archive_enabled", False)
+    
+    provider = create_llm_provider()
+    
+    assert isinstance(provider, LLMRouter)
+    assert provider.is_available()
+    assert provider.call("system", "user") in ("Ответ GigaChat", "Ответ локальной модели")
+
+
+def test_gigachat_token_validity_uses_token_expiry(gigachat_server):
+    provider = gigachat_route(gigachat_server).provider
+    assert provider.has_valid_token() is False
+    
+    provider.warm_up()
+    assert provider.has_valid_token() is True
+    
+    provider._access_token.expires_at = int(time.time() * 1000)
+    assert provider.has_valid_token() is False
@@ -0,0 +1,102 @@
+"""
+Тесты локальных проверок экспресс-анализа: каждая проверка по
+структуре страницы и распознавание CTA парсером.
+"""
+
+from typing import Optional
+
+import pytest
+
+from analyzers.rules import (
+    MAX_CTA_COUNT,
+    META_DESCRIPTION_MAX,
+    META_DESCRIPTION_MIN,
+    TITLE_MAX_LENGTH,
+    RulesAnalyzer,
+    check_long_title,
+    check_meta_description,
+    check_missing_h1,
+    check_multiple_h1,
+    check_no_cta,
+    check_title,
+    check_too_many_cta,
+)
+from core.models import PageContent, PageStructure
+from scrapers.html_parser import HTMLParser
+
+
+def content(title: Optional[str] = "Курсы английского онлайн", **structure) -> PageContent:
+    return PageContent(url="https://example.com/", title=title, text="Текст", structure=PageStructure(**structure))
+
+
+def check(rule, page: PageContent):
+    return rule(page, page.structure)
+
+
+def test_missing_h1():
+    assert check(check_missing_h1, content(h1_count=0))[0] == "Добавить главный заголовок H1"
+    assert check(check_missing_h1, content(h1_count=1)) is None
+
+
+def test_multiple_h1():
+    assert check(check_multiple_h1, content(h1_count=1)) is None
+    assert "3 заголовков H1" in check(check_multiple_h1, content(h1_count=3))[1]
+
+
+def test_title_presence_and_length():
+    assert check(check_title, content(title=None))[0] == "Добавить заголовок страницы (title)"
+    assert check(check_title, content(title="Курсы")) is None
+    
+    assert check(check_long_title, content(title="т" * TITLE_MAX_LENGTH)) is None
+    assert check(check_long_title, content(title="т" * (TITLE_MAX_LENGTH + 1)))[0] == "Сократить заголовок страницы (title)"
+    assert check(check_long_title, content(title=None)) is None
+
+
+@pytest.mark.parametrize("description, title", [
+    (None, "Добавить meta description"),
+    ("м" * (META_DESCRIPTION_MIN - 1), "Скорректировать длину meta description"),
+    ("м" * (META_DESCRIPTION_MAX + 1), "Скорректировать длину meta description"),
+])
+def test_meta_description_missing_or_out_of_range(description, title):
+    assert check(check_meta_description, content(meta_description=description))[0] == title
+
+
+@pytest.mark.parametrize("length", [META_DESCRIPTION_MIN, META_DESCRIPTION_MAX])
+def test_meta_description_within_range(length):
+    assert check(check_meta_description, content(meta_description="м" * length)) is None
+
+
+def test_cta_count_bounds():
+    assert check(check_no_cta, content(cta_count=0))[0] == "Добавить призыв к действию"
+    assert check(check_no_cta, content(cta_count=1)) is None
+    assert check(check_too_many_cta, content(cta_count=MAX_CTA_COUNT)) is None
+    assert check(check_too_many_cta, content(cta_count=MAX_CTA_COUNT + 1)) is not None
+
+
+def test_cta_detection_by_tag_class_and_text():
+    html = (
+        "<html><body>"
+        "<button>Отправить</button>"
+        "<input type='submit' value='Готово'>"
+        "<a role='button' href='#'>Далее</a>"
+        "<a class='btn-primary cta' href='/order'>Подробнее</a>"
+        "<a href='/signup'>Записаться на пробный урок</a>"
+        "<a href='/about'>О компании</a>"
+        "<input type='text' name='email'>"
+        "</body></html>"
+    )
+    
+    structure = HTMLParser().parse(html, url="https://example.com/", use_fallbacks=False).structure
+    
+    assert structure.cta_count == 5
+
+
+def test_analyzer_sorts_findings_by_priority():
+    page = content(title="т" * (TITLE_MAX_LENGTH + 1), h1_count=0, meta_description=None, cta_count=1)
+    
+    recommendations = RulesAnalyzer().analyze(page).recommendations
+    
+    priorities = [rec.priority for rec in recommendations]
+    assert priorities == sorted(priorities, key=["high", "medium", "low"].index)
+    assert recommendations[0].title == "Добавить главный заголовок H1"
+    assert [rec.number for rec in recommendations] == list(range(1, len(recommendations) + 1))
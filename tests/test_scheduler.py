@@ -0,0 +1,140 @@
+"""
+Тесты планировщика загрузок: лимиты и паузы хостов, повторы после
+429/503, обработка ошибок и остановка.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from core.exceptions import ScraperError
+from scrapers.scheduler import FetchScheduler, host_of
+
+
+class Recorder:
+    """fetch для планировщика: запоминает время запросов и параллельность по хостам."""
+    
+    def __init__(self, duration: float = 0.02):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.active = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.started = defaultdict(list)
+    
+    def __call__(self, url: str) -> str:
+        host = host_of(url)
+        with self.lock:
+            self.active[host] += 1
+            self.peak[host] = max(self.peak[host], self.active[host])
+            self.started[host].append(time.monotonic())
+        time.sleep(self.duration)
+        with self.lock:
+            self.active[host] -= 1
+        return url.upper()
+
+
+def run(scheduler: FetchScheduler, urls):
+    with scheduler:
+        for url in urls:
+            scheduler.submit(url)
+        return list(scheduler.as_completed())
+
+
+def test_host_concurrency_is_limited_and_hosts_share_workers():
+    fetch = Recorder()
+    urls = [f"https://{host}/{n}" for n in range(6) for host in ("a.com", "b.com")]
+    
+    results = run(FetchScheduler(fetch, concurrency=4, host_concurrency=2, host_delay=0), urls)
+    
+    assert sorted(result.url for result in results) == sorted(urls)
+    assert all(result.value == result.url.upper() for result in results)
+    assert fetch.peak["a.com"] == fetch.peak["b.com"] == 2
+
+
+def test_requests_to_host_are_spaced_by_delay():
+    fetch = Recorder(duration=0)
+    
+    run(FetchScheduler(fetch, concurrency=4, host_concurrency=4, host_delay=0.1), [f"https://a.com/{n}" for n in range(3)])
+    
+    started = fetch.started["a.com"]
+    assert all(later - earlier >= 0.09 for earlier, later in zip(started, started[1:]))
+
+
+def test_retry_after_pauses_host_and_repeats_request():
+    attempts = defaultdict(int)
+    
+    def fetch(url):
+        attempts[url] += 1
+        if attempts[url] == 1:
+            raise ScraperError("HTTP 429", url=url, status_code=429, retry_after=0.2)
+        return "ok"
+        
+    started = time.monotonic()
+    results = run(FetchScheduler(fetch, concurrency=1, host_delay=0, max_retries=2), ["https://a.com/"])
+    
+    assert results[0].value == "ok" and results[0].error is None
+    assert attempts["https://a.com/"] == 2
+    assert time.monotonic() - started >= 0.2
+
+
+def test_retries_are_limited():
+    def fetch(url):
+        raise ScraperError("HTTP 503", url=url, status_code=503, retry_after=0)
+        
+    results = run(FetchScheduler(fetch, concurrency=1, host_delay=0, max_retries=2), ["https://a.com/"])
+    
+    assert results[0].error.status_code == 503
+
+
+def test_not_found_is_reported_without_retry():
+    calls = []
+    
+    def fetch(url):
+        calls.append(url)
+        raise ScraperError("HTTP 404", url=url, status_code=404)
+        
+    results = run(FetchScheduler(fetch, concurrency=1, host_delay=0, max_retries=3), ["https://a.com/"])
+    
+    assert results[0].error.status_code == 404
+    assert calls == ["https://a.com/"]
+
+
+def test_unexpected_exception_is_logged_and_keeps_cause(caplog):
+    def fetch(url):
+        raise KeyError("encoding")
+        
+    with caplog.at_level(logging.ERROR, logger="scrapers.scheduler"):
+        results = run(FetchScheduler(fetch, concurrency=1, host_delay=0), ["https://a.com/"])
+        
+    error = results[0].error
+    assert isinstance(error, ScraperError)
+    assert isinstance(error.__cause__, KeyError)
+    assert "KeyError" in str(error)
+    assert any(record.exc_info for record in caplog.records)
+
+
+def test_urls_submitted_during_iteration_are_fetched():
+    with FetchScheduler(lambda url: url, concurrency=2, host_delay=0) as scheduler:
+        scheduler.submit("https://a.com/")
+        seen = []
+        for result in scheduler.as_completed():
+            seen.append(result.url)
+            if result.url == "https://a.com/":
+                scheduler.submit("https://a.com/next")
+                
+    assert seen == ["https://a.com/", "https://a.com/next"]
+
+
+def test_close_drops_queued_tasks(caplog):
+    fetch = Recorder(duration=0)
+    
+    with caplog.at_level(logging.INFO, logger="scrapers.scheduler"):
+        with FetchScheduler(fetch, concurrency=1, host_concurrency=1, host_delay=10) as scheduler:
+            for n in range(3):
+                scheduler.submit(f"https://a.com/{n}")
+            first = next(scheduler.as_completed())
+            
+    assert first.value is not None
+    assert len(fetch.started["a.com"]) == 1
+    assert "отменено загрузок из очереди: 2" in caplog.text
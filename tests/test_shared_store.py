@@ -0,0 +1,92 @@
+"""
+Тесты общего хранилища результатов веб-анализа.
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.models import AnalysisResult, Recommendation
+from core.shared_store import SharedResultStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SharedResultStore(str(tmp_path / "results.sqlite3"))
+
+
+def make_results(title: str = "Усилить оффер"):
+    return [AnalysisResult(
+        module_name="Маркетолог",
+        module_description="Описание",
+        url="https://example.com/",
+        recommendations=[Recommendation(number=1, title=title, description="Выгода в заголовке.")]
+    )]
+
+
+def test_put_and_get_round_trip(store):
+    result_id = store.put("https://example.com/", "all", make_results("Оффер"))
+    
+    stored = store.get(result_id)
+    assert stored.id == result_id
+    assert (stored.url, stored.role) == ("https://example.com/", "all")
+    assert stored.results[0].recommendations[0].title == "Оффер"
+    assert store.get("missing") is None
+
+
+def test_find_recent_matches_url_role_and_age(store):
+    store.put("https://example.com/", "all", make_results("Старый"))
+    time.sleep(0.01)
+    latest = store.put("https://example.com/", "all", make_results("Новый"))
+    store.put("https://example.com/", "ui", make_results("Другая роль"))
+    
+    assert store.find_recent("https://example.com/", "all", max_age=60).id == latest
+    assert store.find_recent("https://example.org/", "all", max_age=60) is None
+    assert store.find_recent("https://example.com/", "all", max_age=0) is None
+    
+    time.sleep(0.05)
+    assert store.find_recent("https://example.com/", "all", max_age=0.01) is None
+
+
+def test_delete_older_than(store):
+    store.put("https://example.com/", "all", make_results())
+    time.sleep(0.05)
+    fresh = store.put("https://example.com/", "ui", make_results())
+    
+    assert store.delete_older_than(0.02) == 1
+    assert store.delete_older_than(0) == 0
+    assert store.find_recent("https://example.com/", "ui", max_age=60).id == fresh
+
+
+def test_second_store_on_same_file_sees_results(store):
+    # Как другой воркер: отдельный объект и отдельные соединения
+    result_id = store.put("https://example.com/", "all", make_results())
+    
+    assert SharedResultStore(str(store.path)).get(result_id) is not None
+
+
+def test_threads_use_own_connections(store):
+    ids = []
+    lock = threading.Lock()
+    
+    def work():
+        result_id = store.put("https://example.com/", "all", make_results())
+        with lock:
+            ids.append(result_id)
+            
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+        
+    assert len(set(ids)) == 8
+    assert all(store.get(result_id) is not None for result_id in ids)
+
+
+def test_unreadable_payload_is_skipped(store):
+    result_id = store.put("https://example.com/", "all", make_results())
+    store._connection().execute("UPDATE results SET payload = '[{' WHERE id = ?", (result_id,))
+    
+    assert store.get(result_id) is None
@@ -0,0 +1,84 @@
+"""
+Тесты разбора SPA-каркасов: текст и структура восстанавливаются
+из снимка, <noscript> или встроенного состояния, а локальные проверки
+не судят о странице по пустой заготовке.
+"""
+
+import json
+
+from analyzers.rules import RulesAnalyzer
+from core.config import settings
+from scrapers.html_parser import HTMLParser
+
+
+PARAGRAPH = "Сервис доставки готовой еды на неделю с выгодой для всей семьи. " * 5
+
+HEAD = "<head><title>Доставка</title><meta name='description' content='Еда на неделю'></head>"
+
+
+def next_shell() -> str:
+    state = {"props": {"pageProps": {"hero": "Готовая еда на неделю", "about": PARAGRAPH}}}
+    return (
+        f"<html>{HEAD}<body><div id='__next'></div>"
+        f"<script id='__NEXT_DATA__' type='application/json'>{json.dumps(state, ensure_ascii=False)}</script>"
+        "</body></html>"
+    )
+
+
+def noscript_shell() -> str:
+    return (
+        f"<html>{HEAD}<body><div id='root'></div><noscript>"
+        f"<h1>Готовая еда на неделю</h1><p>{PARAGRAPH}</p>"
+        "<a class='btn-primary' href='/order'>Заказать</a>"
+        "</noscript></body></html>"
+    )
+
+
+def finding_titles(content) -> list:
+    return [rec.title for rec in RulesAnalyzer().analyze(content).recommendations]
+
+
+def test_plain_shell_is_reported_as_empty():
+    content = HTMLParser().parse(f"<html>{HEAD}<body><div id='root'></div></body></html>", url="https://example.com/")
+    
+    assert content.is_empty_shell
+    assert content.structure.markup_known
+
+
+def test_embedded_state_marks_markup_unknown():
+    content = HTMLParser().parse(next_shell(), url="https://example.com/")
+    
+    assert content.text_source == "next_data"
+    assert not content.is_empty_shell
+    assert not content.structure.markup_known
+    assert content.structure.meta_description == "Еда на неделю"
+    assert content.structure.word_count > 0
+    
+    titles = finding_titles(content)
+    assert "Добавить главный заголовок H1" not in titles
+    assert "Добавить призыв к действию" not in titles
+
+
+def test_noscript_structure_is_taken_from_its_markup():
+    content = HTMLParser().parse(noscript_shell(), url="https://example.com/")
+    
+    assert content.text_source == "noscript"
+    assert content.structure.markup_known
+    assert content.structure.h1_count == 1
+    assert content.structure.cta_count == 1
+    assert content.structure.meta_description == "Еда на неделю"
+    assert "Добавить главный заголовок H1" not in finding_titles(content)
+
+
+def test_snapshot_structure_comes_from_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "prerender_snapshot_dir", str(tmp_path))
+    (tmp_path / "example.com_promo.html").write_text(
+        f"<html>{HEAD}<body><h1>Акция</h1><p>{PARAGRAPH}</p><button>Купить</button></body></html>",
+        encoding="utf-8"
+    )
+    
+    content = HTMLParser().parse(next_shell(), url="https://example.com/promo")
+    
+    assert content.text_source == "snapshot"
+    assert content.structure.h1_count == 1
+    assert content.structure.cta_count == 1
@@ -0,0 +1,91 @@
+"""
+Тесты потоковой записи отчётов: атомарная публикация, дозапись
+построчных форматов и адресация по содержимому.
+"""
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from core.config import settings
+from core.models import AnalysisResult, Recommendation
+from outputs.file_output import get_file_output
+from outputs.stream_writer import TEMP_SUFFIX, StreamWriter
+
+
+@pytest.fixture
+def results():
+    """Результаты двух модулей с фиксированным временем анализа."""
+    analyzed_at = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        AnalysisResult(
+            module_name=name,
+            module_description="Описание",
+            url="https://example.com/",
+            recommendations=[Recommendation(number=1, title="Усилить оффер", description="Выгода в заголовке.")],
+            analyzed_at=analyzed_at
+        )
+        for name in ("Маркетолог", "UX-дизайнер")
+    ]
+
+
+@pytest.fixture
+def content_addressed(monkeypatch):
+    monkeypatch.setattr(settings, "output_content_addressed", True)
+
+
+def test_report_appears_only_after_close(tmp_path):
+    path = tmp_path / "report.txt"
+    writer = StreamWriter(path, fsync_every=0)
+    writer.write("строка\n")
+    writer.end_record()
+    
+    assert not path.exists()
+    assert [p.name.endswith(TEMP_SUFFIX) for p in tmp_path.iterdir()] == [True]
+    
+    writer.close()
+    assert path.read_text(encoding="utf-8") == "строка\n"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_append_writers_add_whole_records(tmp_path):
+    path = tmp_path / "batch.ndjson"
+    for index in range(2):
+        with StreamWriter(path, append=True, fsync_every=1) as writer:
+            assert writer.is_new == (index == 0)
+            writer.write(json.dumps({"index": index}))
+            writer.write("\n")
+            writer.end_record()
+            
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["index"] for line in lines] == [0, 1]
+
+
+@pytest.mark.parametrize("fmt", ["txt", "md", "json"])
+def test_same_report_is_stored_once(tmp_path, results, content_addressed, fmt):
+    output = get_file_output(fmt, str(tmp_path))
+    
+    first = output.output_full(results)
+    time.sleep(1.1)  # Дата в заголовке не должна зависеть от времени сохранения
+    second = output.output_full(results)
+    
+    assert first == second
+    assert len(list(tmp_path.iterdir())) == 1
+    if fmt != "json":
+        assert "01.01.2026 12:00:00" in open(first, encoding="utf-8").read()
+
+
+def test_streamed_header_date_is_not_hashed(tmp_path, results, content_addressed):
+    output = get_file_output("txt", str(tmp_path))
+    paths = []
+    for _ in range(2):
+        with output.open_stream(url=results[0].url) as stream:
+            for result in results:
+                stream.write(result)
+        paths.append(stream.path)
+        time.sleep(1.1)
+        
+    assert paths[0] == paths[1]
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,76 @@
+"""
+Тесты оценки токенов и обрезки текста по границам блоков и предложений.
+"""
+
+import random
+
+from core.tokens import TRUNCATION_MARK, estimate_tokens, truncate, truncate_to_tokens
+
+
+TEXT = (
+    "Курсы английского онлайн\n"
+    "Занятия с преподавателем 3 раза в неделю. Первый урок бесплатно. Группы до 6 человек.\n"
+    "Записаться на пробный урок"
+)
+
+
+def test_estimate_by_script():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("а" * 32) == 10
+    assert estimate_tokens("a" * 8) == 2
+    assert estimate_tokens("12345678") == 4
+    assert estimate_tokens("!?") == 2
+    # Пробелы не добавляют токенов
+    assert estimate_tokens("слово слово") == estimate_tokens("словослово")
+
+
+def test_text_within_limit_is_unchanged():
+    assert truncate(TEXT, len(TEXT), measure=len) == TEXT
+    assert truncate_to_tokens(TEXT, estimate_tokens(TEXT)) == TEXT
+
+
+def test_whole_blocks_are_kept_first():
+    limit = len("Курсы английского онлайн") + len(TRUNCATION_MARK) + 5
+    
+    assert truncate(TEXT, limit, measure=len) == "Курсы английского онлайн" + TRUNCATION_MARK
+
+
+def test_partial_block_is_cut_at_sentence_end():
+    head = "Курсы английского онлайн\nЗанятия с преподавателем 3 раза в неделю. Первый урок бесплатно."
+    
+    result = truncate(TEXT, len(head) + len(TRUNCATION_MARK) + 3, measure=len)
+    
+    assert result == head + TRUNCATION_MARK
+
+
+def test_single_long_sentence_is_cut_at_word_boundary():
+    text = "Очень длинное предложение без точки до самого конца строки"
+    
+    result = truncate(text, 25, measure=len)
+    
+    assert result.endswith(TRUNCATION_MARK)
+    assert text.startswith(result[:-len(TRUNCATION_MARK)])
+    assert result[:-len(TRUNCATION_MARK)].split(" ")[-1] in text.split(" ")
+
+
+def test_limit_below_mark_cost_gives_empty_text():
+    assert truncate("Очень длинный текст", len(TRUNCATION_MARK) - 1, measure=len) == ""
+    assert truncate(TEXT, 0, measure=len) == ""
+    assert truncate_to_tokens(TEXT, estimate_tokens(TRUNCATION_MARK) - 1) == ""
+
+
+def test_result_never_exceeds_limit_or_breaks_words():
+    rng = random.Random(7)
+    words = ["оффер", "кнопка", "CTA", "2026", "форма.", "отзывы!", "тариф?", "доставка"]
+    for _ in range(200):
+        text = "\n".join(
+            " ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+            for _ in range(rng.randint(1, 6))
+        )
+        limit = rng.randint(0, 80)
+        
+        result = truncate_to_tokens(text, limit)
+        
+        assert estimate_tokens(result) <= limit
+        body = result[:-len(TRUNCATION_MARK)] if result != text else result
+        assert all(word in words for word in body.split())
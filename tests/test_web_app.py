@@ -0,0 +1,157 @@
+"""
+Тесты веб-приложения: анализ не блокирует event loop воркера,
+готовность зависит от прогрева, а не от LLM.
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+import web.app as web_app
+from core.health import UNKNOWN, HealthStatus
+from core.shared_store import SharedResultStore
+
+
+class StubMonitor:
+    """Монитор LLM с заданным результатом проверки."""
+    
+    def __init__(self, status: HealthStatus):
+        self._status = status
+    
+    def status(self) -> HealthStatus:
+        return self._status
+
+
+def get_ready():
+    async def scenario():
+        transport = httpx.ASGITransport(app=web_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/health/ready")
+            
+    return asyncio.run(scenario())
+
+
+def test_health_answers_while_analysis_runs(monkeypatch, tmp_path, page):
+    started = threading.Event()
+    release = threading.Event()
+    
+    def blocking_analyzers(content, role, llm_provider):
+        # Как вызов LLM: блокирует поток до ответа
+        started.set()
+        assert release.wait(timeout=10)
+        return []
+    
+    async def fetch_and_parse(self, url):
+        return page
+        
+    monkeypatch.setattr(web_app, "shared_store", SharedResultStore(str(tmp_path / "results.sqlite3")))
+    monkeypatch.setattr(web_app, "run_analyzers", blocking_analyzers)
+    monkeypatch.setattr(web_app.AsyncHTMLParser, "fetch_and_parse", fetch_and_parse)
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=web_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            analysis = asyncio.create_task(
+                client.post("/analyze", data={"url": "https://example.com/", "role": "instant"})
+            )
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+                
+            health = await asyncio.wait_for(client.get("/health/live"), timeout=2)
+            assert health.status_code == 200
+            assert not analysis.done()
+            
+            release.set()
+            response = await asyncio.wait_for(analysis, timeout=5)
+            assert response.status_code == 200
+            
+    asyncio.run(scenario())
+
+
+def test_repeated_request_is_marked_cached_and_force_reanalyzes(monkeypatch, tmp_path, page):
+    calls = []
+    
+    def analyzers(content, role, llm_provider):
+        calls.append(role)
+        return []
+    
+    async def fetch_and_parse(self, url):
+        return page
+        
+    monkeypatch.setattr(web_app.settings, "web_result_ttl", 300)
+    monkeypatch.setattr(web_app, "shared_store", SharedResultStore(str(tmp_path / "results.sqlite3")))
+    monkeypatch.setattr(web_app, "run_analyzers", analyzers)
+    monkeypatch.setattr(web_app.AsyncHTMLParser, "fetch_and_parse", fetch_and_parse)
+    form = {"url": "https://example.com/", "role": "instant"}
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=web_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.post("/analyze", data=form)
+            second = await client.post("/analyze", data=form)
+            forced = await client.post("/analyze", data={**form, "force": "true"})
+        return first, second, forced
+        
+    first, second, forced = asyncio.run(scenario())
+    
+    assert first.headers["X-Result-Cached"] == "false"
+    assert second.headers["X-Result-Cached"] == "true"
+    assert "Проанализировать заново" in second.text
+    assert forced.headers["X-Result-Cached"] == "false"
+    assert calls == ["instant", "instant"]
+
+
+def test_ready_is_unavailable_while_warming_up(monkeypatch):
+    monkeypatch.setattr(web_app, "_warmup_done", False)
+    
+    response = get_ready()
+    
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming_up"
+
+
+def test_ready_is_unavailable_after_failed_warm_up(monkeypatch):
+    monkeypatch.setattr(web_app, "_warmup_done", False)
+    monkeypatch.setattr(web_app, "_warmup_error", "шаблоны не скомпилированы")
+    
+    response = get_ready()
+    
+    assert response.status_code == 503
+    assert response.json()["status"] == "failed"
+
+
+@pytest.mark.parametrize("health, status", [
+    (UNKNOWN, "ok"),
+    (HealthStatus(ok=True, source="probe"), "ok"),
+    (HealthStatus(ok=False, source="probe"), "degraded"),
+])
+def test_ready_reports_llm_state_without_failing(monkeypatch, health, status):
+    monkeypatch.setattr(web_app, "_warmup_done", True)
+    monkeypatch.setattr(web_app, "_health_monitor", StubMonitor(health))
+    
+    response = get_ready()
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == status
+    assert response.json()["llm"]["ok"] is health.ok
+
+
+def test_download_renders_stored_results(monkeypatch, tmp_path):
+    store = SharedResultStore(str(tmp_path / "results.sqlite3"))
+    result_id = store.put("https://example.com/", "instant", [])
+    monkeypatch.setattr(web_app, "shared_store", store)
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=web_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            found = await client.post("/download", data={"result_id": result_id, "format": "json"})
+            missing = await client.post("/download", data={"result_id": "missing", "format": "json"})
+        return found, missing
+        
+    found, missing = asyncio.run(scenario())
+    
+    assert found.status_code == 200
+    assert "example.com" in found.headers["Content-Disposition"]
+    assert missing.status_code == 404
@@ -2,37 +2,181 @@
 FastAPI веб-приложение для Landing Redesign Assistant.
 """
 
+import asyncio
 import logging
+import threading
+import time
+from contextlib import asynccontextmanager, suppress
 from typing import List, Optional
 
 from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from jinja2 import Environment, FileSystemLoader
 from pydantic import HttpUrl
 import os
+from urllib.parse import quote
 
+from core.archive import page_scope
 from core.config import settings
 from core.exceptions import ScraperError, LLMError
-from core.models import AnalysisResult
+from core.health import HealthMonitor
+from core.interfaces import BaseLLMProvider
+from core.models import AnalysisResult, PageContent
+from core.registry import get_analyzer, get_analyzers, needs_llm, role_choices, role_keys
+from core.result_store import ResultStore
+from core.shared_store import SharedResultStore
 from core.utils import validate_url
 
-from scrapers.html_parser import HTMLParser
-from llm_providers.gigachat_provider import GigaChatProvider
-from analyzers.ui_designer import UIDesignerAnalyzer
-from analyzers.content_manager import ContentManagerAnalyzer
-from outputs.txt_output import TxtOutput
+from scrapers.async_html_parser import AsyncHTMLParser, close_async_client, get_async_client
+from scrapers.parse_pool import close_parse_pool, get_parse_pool
+from scrapers.session_pool import close_session_pool
+from llm_providers.factory import create_llm_provider
+from outputs import FILE_FORMATS
+from outputs.file_output import get_file_output
+from outputs.retention import OutputRetention, RetentionSweeper
 
 
 # Настройка логирования
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Фоновая проверка LLM; None, если провайдер не настроен
+_health_monitor: Optional[HealthMonitor] = None
+
+# Фоновая очистка директории отчётов и устаревших результатов
+_sweeper: Optional[RetentionSweeper] = None
+
+# Пока прогрев не завершён, /health/ready отвечает 503
+_warmup_done = False
+
+# Ошибка прогрева: процесс не может обслуживать анализ, /health/ready отвечает 503
+_warmup_error: Optional[str] = None
+
+# Страница для прогрева парсера: загружает lxml и проходит все этапы разбора
+WARMUP_HTML = (
+    "<html><head><title>Прогрев</title><meta name='description' content='Прогрев'></head>"
+    "<body><header><nav><a href='/'>Главная</a></nav></header>"
+    "<section><h1>Заголовок</h1><p>Текст блока.</p><button>Оставить заявку</button></section>"
+    "<form><input name='phone'></form><img src='a.png' alt=''></body></html>"
+)
+
+
+def _prepare() -> Optional[BaseLLMProvider]:
+    """
+    Синхронная часть запуска, выполняется в отдельном потоке.
+    
+    Создаёт LLM-провайдер, а при включённом прогреве импортирует модули
+    анализа, разбирает тестовую страницу, компилирует шаблоны и получает
+    токен LLM.
+    
+    Returns:
+        LLM-провайдер или None, если он не настроен
+    """
+    try:
+        provider = get_llm_provider()
+    except LLMError as e:
+        logger.warning(f"LLM не настроен, доступны только локальные проверки: {e}")
+        provider = None
+        
+    if not settings.warmup_enabled:
+        return provider
+        
+    for info in get_analyzers().values():
+        info.load()
+    AsyncHTMLParser().parse(WARMUP_HTML, url="https://example.com/")
+    for name in env.list_templates():
+        env.get_template(name)
+        
+    if provider is not None:
+        try:
+            provider.warm_up()
+        except Exception as e:
+            logger.warning(f"LLM-провайдер не прогрет: {e}")
+    return provider
+
+
+async def _start_parse_pool() -> None:
+    """Запустить процессы пула разбора и загрузить в них парсер."""
+    pool = get_parse_pool()
+    if pool is None:
+        return
+    await asyncio.gather(
+        *(pool.parse(WARMUP_HTML, url="https://example.com/") for _ in range(pool.size)),
+        return_exceptions=True
+    )
+
+
+async def _open_connections() -> None:
+    """Создать пул соединений парсера и открыть соединения с адресами из WARMUP_URLS."""
+    get_async_client()
+    urls = [url.strip() for url in settings.warmup_urls.split(",") if url.strip()]
+    if not urls:
+        return
+        
+    scraper = AsyncHTMLParser()
+    results = await asyncio.gather(*(scraper.fetch(url) for url in urls), return_exceptions=True)
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Прогрев {url} не удался: {result}")
+
+
+async def warm_up() -> None:
+    """Прогреть приложение и запустить фоновую проверку LLM."""
+    global _health_monitor, _warmup_done, _warmup_error
+    started = time.monotonic()
+    
+    try:
+        provider = await asyncio.to_thread(_prepare)
+        if settings.warmup_enabled:
+            await _start_parse_pool()
+            await _open_connections()
+            logger.info(f"Прогрев завершён за {time.monotonic() - started:.1f} сек")
+    except Exception as e:
+        logger.exception("Прогрев завершился ошибкой")
+        _warmup_error = str(e) or type(e).__name__
+        return
+        
+        
+    if provider is not None:
+        _health_monitor = HealthMonitor(provider)
+        _health_monitor.start()
+    _warmup_done = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Жизненный цикл приложения: прогрев в фоне, освобождение ресурсов при остановке."""
+    global _health_monitor, _sweeper, _warmup_done, _warmup_error
+    # Прогрев идёт в фоне: сервер сразу отвечает на /health/live
+    warmup_task = asyncio.create_task(warm_up())
+    _sweeper = RetentionSweeper([OutputRetention().sweep, shared_store.delete_older_than])
+    _sweeper.start()
+        
+    yield
+    
+    warmup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup_task
+    _warmup_done = False
+    _warmup_error = None
+    _sweeper.stop()
+    _sweeper = None
+    if _health_monitor is not None:
+        _health_monitor.stop()
+        _health_monitor = None
+    await close_async_client()
+    close_session_pool()
+    close_parse_pool()
+
+
 # Инициализация FastAPI
 app = FastAPI(
     title="Landing Redesign Assistant",
     description="AI-агент для анализа лендингов",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Статические файлы и шаблоны
@@ -49,28 +193,137 @@ def render_template(template_name: str, context: dict, request: Request):
     context["request"] = request
     return HTMLResponse(content=template.render(context))
 
-# Доступные модули анализа
-ANALYZERS = {
-    "ui": {
-        "class": UIDesignerAnalyzer,
-        "name": "UI-дизайнер",
-        "description": "Анализ дизайна и структуры",
-        "premium": False
-    },
-    "content": {
-        "class": ContentManagerAnalyzer,
-        "name": "Контент-менеджер",
-        "description": "Анализ текстов и копирайтинга",
-        "premium": False
+# Результаты анализа, общие для всех воркеров веб-сервера
+shared_store = SharedResultStore()
+
+# Общий LLM-провайдер процесса: создаётся при первом запросе с LLM
+_llm_provider: Optional[BaseLLMProvider] = None
+_llm_provider_lock = threading.Lock()
+
+
+def get_llm_provider() -> BaseLLMProvider:
+    """
+    Получить общий LLM-провайдер.
+    
+    Один провайдер на процесс переиспользует клиент и токен доступа,
+    накапливает статистику маршрутизации, а реестр кэширует
+    анализаторы для этого провайдера.
+    
+    Returns:
+        Провайдер или маршрутизатор над несколькими провайдерами
+        
+    Raises:
+        LLMError: Если провайдер не настроен
+    """
+    global _llm_provider
+    # Вызывается из потоков (прогрев, анализ): провайдер создаётся один раз
+    with _llm_provider_lock:
+        if _llm_provider is None:
+            _llm_provider = create_llm_provider()
+    return _llm_provider
+
+
+def run_analyzers(
+    content: PageContent,
+    role: str,
+    llm_provider: Optional[BaseLLMProvider]
+) -> List[AnalysisResult]:
+    """
+    Проанализировать контент выбранными модулями.
+    
+    Модули выбирает реестр (role_keys); находки модулей-префильтров
+    передаются в промпт LLM. При включённом инкрементальном анализе рекомендации по неизменённым
+    секциям берутся из предыдущего результата.
+    
+    Args:
+        content: Контент страницы
+        role: Ключ модуля из реестра или 'all'
+        llm_provider: LLM-провайдер (не нужен модулям без LLM)
+    
+    Returns:
+        Список результатов анализа
+    """
+    analyzers = get_analyzers()
+    results = []
+    known_issues = []
+    store = ResultStore() if settings.incremental_analysis else None
+    
+    # Набор модулей определяет реестр: сначала модули без LLM,
+    # диалоги с LLM записываются в архив с URL страницы
+    with page_scope(content.url):
+        for key in role_keys(role):
+            info = analyzers[key]
+            analyzer = get_analyzer(key, llm_provider)
+            if not info.requires_llm:
+                result = analyzer.analyze(content)
+                if info.prefilter and settings.rules_prefilter:
+                    known_issues.extend(result.recommendations)
+            elif store is not None:
+                result = analyzer.analyze_incremental(
+                    content,
+                    store.get(content.url, analyzer.name),
+                    known_issues=known_issues or None,
+                    max_change_ratio=settings.incremental_max_change_ratio
+                )
+                store.put(result)
+            else:
+                result = analyzer.analyze(content, known_issues=known_issues or None)
+            results.append(result)
+    
+    return results
+
+
+@app.get("/health/live")
+async def health_live():
+    """Liveness: процесс отвечает на запросы."""
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def health_ready():
+    """
+    Readiness: можно принимать запросы на анализ.
+    
+    503 отдаётся только во время прогрева и если прогрев завершился
+    ошибкой. Состояние LLM (кэшированный результат фоновой проверки)
+    передаётся в теле ответа и на код не влияет: без LLM доступны
+    локальные проверки, а ответа провайдера эндпоинт никогда не ждёт.
+    """
+    if _warmup_error is not None:
+        return JSONResponse(status_code=503, content={"status": "failed", "error": _warmup_error, "llm": None})
+    if not _warmup_done:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "llm": None})
+    if _health_monitor is None:
+        return {"status": "ok", "llm": None}
+    health = _health_monitor.status()
+    return {"status": "degraded" if health.ok is False else "ok", "llm": health.to_dict()}
+
+
+@app.get("/metrics")
+async def metrics_view():
+    """
+    Счётчики событий воркера (например, загрузки, подавленные кэшем ошибок).
+    
+    Счётчики свои у каждого воркера и обнуляются при его перезапуске.
+    """
+    from core import metrics
+    from scrapers.negative_cache import get_negative_cache
+    
+    negative_cache = get_negative_cache()
+    return {
+        "pid": os.getpid(),
+        "counters": metrics.snapshot(),
+        "negative_cache_entries": len(negative_cache) if negative_cache is not None else None
     }
-}
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Главная страница с формой анализа."""
+    analyzers = list(get_analyzers().values())
     return render_template("index.html", {
-        "analyzers": ANALYZERS
+        "llm_analyzers": [info for info in analyzers if info.requires_llm],
+        "local_analyzers": [info for info in analyzers if not info.requires_llm]
     }, request)
 
 
@@ -78,15 +331,21 @@ async def index(request: Request):
 async def analyze(
     request: Request,
     url: str = Form(...),
-    role: str = Form(...)
+    role: str = Form(...),
+    force: bool = Form(False)
 ):
     """
     Обработка запроса на анализ лендинга.
     
+    Свежий результат такого же запроса (моложе web_result_ttl) берётся
+    из хранилища; страница результатов и заголовок X-Result-Cached
+    сообщают об этом.
+    
     Args:
         request: FastAPI Request
         url: URL для анализа
-        role: Роль ('ui', 'content' или 'all')
+        role: Роль ('ui', 'content', 'all' или 'instant')
+        force: Выполнить анализ заново, не используя сохранённый результат
     """
     try:
         # Валидация URL
@@ -97,44 +356,51 @@ async def analyze(
             raise HTTPException(status_code=400, detail="Некорректный URL")
         
         # Валидация роли
-        if role not in ["ui", "content", "all"]:
+        if role not in role_choices():
             raise HTTPException(status_code=400, detail="Некорректная роль")
         
         logger.info(f"Анализ запрошен: {url}, роль: {role}")
         
-        # Инициализация LLM-провайдера
-        try:
-            llm_provider = GigaChatProvider()
-        except LLMError as e:
-            logger.error(f"Ошибка GigaChat: {e}")
-            return render_template("error.html", {
-                "error": f"Ошибка настройки GigaChat: {e}"
-            }, request)
-        
-        # Загрузка страницы
-        scraper = HTMLParser()
-        content = scraper.fetch_and_parse(url)
-        
-        # Определение модулей анализа
-        if role == "all":
-            analyzer_keys = ["ui", "content"]
+        # Тот же запрос недавно обработан (возможно, другим воркером).
+        # Хранилище, получение токена и анализ (вызовы LLM) блокируют
+        # поток, поэтому выполняются вне event loop: /health и другие
+        # запросы воркера не ждут окончания анализа
+        stored = None if force else await asyncio.to_thread(shared_store.find_recent, url, role)
+        if stored is not None:
+            logger.info(f"Результат взят из хранилища: {stored.id}")
+            results, result_id = stored.results, stored.id
         else:
-            analyzer_keys = [role]
-        
-        # Анализ
-        results = []
-        for key in analyzer_keys:
-            analyzer_info = ANALYZERS[key]
-            analyzer = analyzer_info["class"](llm_provider)
-            result = analyzer.analyze(content)
-            results.append(result)
+            # Инициализация LLM-провайдера (экспресс-проверке он не нужен)
+            llm_provider = None
+            if needs_llm(role):
+                try:
+                    llm_provider = await asyncio.to_thread(get_llm_provider)
+                except LLMError as e:
+                    logger.error(f"Ошибка GigaChat: {e}")
+                    return render_template("error.html", {
+                        "error": f"Ошибка настройки GigaChat: {e}"
+                    }, request)
+        
+            # Загрузка страницы
+            scraper = AsyncHTMLParser()
+            content = await scraper.fetch_and_parse(url)
+        
+            # Анализ
+            results = await asyncio.to_thread(run_analyzers, content, role, llm_provider)
+            result_id = await asyncio.to_thread(shared_store.put, url, role, results)
         
         # Отображение результатов
-        return render_template("results.html", {
+        response = render_template("results.html", {
             "url": url,
+            "role": role,
+            "result_id": result_id,
             "results": results,
-            "total_recommendations": sum(len(r.recommendations) for r in results)
+            "total_recommendations": sum(len(r.recommendations) for r in results),
+            "cached": stored is not None,
+            "cached_age": int(time.time() - stored.created_at) if stored is not None else 0
         }, request)
+        response.headers["X-Result-Cached"] = "true" if stored is not None else "false"
+        return response
         
     except ScraperError as e:
         logger.error(f"Ошибка парсинга: {e}")
@@ -150,53 +416,47 @@ async def analyze(
         }, request)
 
 
+# MIME-типы файлов отчёта
+MEDIA_TYPES = {
+    "txt": "text/plain; charset=utf-8",
+    "md": "text/markdown; charset=utf-8",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
 @app.post("/download")
-async def download_results(
-    url: str = Form(...),
-    role: str = Form(...)
-):
+async def download_results(result_id: str = Form(...), format: str = Form("txt")):
     """
-    Скачать результаты анализа в TXT-файле.
+    Скачать результаты анализа файлом.
+    
+    Результаты берутся из общего хранилища, отчёт формируется
+    в памяти: повторного анализа и записи на диск нет.
     
     Args:
-        url: URL анализируемой страницы
-        role: Роль анализа
+        result_id: Идентификатор результата со страницы результатов
+        format: Формат файла (txt, md, json, ndjson, csv)
     """
+    if format not in FILE_FORMATS:
+        raise HTTPException(status_code=400, detail="Некорректный формат")
+    stored = await asyncio.to_thread(shared_store.get, result_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail="Результат не найден, повторите анализ")
+    url = stored.url
+    
     try:
-        # Восстанавливаем результаты (в реальном приложении лучше хранить в сессии/БД)
-        # Для MVP - перезапрашиваем анализ
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-        
-        llm_provider = GigaChatProvider()
-        scraper = HTMLParser()
-        content = scraper.fetch_and_parse(url)
-        
-        if role == "all":
-            analyzer_keys = ["ui", "content"]
-        else:
-            analyzer_keys = [role]
-        
-        results = []
-        for key in analyzer_keys:
-            analyzer_info = ANALYZERS[key]
-            analyzer = analyzer_info["class"](llm_provider)
-            result = analyzer.analyze(content)
-            results.append(result)
-        
-        # Сохранение в файл
-        txt_output = TxtOutput(output_dir="output")
-        filepath = txt_output.output_full(results)
-        
-        return FileResponse(
-            filepath,
-            media_type="text/plain",
-            filename=f"analysis_{url.replace('https://', '').replace('http://', '').replace('/', '_')}.txt"
-        )
-        
+        content = await asyncio.to_thread(get_file_output(format).render, stored.results)
     except Exception as e:
-        logger.exception("Ошибка при создании файла")
+        logger.exception("Ошибка при формировании отчёта")
         raise HTTPException(status_code=500, detail=str(e))
+        
+    filename = f"analysis_{url.replace('https://', '').replace('http://', '').replace('/', '_')}.{format}"
+    return Response(
+        content=content.encode("utf-8"),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"}
+    )
 
 
 if __name__ == "__main__":